@@ -1,81 +1,161 @@
 """
 Animated sprite system for handling sprite sheet animations
+
+Frame data (SpriteSheet) is loaded once per sheet and shared; each animated
+thing only keeps a small AnimatedSprite with its frame index and timer.
 """
 import pygame
 
 
-class AnimatedSprite:
-    """Handles sprite sheet animations."""
-    
-    def __init__(self, sprite_sheet_path, frame_width, frame_height, num_frames, fps, layout='vertical'):
-        """
-        Initialize animated sprite.
-        
-        Args:
-            sprite_sheet_path: Path to the sprite sheet image
-            frame_width: Width of each frame in pixels
-            frame_height: Height of each frame in pixels
-            num_frames: Total number of frames in the animation
-            fps: Frames per second for the animation
-            layout: 'horizontal' or 'vertical' arrangement of frames
-        """
-        # Load the sprite sheet
-        try:
-            self.sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
-        except pygame.error as e:
-            print(f"Warning: Could not load sprite sheet at {sprite_sheet_path}: {e}")
-            # Create a fallback surface
-            self.sprite_sheet = pygame.Surface((frame_width, frame_height * num_frames))
-            self.sprite_sheet.fill((240, 240, 240))
-        
+# Rotations snap to 360 / ANGLE_BUCKETS degree steps and scales to
+# SCALE_STEP steps, so every instance reuses the same few cached surfaces
+ANGLE_BUCKETS = 32
+SCALE_STEP = 0.05
+_UNSCALED = round(1 / SCALE_STEP)
+
+
+class SpriteSheet:
+    """Frames sliced from one sprite sheet plus cached rotated/scaled variants."""
+
+    # Every loaded sheet, by (path, frame width, frame height, frame count, layout)
+    _sheets = {}
+
+    @classmethod
+    def get(cls, path, frame_width, frame_height, num_frames, layout='vertical'):
+        """The shared sheet for these parameters (loaded on first use)."""
+        key = (path, frame_width, frame_height, num_frames, layout)
+        sheet = cls._sheets.get(key)
+        if sheet is None:
+            sheet = cls._sheets[key] = cls(*key)
+        return sheet
+
+    @classmethod
+    def loaded_surfaces(cls):
+        """Every frame and variant rendered so far, across all sheets."""
+        surfaces = []
+        for sheet in cls._sheets.values():
+            surfaces.extend(sheet.frames)
+            surfaces.extend(sheet.variants.values())
+        return surfaces
+
+    def __init__(self, path, frame_width, frame_height, num_frames, layout='vertical'):
+        self.path = path
         self.frame_width = frame_width
         self.frame_height = frame_height
         self.num_frames = num_frames
-        self.fps = fps
         self.layout = layout
-        
-        # Animation state
-        self.current_frame = 0
-        self.animation_timer = 0
-        self.frame_duration = 1.0 / fps  # Time per frame in seconds
-        
-        # Extract individual frames from sprite sheet
+
         self.frames = self.load_frames()
-    
+        self.variants = {}  # (frame, angle bucket, scale bucket) -> Surface
+
+    def load_sprite_sheet(self):
+        """Load the sprite sheet image, or a plain fallback if it's missing."""
+        try:
+            image = pygame.image.load(self.path)
+            # The texture renderer has no display surface; its atlas converts
+            if pygame.display.get_surface() is None:
+                return image
+            return image.convert_alpha()
+        except pygame.error as e:
+            print(f"Warning: Could not load sprite sheet at {self.path}: {e}")
+            # Create a fallback surface
+            sprite_sheet = pygame.Surface((self.frame_width, self.frame_height * self.num_frames))
+            sprite_sheet.fill((240, 240, 240))
+            return sprite_sheet
+
     def load_frames(self):
         """Extract individual frames from the sprite sheet."""
+        sprite_sheet = self.load_sprite_sheet()
         frames = []
-        
+
         for i in range(self.num_frames):
             # Create a surface for this frame
             frame = pygame.Surface((self.frame_width, self.frame_height), pygame.SRCALPHA)
-            
+
             # Calculate source position based on layout
             if self.layout == 'vertical':
                 source_rect = pygame.Rect(0, i * self.frame_height, self.frame_width, self.frame_height)
             else:  # horizontal
                 source_rect = pygame.Rect(i * self.frame_width, 0, self.frame_width, self.frame_height)
-            
+
             # Blit (copy) the frame from sprite sheet
-            frame.blit(self.sprite_sheet, (0, 0), source_rect)
+            frame.blit(sprite_sheet, (0, 0), source_rect)
             frames.append(frame)
-        
+
         return frames
-    
+
+    def frame(self, index, angle=0, scale=1.0):
+        """A frame rotated by angle degrees (counter-clockwise) and scaled.
+
+        Variants are rendered the first time they're asked for and then
+        reused by every sprite on this sheet.
+        """
+        angle_bucket = round(angle * ANGLE_BUCKETS / 360) % ANGLE_BUCKETS
+        scale_bucket = max(1, round(scale / SCALE_STEP))
+        if angle_bucket == 0 and scale_bucket == _UNSCALED:
+            return self.frames[index]
+
+        key = (index, angle_bucket, scale_bucket)
+        surface = self.variants.get(key)
+        if surface is None:
+            surface = pygame.transform.rotozoom(self.frames[index],
+                                                angle_bucket * 360 / ANGLE_BUCKETS,
+                                                scale_bucket * SCALE_STEP)
+            self.variants[key] = surface
+        return surface
+
+    def prebake(self, angles=True, scales=(1.0,)):
+        """Render variants ahead of time (every angle bucket if angles is True)."""
+        angle_steps = range(ANGLE_BUCKETS) if angles else (0,)
+        for index in range(self.num_frames):
+            for step in angle_steps:
+                for scale in scales:
+                    self.frame(index, step * 360 / ANGLE_BUCKETS, scale)
+
+
+class AnimatedSprite:
+    """Playback state for one animated thing: a frame index and a timer."""
+    __slots__ = ('sheet', 'frame_duration', 'current_frame', 'animation_timer')
+
+    def __init__(self, sprite_sheet_path, frame_width, frame_height, num_frames, fps, layout='vertical'):
+        """
+        Initialize animated sprite.
+
+        Args:
+            sprite_sheet_path: Path to the sprite sheet image
+            frame_width: Width of each frame in pixels
+            frame_height: Height of each frame in pixels
+            num_frames: Total number of frames in the animation
+            fps: Frames per second for the animation
+            layout: 'horizontal' or 'vertical' arrangement of frames
+        """
+        # Frame surfaces are shared by every sprite using the same sheet
+        self.sheet = SpriteSheet.get(sprite_sheet_path, frame_width, frame_height,
+                                     num_frames, layout)
+
+        # Animation state
+        self.current_frame = 0
+        self.animation_timer = 0
+        self.frame_duration = 1.0 / fps  # Time per frame in seconds
+
+    @property
+    def frames(self):
+        return self.sheet.frames
+
     def update(self, dt):
         """Update animation frame based on time."""
         self.animation_timer += dt
-        
+
         # Move to next frame when enough time has passed
         if self.animation_timer >= self.frame_duration:
             self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % self.num_frames
-    
-    def get_current_frame(self):
-        """Get the current frame surface."""
-        return self.frames[self.current_frame]
-    
+            self.current_frame = (self.current_frame + 1) % self.sheet.num_frames
+
+    def get_current_frame(self, angle=0, scale=1.0):
+        """Get the current frame surface, optionally rotated and scaled."""
+        return self.sheet.frame(self.current_frame, angle, scale)
+
     def reset(self):
         """Reset animation to first frame."""
         self.current_frame = 0
-        self.animation_timer = 0
\ No newline at end of file
+        self.animation_timer = 0
@@ -0,0 +1,359 @@
+"""
+Balance runner - fans out seeded headless games across all cores
+
+Usage:
+    python src/balance.py --runs 2000 --policy weapons --out balance.cols
+
+Every run plays a full game with a kiting bot and a scripted upgrade
+policy, using a fixed timestep so results only depend on the seed.
+Per-run results are kept column by column, and each batch's columns are
+appended to the results file as it finishes. A summary of each metric
+and the survival curve for the whole sweep are written next to it as CSV.
+"""
+import os
+import sys
+import csv
+import math
+import time
+import random
+import struct
+import argparse
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Headless SDL drivers must be set before pygame is initialized
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config import *
+from main import Game
+
+
+RESULT_COLUMNS = ('seed', 'survival_time', 'kills', 'level', 'boss_kill_time', 'died')
+RESULTS_MAGIC = b'SZBR'
+SUMMARY_COLUMNS = ('metric', 'runs', 'mean', 'min', 'p10', 'p50', 'p90', 'max')
+
+_count = struct.Struct('<I')
+_name_length = struct.Struct('<B')
+
+
+class ResultColumns:
+    """Per-run results stored by metric, one array of doubles per column.
+
+    The file starts with the policy and the column names. Each batch of
+    runs is then appended as a block: its run count, then a block of
+    doubles per column, so a finished batch costs only its own bytes and
+    a metric can be read without touching the others. Runs where the
+    boss survived have NaN for boss_kill_time.
+    """
+
+    def __init__(self, policy, names=RESULT_COLUMNS):
+        self.policy = policy
+        self.columns = {name: array('d') for name in names}
+
+    def __len__(self):
+        return len(self.columns['seed'])
+
+    def append(self, row):
+        for name, column in self.columns.items():
+            column.append(row[name])
+
+    def start(self, path):
+        """Write the header of a new results file, with no runs yet."""
+        parts = [RESULTS_MAGIC, _pack_name(self.policy), _count.pack(len(self.columns))]
+        parts += [_pack_name(name) for name in self.columns]
+        with open(path, 'wb') as out_file:
+            out_file.write(b''.join(parts))
+
+    def append_batch(self, rows, path):
+        """Add a batch of runs, and append its block to a file made by start()."""
+        block = ResultColumns(self.policy, self.columns)
+        for row in rows:
+            self.append(row)
+            block.append(row)
+        parts = [_count.pack(len(block))]
+        parts += [column.tobytes() for column in block.columns.values()]
+        with open(path, 'ab') as out_file:
+            out_file.write(b''.join(parts))
+
+    @classmethod
+    def load(cls, path):
+        """Read a results file, joining its blocks.
+
+        A block cut short (the runner was stopped while writing it) is
+        left out.
+        """
+        with open(path, 'rb') as in_file:
+            data = memoryview(in_file.read())
+        if bytes(data[:4]) != RESULTS_MAGIC:
+            raise ValueError("Not a balance results file")
+        offset = 4
+        policy, offset = _unpack_name(data, offset)
+        count, = _count.unpack_from(data, offset)
+        offset += _count.size
+        names = []
+        for _ in range(count):
+            name, offset = _unpack_name(data, offset)
+            names.append(name)
+
+        results = cls(policy, names)
+        while offset + _count.size <= len(data):
+            rows, = _count.unpack_from(data, offset)
+            offset += _count.size
+            end = offset + rows * 8 * len(names)
+            if end > len(data):
+                break
+            for column in results.columns.values():
+                column.frombytes(data[offset:offset + rows * 8])
+                offset += rows * 8
+        return results
+
+    def summary(self):
+        """Per metric: runs with a value, then mean, min, p10, p50, p90 and max."""
+        rows = []
+        for name, column in self.columns.items():
+            if name == 'seed':
+                continue
+            values = sorted(value for value in column if not math.isnan(value))
+            if not values:
+                rows.append((name, 0) + ('',) * (len(SUMMARY_COLUMNS) - 2))
+                continue
+            last = len(values) - 1
+            rows.append((name, len(values), sum(values) / len(values), values[0],
+                         values[round(last * 0.1)], values[round(last * 0.5)],
+                         values[round(last * 0.9)], values[-1]))
+        return rows
+
+
+def _pack_name(name):
+    encoded = name.encode()
+    return _name_length.pack(len(encoded)) + encoded
+
+
+def _unpack_name(data, offset):
+    length, = _name_length.unpack_from(data, offset)
+    start = offset + _name_length.size
+    return bytes(data[start:start + length]).decode(), start + length
+
+
+# Upgrade policies: pick one of the offered upgrades
+def policy_random(options, game):
+    """Pick any offered upgrade."""
+    return random.choice(options)
+
+
+def policy_weapons(options, game):
+    """Always upgrade weapons first, then fall back to stats."""
+    for option in options:
+        if option['type'] == 'weapon_upgrade':
+            return option
+    return options[0]
+
+
+def policy_survival(options, game):
+    """Heal when hurt, otherwise prefer health and speed."""
+    player = game.player
+    order = ['max_health', 'speed', 'pickup_radius']
+    if player.health < player.max_health * 0.5:
+        order.insert(0, 'heal')
+
+    for stat in order:
+        for option in options:
+            if option.get('stat') == stat:
+                return option
+    return options[0]
+
+
+POLICIES = {
+    'random': policy_random,
+    'weapons': policy_weapons,
+    'survival': policy_survival,
+}
+
+
+class KeyState(defaultdict):
+    """Stands in for pygame.key.get_pressed() when a bot is driving."""
+
+    def __init__(self):
+        super().__init__(bool)
+
+
+class HeadlessGame(Game):
+    """A game driven by a kiting bot instead of the keyboard."""
+
+    def __init__(self):
+        super().__init__(audio=False)  # nobody is listening
+        self.policy = policy_random
+        self.threat_radius = 250
+
+    def get_keys(self):
+        """Steer away from nearby zombies and toward gems when safe."""
+        px, py = self.player.rect.center
+        push_x = 0
+        push_y = 0
+
+        for zombie in self.zombies:
+            dx = px - zombie.rect.centerx
+            dy = py - zombie.rect.centery
+            dist_sq = dx * dx + dy * dy
+            if 0 < dist_sq < self.threat_radius * self.threat_radius:
+                push_x += dx / dist_sq
+                push_y += dy / dist_sq
+
+        if self.boss and self.boss.alive:
+            dx = px - self.boss.rect.centerx
+            dy = py - self.boss.rect.centery
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > 0:
+                push_x += 3 * dx / dist_sq
+                push_y += 3 * dy / dist_sq
+
+        # No threat nearby: go collect the closest gem
+        if push_x == 0 and push_y == 0 and self.exp_gems:
+            gem = min(self.exp_gems,
+                      key=lambda g: (g.x - px) ** 2 + (g.y - py) ** 2)
+            push_x = gem.x - px
+            push_y = gem.y - py
+
+        # Stay away from the walls so we don't get cornered
+        push_x += (WIDTH / 2 - px) / (WIDTH * WIDTH)
+        push_y += (HEIGHT / 2 - py) / (HEIGHT * HEIGHT)
+
+        keys = KeyState()
+        length = math.hypot(push_x, push_y)
+        if length > 0:
+            push_x /= length
+            push_y /= length
+            keys[pygame.K_d] = push_x > 0.38
+            keys[pygame.K_a] = push_x < -0.38
+            keys[pygame.K_s] = push_y > 0.38
+            keys[pygame.K_w] = push_y < -0.38
+        return keys
+
+    def play(self, seed, policy, max_time, dt):
+        """Play one seeded run and return its result row."""
+        self.restart()
+        random.seed(seed)
+        self.policy = POLICIES[policy]
+        self.main_menu.active = False
+
+        while not self.game_over and self.game_time < max_time:
+            if self.upgrade_menu.active:
+                options = self.upgrade_menu.upgrade_options
+                if options:
+                    self.upgrade_menu.apply_upgrade(self.policy(options, self))
+                self.upgrade_menu.active = False
+            self.update(dt)
+
+        return {
+            'seed': seed,
+            'survival_time': round(self.game_time, 3),
+            'kills': self.kills,
+            'level': self.exp_system.level,
+            'boss_kill_time': (math.nan if self.boss_kill_time is None
+                               else round(self.boss_kill_time, 3)),
+            'died': int(self.game_over),
+        }
+
+
+# One game per worker process, reused for every run it plays
+_worker_game = None
+
+
+def _init_worker():
+    """Create the worker's game and silence its console output."""
+    global _worker_game
+    sys.stdout = open(os.devnull, 'w')
+    _worker_game = HeadlessGame()
+
+
+def _run_batch(seeds, policy, max_time, dt):
+    """Play a batch of seeds in this worker."""
+    return [_worker_game.play(seed, policy, max_time, dt) for seed in seeds]
+
+
+def survival_curve(results, max_time, step):
+    """Fraction of runs still alive at each time step."""
+    columns = results.columns
+    times = sorted(t for t, died in zip(columns['survival_time'], columns['died']) if died)
+    total = len(results)
+    curve = []
+    index = 0
+    t = 0.0
+    while t <= max_time:
+        while index < len(times) and times[index] <= t:
+            index += 1
+        curve.append((t, (total - index) / total if total else 0.0))
+        t += step
+    return curve
+
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balance runner")
+    parser.add_argument('--runs', type=positive_int, default=200)
+    parser.add_argument('--seed', type=int, default=0, help="first seed")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='weapons')
+    parser.add_argument('--max-time', type=float, default=300.0,
+                        help="stop a run after this many game seconds")
+    parser.add_argument('--dt', type=float, default=1.0 / FPS,
+                        help="fixed simulation timestep")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--batch', type=positive_int, default=8,
+                        help="runs sent to a worker at a time")
+    parser.add_argument('--curve-step', type=float, default=10.0)
+    parser.add_argument('--out', default='balance.cols')
+    args = parser.parse_args()
+
+    seeds = list(range(args.seed, args.seed + args.runs))
+    batches = [seeds[i:i + args.batch] for i in range(0, len(seeds), args.batch)]
+    results = ResultColumns(args.policy)
+    results.start(args.out)
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers,
+                             initializer=_init_worker) as pool:
+        futures = [pool.submit(_run_batch, batch, args.policy,
+                               args.max_time, args.dt)
+                   for batch in batches]
+        for future in as_completed(futures):
+            results.append_batch(future.result(), args.out)
+            print(f"\r{len(results)}/{args.runs} runs", end='', flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"\nFinished {len(results)} runs in {elapsed:.1f}s")
+
+    base = os.path.splitext(args.out)[0]
+    summary = results.summary()
+    with open(base + '_summary.csv', 'w', newline='') as summary_file:
+        writer = csv.writer(summary_file)
+        writer.writerow(SUMMARY_COLUMNS)
+        writer.writerows(summary)
+
+    curve = survival_curve(results, args.max_time, args.curve_step)
+    with open(base + '_survival.csv', 'w', newline='') as curve_file:
+        writer = csv.writer(curve_file)
+        writer.writerow(['time', 'alive_fraction'])
+        writer.writerows(curve)
+
+    stats = {row[0]: row for row in summary}
+    print(f"Mean survival: {stats['survival_time'][2]:.1f}s")
+    print(f"Mean kills:    {stats['kills'][2]:.1f}")
+    print(f"Mean level:    {stats['level'][2]:.1f}")
+    print(f"Boss killed:   {stats['boss_kill_time'][1]}/{len(results)} runs")
+    print("Survival curve:")
+    for t, alive in curve:
+        print(f"  {t:6.0f}s  {'#' * int(alive * 40):<40} {alive:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""
+Benchmarks for engine hot paths
+
+Usage:
+    python src/bench.py restart
+    python src/bench.py snapshot --entities 3000
+    python src/bench.py coop --clients 4 --entities 3000
+    python src/bench.py recycle --entities 3000
+    python src/bench.py worker
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+# Headless SDL drivers must be set before pygame is initialized
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config import *
+from balance import HeadlessGame
+from entities.bullet import Bullet
+from entities.exp_gem import ExpGem
+
+
+def populate(game, seconds, seed=0):
+    """Play a seeded run for a while so the entity stores fill up."""
+    random.seed(seed)
+    game.main_menu.active = False
+    while game.game_time < seconds and not game.game_over:
+        if game.upgrade_menu.active:
+            game.upgrade_menu.apply_upgrade(game.upgrade_menu.upgrade_options[0])
+            game.upgrade_menu.active = False
+        game.update(1.0 / FPS)
+
+
+def bench_restart(args):
+    """Time Game.restart() after a populated run."""
+    start = time.perf_counter()
+    game = HeadlessGame()
+    print(f"First launch:  {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    timings = []
+    for i in range(args.repeat):
+        populate(game, args.seconds, seed=i)
+        start = time.perf_counter()
+        game.restart()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    print(f"Restart:       {timings[len(timings) // 2]:8.3f} ms median, "
+          f"{timings[-1]:.3f} ms worst over {args.repeat} runs")
+
+    # A restart should be close to free compared to launching
+    if timings[-1] > args.limit_ms:
+        print(f"FAIL: restart took longer than {args.limit_ms} ms")
+        return 1
+    return 0
+
+
+def bench_snapshot(args):
+    """Time save_snapshot()/restore_snapshot() per thousand entities.
+
+    The limit is checked against the fastest of the repeats, which is the
+    cost of the code itself; the median (shown too) moves with machine load.
+    """
+    from systems.snapshot import save_snapshot, restore_snapshot
+
+    game = HeadlessGame()
+    populate(game, 10)
+
+    # Fill the stores up to the requested entity count
+    third = args.entities // 3
+    game.zombies.extend(game.spawner.spawn_batch(third))
+    game.bullets.extend(Bullet(random.uniform(0, WIDTH), random.uniform(0, HEIGHT),
+                               WIDTH / 2, HEIGHT / 2) for _ in range(third))
+    game.exp_gems.extend(ExpGem(random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+                         for _ in range(third))
+    entities = len(game.zombies) + len(game.bullets) + len(game.exp_gems)
+
+    save_times = []
+    restore_times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        data = save_snapshot(game)
+        save_times.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        restore_snapshot(game, data)
+        restore_times.append((time.perf_counter() - start) * 1000)
+
+    if save_snapshot(game) != data:
+        print("FAIL: snapshot did not survive a save/restore round trip")
+        return 1
+
+    def per_1000(times):
+        times = sorted(times)
+        return times[0] * 1000 / entities, times[len(times) // 2] * 1000 / entities
+
+    save_ms, save_median = per_1000(save_times)
+    restore_ms, restore_median = per_1000(restore_times)
+    print(f"Entities:      {entities} ({len(data) / 1024:.1f} KiB per snapshot)")
+    print(f"Save:          {save_ms:8.3f} ms per 1000 entities "
+          f"(median {save_median:.3f}, {args.repeat} runs)")
+    print(f"Restore:       {restore_ms:8.3f} ms per 1000 entities "
+          f"(median {restore_median:.3f})")
+
+    if max(save_ms, restore_ms) > args.limit_ms:
+        print(f"FAIL: over {args.limit_ms} ms per 1000 entities")
+        return 1
+    return 0
+
+
+def bench_recycle(args):
+    """Time pooled respawns, and check weapons let go of a zombie that is reused.
+
+    A missile target is killed while spawns are queued, so the director
+    respawns that same object in the same frame; the missile, a bullet
+    that last hit it and the disc's cooldown on it must all see a new zombie.
+    """
+    from entities.player import Player
+    from entities.zombie import Zombie
+    from systems.spawner import ZombieSpawner
+    from systems.spawn_director import SpawnDirector
+    from systems.spatial_grid import SpatialGrid
+    from systems.damage import DamageBuffer
+    from weapons.homing_missiles import HomingMissiles
+    from weapons.orbiting_disc import OrbitingDisc
+
+    random.seed(0)
+    player = Player((WIDTH // 2, HEIGHT // 2))
+    director = SpawnDirector(ZombieSpawner(WIDTH, HEIGHT))
+    grid = SpatialGrid()
+    hits = DamageBuffer()
+    missiles = HomingMissiles(player)
+    disc = OrbitingDisc(player)
+    px, py = player.rect.center
+    victim = Zombie(px + 150, py)
+    zombies = [victim, Zombie(px - 300, py)]
+    dt = 1.0 / FPS
+
+    grid.update(zombies)
+    missiles.shoot_timer = 1.0 / missiles.fire_rate  # fire a volley right away
+    missiles.update(dt, zombies, grid, hits)
+    locked = victim in missiles.targets
+    bullet = Bullet(px, py, victim.rect.centerx, victim.rect.centery)
+    bullet.register_hit(victim)
+    disc.hit_cooldown[(id(victim), victim.generation)] = disc.clock + 60
+
+    # Killed, recycled and let out again, as in one Game.update
+    hits.deal(victim, victim.health)
+    dead = hits.apply()
+    zombies[:] = [zombie for zombie in zombies if zombie.alive]
+    director.recycle(dead)
+    director.queue_edges(1)
+    director.update(zombies)
+    grid.update(zombies)
+    missiles.update(dt, zombies, grid, hits)
+
+    failures = []
+    if not locked:
+        failures.append("no missile locked on the zombie")
+    if not (victim.alive and victim in zombies):
+        failures.append("the dead zombie was not reused")
+    if any(target is not None and generation != target.generation
+           for target, generation in zip(missiles.targets, missiles.generations)):
+        failures.append("a missile is still locked on the zombie's last life")
+    if bullet.passing(victim):
+        failures.append("a bullet still counts the reused zombie as its last hit")
+    if disc.hit_cooldown.get((id(victim), victim.generation), 0) > disc.clock:
+        failures.append("the disc cooldown carried over to the reused zombie")
+
+    # Respawning from the pool against building new zombies
+    pooled = [Zombie(0, 0) for _ in range(args.entities)]
+    timings = []
+    for _ in range(args.repeat):
+        director.pool = list(pooled)
+        director.queue_edges(args.entities)
+        director.budget = args.entities
+        start = time.perf_counter()
+        director.update([])
+        timings.append((time.perf_counter() - start) * 1000)
+    per_1000 = min(timings) * 1000 / args.entities
+    print(f"Respawn:       {per_1000:8.3f} ms per 1000 pooled zombies")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if per_1000 > args.limit_ms:
+        print(f"FAIL: over {args.limit_ms} ms per 1000 zombies")
+        return 1
+    return 1 if failures else 0
+
+
+def bench_worker(args):
+    """Start and stop the horde worker, and check it leaves no shared memory behind.
+
+    The second worker is killed mid-run first, the way a crash or Ctrl+C
+    leaves it, and close() still has to release and unlink its segment.
+    """
+    import gc
+    from multiprocessing.shared_memory import SharedMemory
+    from entities.zombie import Zombie
+    from systems.horde_worker import HordeWorker
+
+    errors = []
+    hook = sys.unraisablehook
+    sys.unraisablehook = lambda unraisable: errors.append(unraisable.exc_value)
+
+    random.seed(0)
+    zombies = [Zombie(random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+               for _ in range(args.entities)]
+    failures = []
+    timings = []
+    for killed in (False, True):
+        start = time.perf_counter()
+        worker = HordeWorker()
+        name = worker.shm.name
+        for _ in range(args.repeat):
+            worker.update(zombies, 1.0 / FPS, (WIDTH // 2, HEIGHT // 2), [])
+            worker.burst(WIDTH // 2, HEIGHT // 2, (255, 0, 0), 20)
+            time.sleep(1.0 / FPS)
+        if killed:
+            worker.process.kill()
+            worker.process.join()
+        try:
+            worker.close()
+        except Exception as error:
+            failures.append(f"close() raised {error!r}")
+        timings.append((time.perf_counter() - start) * 1000)
+        worker = None
+        gc.collect()
+
+        try:
+            SharedMemory(name=name).close()
+            failures.append(f"segment {name} was left behind")
+        except FileNotFoundError:
+            pass
+    sys.unraisablehook = hook
+
+    print(f"Start/stop:    {timings[0]:8.1f} ms, {timings[1]:.1f} ms after a kill "
+          f"({args.repeat} ticks of {args.entities} zombies)")
+    failures.extend(f"{type(error).__name__}: {error}" for error in errors)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def bench_coop(args):
+    """Run a server and bot clients over localhost and measure bandwidth."""
+    import threading
+    from net.server import CoopServer
+    from net.client import CoopClient
+
+    server = CoopServer(host='127.0.0.1', port=0)
+    server.world.zombies.extend(server.world._tag(z) for z in
+                                server.world.spawner.spawn_batch(args.entities))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    clients = [CoopClient('127.0.0.1', server.port) for _ in range(args.clients)]
+    start = time.perf_counter()
+    frames = 0
+    worst_error = 0
+    while time.perf_counter() - start < args.seconds:
+        for client in clients:
+            client.receive()
+            client.send_input(random.choice((-1, 0, 1)), random.choice((-1, 0, 1)),
+                              1.0 / FPS)
+            client.interpolated_entities()
+        frames += 1
+        time.sleep(1.0 / FPS)
+
+    # Let the server catch up, then compare predictions with its positions
+    time.sleep(0.3)
+    for client in clients:
+        client.receive()
+        if client.pending_inputs or client.player_id not in server.world.players:
+            continue
+        actual = server.world.players[client.player_id].rect.center
+        predicted = client.player.rect.center
+        worst_error = max(worst_error, abs(actual[0] - predicted[0]),
+                          abs(actual[1] - predicted[1]))
+    server.running = False
+    thread.join()
+
+    elapsed = time.perf_counter() - start
+    per_client = [c.bytes_received / elapsed / 1024 for c in clients]
+    print(f"Zombies:       {args.entities} (view cap {NET_MAX_ENTITIES} entities)")
+    print(f"Bandwidth:     {sum(per_client) / len(per_client):8.1f} KiB/s per client "
+          f"(max {max(per_client):.1f}, budget {args.limit_kib:.1f})")
+    print(f"Prediction:    {worst_error} px worst error after reconciling")
+    for client in clients:
+        client.close()
+
+    if not all(c.bytes_received for c in clients):
+        print("FAIL: a client received no snapshots")
+        return 1
+    if max(per_client) > args.limit_kib:
+        print(f"FAIL: over {args.limit_kib} KiB/s for a client")
+        return 1
+    return 0
+
+
+BENCHMARKS = {
+    'restart': bench_restart,
+    'snapshot': bench_snapshot,
+    'coop': bench_coop,
+    'recycle': bench_recycle,
+    'worker': bench_worker,
+}
+
+# Default time limits: whole restart, and save/restore per 1000 entities
+DEFAULT_LIMITS_MS = {
+    'restart': 5.0,
+    'snapshot': 1.0,
+    'coop': None,
+    'recycle': 5.0,
+    'worker': None,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Engine benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seconds', type=float, default=30.0,
+                        help="game seconds to play before each measurement")
+    parser.add_argument('--entities', type=int, default=3000)
+    parser.add_argument('--clients', type=int, default=4)
+    parser.add_argument('--limit-ms', type=float, default=None,
+                        help="fail if a measurement is over this")
+    parser.add_argument('--limit-kib', type=float, default=NET_BANDWIDTH_BUDGET,
+                        help="coop: fail if a client receives more KiB/s than this")
+    args = parser.parse_args()
+
+    if args.limit_ms is None:
+        args.limit_ms = DEFAULT_LIMITS_MS[args.benchmark]
+    sys.exit(BENCHMARKS[args.benchmark](args))
+
+
+if __name__ == "__main__":
+    main()
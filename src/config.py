@@ -18,6 +18,36 @@ ZOMBIE_SPEED = 80
 ZOMBIE_SPAWN_RATE = 1.0  # seconds between spawns
 ZOMBIE_BASE_HEALTH = 50
 
+# Spawn director: queued spawns are let out at most SPAWN_BUDGET per frame,
+# and dead zombies are kept (up to SPAWN_POOL_SIZE) to be spawned again
+SPAWN_BUDGET = 20
+SPAWN_POOL_SIZE = 2048
+
+# Horde events: every interval, a wave of size + growth * (waves so far)
+HORDE_EVENT_INTERVAL = 75.0
+HORDE_EVENT_SIZE = 120
+HORDE_EVENT_GROWTH = 80
+
+# Population cap: past ZOMBIE_CAP live zombies (None for no cap), zombies
+# of one type within ELITE_MERGE_RADIUS px merge into an elite of up to
+# ELITE_MERGE_GROUP at a time and ELITE_MAX_MERGED in all. Each frame looks
+# at no more than ELITE_MERGE_SCAN zombies for a merge.
+ZOMBIE_CAP = 500
+ELITE_MERGE_RADIUS = 60
+ELITE_MERGE_GROUP = 4
+ELITE_MAX_MERGED = 16
+ELITE_MERGE_SCAN = 64
+ELITE_OUTLINE_COLOR = (255, 215, 0)
+
+# Zombie AI level of detail: (max distance outside the screen, update every
+# N ticks). Zombies on screen update every tick; ones further off screen
+# catch up using the time they skipped.
+ZOMBIE_LOD_BUCKETS = (
+    (0, 1),
+    (400, 2),
+    (float('inf'), 3),
+)
+
 # Weapon settings
 BULLET_SPEED = 500
 BULLET_DAMAGE = 25
@@ -25,11 +55,118 @@ DISC_RADIUS = 100
 DISC_ROTATION_SPEED = 180  # degrees per second
 DISC_DAMAGE = 15
 
+# Spatial grid used for weapon range queries (about two zombies wide)
+GRID_CELL_SIZE = 64
+
+# Boss gravity wells ("Singularity")
+GRAVITY_WELL_RADIUS = 300
+GRAVITY_WELL_STRENGTH = 250   # pull in px/s near the core, fading to 0 at the edge
+GRAVITY_WELL_CORE = 20        # nothing is pulled closer than this
+GRAVITY_WELL_DURATION = 4.0
+GRAVITY_WELL_COOLDOWN = 9.0
+GRAVITY_WELL_DISTANCE = 220   # how far from the player the boss opens wells
+
+# Boss phases, entered as its health ratio drops to each threshold. Each
+# phase has a minion cooldown and the patterns it fires:
+# (pattern, seconds between volleys, bullets per volley, speed px/s)
+BOSS_PHASES = (
+    (1.00, 5.0, (('radial', 2.0, 16, 160),)),
+    (0.66, 6.0, (('radial', 2.4, 24, 170), ('spiral', 0.10, 3, 200))),
+    (0.33, 8.0, (('spiral', 0.06, 5, 220), ('fan', 1.2, 7, 280))),
+)
+
+# Enemy projectiles
+ENEMY_SHOT_RADIUS = 6
+ENEMY_SHOT_DAMAGE = 8
+ENEMY_SHOT_CAPACITY = 4096   # live enemy shots; volleys past this are dropped
+ENEMY_SHOT_MARGIN = 40       # how far off screen a shot flies before it's gone
+ENEMY_SHOT_ANGLES = 256      # directions in the pattern angle table
+ENEMY_SPIRAL_STEP = 7        # angle table steps a spiral turns per volley
+ENEMY_FAN_STEP = 4           # angle table steps between bullets in a fan
+
 # Experience settings
 EXP_BASE_VALUE = 10
 EXP_TO_LEVEL = 100
 EXP_LEVEL_MULTIPLIER = 1.2
 
+# Deferred job scheduler: milliseconds of queued work run per frame, more
+# on idle screens (pause, menus); a run past budget * ratio is an overrun
+JOB_BUDGET_MS = 1.0
+JOB_IDLE_BUDGET_MS = 8.0
+JOB_OVERRUN_RATIO = 1.5
+
+# Quality governor settings
+QUALITY_WINDOW = 60  # frames averaged before deciding
+QUALITY_DOWNGRADE_RATIO = 1.0  # step down when average exceeds the budget
+QUALITY_UPGRADE_RATIO = 0.6  # step up when average is well under budget
+QUALITY_COOLDOWN = 2.0  # seconds to settle after a change
+GEM_MERGE_RADIUS = 40
+
+# Snapshot / rewind settings. Recording history costs a snapshot every
+# interval, so the debug rewind is off unless enabled (or --rewind).
+REWIND_ENABLED = False
+SNAPSHOT_INTERVAL = 0.25  # seconds between recorded snapshots
+SNAPSHOT_HISTORY_SECONDS = 5.0  # how far back we can rewind
+SNAPSHOT_KEYFRAME_EVERY = 8  # full snapshot every N, deltas in between
+REWIND_STEP = 1.0  # seconds rewound per key press
+
+# Co-op networking settings
+NET_PORT = 27960
+NET_TICK_RATE = 60  # server simulation ticks per second
+NET_SNAPSHOT_EVERY = 3  # send a snapshot every N ticks (20 per second)
+NET_MAX_ENTITIES = 256  # per snapshot, nearest first, bounds bandwidth
+NET_VIEW_MARGIN = 100  # pixels beyond a player's view that still get sent
+NET_INTERP_DELAY = 0.1  # seconds clients render other entities behind
+NET_MAX_INPUT_MS = 100  # longest frame of movement the server accepts
+NET_MAX_BACKLOG = 65536  # bytes queued for a client before snapshots are skipped
+NET_BANDWIDTH_BUDGET = 64.0  # KiB/s per client; bench.py coop fails over it
+
+# Event telemetry: JSON lines of event counts, or None to disable
+TELEMETRY_PATH = None
+
+# Optional worker process for zombie movement, separation and particles
+# (or python src/main.py --horde-worker)
+HORDE_WORKER = False
+HORDE_CAPACITY = 65536           # zombies per tick; any beyond move in-process
+HORDE_PARTICLE_CAPACITY = 16384
+HORDE_MAX_BURSTS = 256           # particle bursts handed over per tick
+HORDE_MAX_WELLS = 8
+HORDE_SEPARATION = 0.5           # share of an overlap pushed apart per tick
+HORDE_SEPARATION_NEIGHBOURS = 8  # most zombies each one is checked against per tick
+
+# Sound effects (mixer channels are pooled; see systems/audio.py)
+AUDIO_ENABLED = True
+AUDIO_CHANNELS = 16
+AUDIO_SAMPLE_RATE = 22050
+AUDIO_BUFFER = 512
+AUDIO_MERGE_BOOST = 0.25  # extra volume per doubling of same-frame repeats
+
+# World render resolution as a fraction of the window (HUD and menus stay
+# native). The quality governor can go lower on its own under load.
+RENDER_SCALE = 1.0
+RENDER_SCALES = (1.0, 0.75, 0.67, 0.5)
+RENDER_SMOOTH = False  # smoothscale the upscale (softer, costs more)
+
+# How frames reach the window: 'surface' draws in software and flips,
+# 'texture' sends texture copies to an SDL2 renderer (GPU when there is one)
+RENDER_BACKEND = 'surface'
+RENDER_BACKENDS = ('surface', 'texture')
+RENDER_ACCELERATED = -1  # texture backend: -1 prefer GPU, 0 SDL's software renderer
+ATLAS_PAGE_SIZE = 2048   # texture atlas page width and height
+CIRCLE_STAMP_MAX = 32    # circles up to this radius are baked atlas stamps
+
+# Parallax starfield, back to front: (parallax depth, drift in px/s,
+# stars per tile, star color, largest star radius)
+STARFIELD_TILE = 512
+STARFIELD_LAYERS = (
+    (0.05, 3, 280, (90, 70, 140), 1),
+    (0.15, 8, 110, (140, 120, 200), 1),
+    (0.35, 18, 40, (220, 210, 255), 2),
+)
+
+# UI font file, or None for the font bundled with pygame
+FONT_PATH = None
+
 # Colors
 COLOR_BG = (20, 0, 40)
 COLOR_PLAYER = (240, 240, 240)
@@ -0,0 +1,211 @@
+"""
+Content pipeline - compiles the data files into flyweight stat tables
+
+Zombie archetypes, weapon level tables and upgrades live in
+assets/data/*.json.  They are validated and compiled once at startup into
+tables indexed by type id; entities keep a reference to their shared row
+instead of copying the stats.  The compiled form is cached next to the
+data so later launches skip parsing and validation.
+"""
+import os
+import pickle
+import config
+
+
+DATA_DIR = os.path.join('assets', 'data')
+CACHE_PATH = os.path.join(DATA_DIR, '__pycache__', 'content.cache')
+CACHE_VERSION = 1
+SOURCES = ('zombies.json', 'weapons.json', 'upgrades.json')
+
+UPGRADE_STATS = ('max_health', 'speed', 'pickup_radius', 'heal')
+UPGRADE_TYPES = ('weapon_upgrade', 'new_weapon', 'stat_boost')
+
+# Compiled upgrades point at one of these handlers by index
+# (see UPGRADE_HANDLERS in systems/upgrades.py)
+UPGRADE_HANDLER_KEYS = ('weapon_upgrade', 'new_weapon') + UPGRADE_STATS
+
+
+class ContentError(ValueError):
+    """Raised when a data file is invalid."""
+
+
+class ZombieArchetype:
+    """Shared, read-only stats for one zombie type."""
+    __slots__ = ('type_id', 'name', 'max_health', 'speed', 'color',
+                 'exp_value', 'damage', 'size')
+
+    def __init__(self, type_id, name, max_health, speed, color, exp_value, damage, size):
+        self.type_id = type_id
+        self.name = name
+        self.max_health = max_health
+        self.speed = speed
+        self.color = color
+        self.exp_value = exp_value
+        self.damage = damage
+        self.size = size
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+
+class Content:
+    """All compiled game content."""
+
+    def __init__(self, zombies, weapons, upgrades):
+        self.zombies = zombies            # tuple of ZombieArchetype, by type id
+        self.zombie_ids = {z.name: z.type_id for z in zombies}
+        self.weapons = weapons            # weapon name -> tuple of stats per level
+        self.upgrades = upgrades          # tuple of upgrade dicts
+
+    def zombie(self, name):
+        """Look up a zombie archetype by name."""
+        return self.zombies[self.zombie_ids[name]]
+
+
+def _resolve(value, where):
+    """Turn a number or a "CONFIG_NAME * factor" string into a number."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        name, _, factor = value.partition('*')
+        name = name.strip()
+        if not hasattr(config, name):
+            raise ContentError(f"{where}: unknown config constant '{name}'")
+        base = getattr(config, name)
+        return base * float(factor) if factor else base
+    raise ContentError(f"{where}: expected a number, got {value!r}")
+
+
+def _require(entry, keys, where):
+    if not isinstance(entry, dict):
+        raise ContentError(f"{where}: expected an object")
+    missing = [key for key in keys if key not in entry]
+    if missing:
+        raise ContentError(f"{where}: missing {', '.join(missing)}")
+
+
+def compile_zombies(data):
+    """Validate zombie archetypes and index them by type id."""
+    archetypes = []
+    for type_id, (name, entry) in enumerate(data.items()):
+        where = f"zombies.json '{name}'"
+        _require(entry, ('health', 'speed', 'color', 'exp', 'damage', 'size'), where)
+        color = entry['color']
+        if len(color) != 3 or not all(0 <= c <= 255 for c in color):
+            raise ContentError(f"{where}: color must be three 0-255 values")
+        archetypes.append(ZombieArchetype(
+            type_id, name,
+            max_health=int(_resolve(entry['health'], where)),
+            speed=_resolve(entry['speed'], where),
+            color=tuple(color),
+            exp_value=_resolve(entry['exp'], where),
+            damage=_resolve(entry['damage'], where),
+            size=int(_resolve(entry['size'], where)),
+        ))
+    return tuple(archetypes)
+
+
+def compile_weapons(data):
+    """Expand per-level changes into a full stat row for every level."""
+    tables = {}
+    for name, entry in data.items():
+        where = f"weapons.json '{name}'"
+        _require(entry, ('base', 'levels'), where)
+
+        stats = {key: _resolve(value, where) for key, value in entry['base'].items()}
+        rows = [dict(stats)]
+        for level, changes in enumerate(entry['levels'], start=2):
+            for key, value in changes.items():
+                if key not in stats:
+                    raise ContentError(f"{where} level {level}: unknown stat '{key}'")
+                stats[key] = _resolve(value, where)
+            rows.append(dict(stats))
+        tables[name] = tuple(rows)
+    return tables
+
+
+def compile_upgrades(data, weapons):
+    """Validate upgrades and give each an id."""
+    upgrades = []
+    for upgrade_id, entry in enumerate(data):
+        where = f"upgrades.json #{upgrade_id}"
+        _require(entry, ('type', 'name', 'description'), where)
+        if entry['type'] not in UPGRADE_TYPES:
+            raise ContentError(f"{where}: unknown type '{entry['type']}'")
+
+        upgrade = dict(entry, id=upgrade_id)
+        if entry['type'] in ('weapon_upgrade', 'new_weapon'):
+            _require(entry, ('weapon',), where)
+            if entry['weapon'] not in weapons:
+                raise ContentError(f"{where}: unknown weapon '{entry['weapon']}'")
+            upgrade['handler'] = UPGRADE_HANDLER_KEYS.index(entry['type'])
+        else:
+            _require(entry, ('stat', 'value'), where)
+            if entry['stat'] not in UPGRADE_STATS:
+                raise ContentError(f"{where}: unknown stat '{entry['stat']}'")
+            upgrade['value'] = _resolve(entry['value'], where)
+            upgrade['handler'] = UPGRADE_HANDLER_KEYS.index(entry['stat'])
+        upgrades.append(upgrade)
+    return tuple(upgrades)
+
+
+def compile_content(data_dir=DATA_DIR):
+    """Read, validate and compile every data file."""
+    import json  # only needed when the compiled cache is out of date
+
+    def read(name):
+        with open(os.path.join(data_dir, name), encoding='utf-8') as data_file:
+            return json.load(data_file)
+
+    weapons = compile_weapons(read('weapons.json'))
+    return Content(
+        zombies=compile_zombies(read('zombies.json')),
+        weapons=weapons,
+        upgrades=compile_upgrades(read('upgrades.json'), weapons),
+    )
+
+
+def _source_key(data_dir):
+    """What the cache depends on: data file stamps and the config constants."""
+    stamps = []
+    for name in SOURCES:
+        stat = os.stat(os.path.join(data_dir, name))
+        stamps.append((name, stat.st_mtime_ns, stat.st_size))
+    constants = sorted((k, repr(v)) for k, v in vars(config).items() if k.isupper())
+    return (CACHE_VERSION, tuple(stamps), tuple(constants))
+
+
+def load_content(data_dir=DATA_DIR, cache_path=CACHE_PATH):
+    """Load compiled content, using the cache when the sources haven't changed."""
+    key = _source_key(data_dir)
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_key, content = pickle.load(cache_file)
+        if cached_key == key:
+            return content
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+        pass
+
+    content = compile_content(data_dir)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as cache_file:
+            pickle.dump((key, content), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only install: just compile every launch
+    return content
+
+
+_content = None
+
+
+def get_content():
+    """The compiled content for this process (loaded on first use)."""
+    global _content
+    if _content is None:
+        _content = load_content()
+    return _content
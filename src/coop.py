@@ -0,0 +1,31 @@
+"""
+Co-op launcher
+
+Usage:
+    python src/coop.py --server [--port 27960]
+    python src/coop.py --connect 127.0.0.1 [--port 27960]
+"""
+import argparse
+from config import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Space Zombie Survivors co-op")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--server', action='store_true',
+                      help="run a headless authoritative server")
+    mode.add_argument('--connect', metavar='HOST',
+                      help="join a server")
+    parser.add_argument('--port', type=int, default=NET_PORT)
+    args = parser.parse_args()
+
+    if args.server:
+        from net.server import CoopServer
+        CoopServer(port=args.port).run()
+    else:
+        from net.client import run_client
+        run_client(args.connect, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,30 +6,27 @@ import math
 import random
 from entities.zombie import Zombie
 from config import *
+from fonts import get_font
+from systems.enemy_shots import PATTERNS, radial, fan, angle_index
 
 
 class BossZombie(Zombie):
     """A massive boss zombie with high health and special attacks."""
     
     def __init__(self, x, y):
-        super().__init__(x, y, "basic")  # Initialize as basic zombie first
-        
-        # Boss stats - MUCH stronger!
-        self.max_health = 2000  # Lots of HP!
-        self.health = self.max_health
-        self.speed = ZOMBIE_SPEED * 0.8  # Slower but menacing
-        self.damage = 30  # Hits hard!
-        self.exp_value = 500  # Huge XP reward
-        
-        # Boss appearance
-        self.size = 64  # 2x bigger than normal zombies
-        self.rect = pygame.Rect(0, 0, self.size, self.size)
-        self.rect.center = (x, y)
-        self.color = (200, 50, 200)  # Purple boss color
+        # Boss stats come from the "boss" archetype - MUCH stronger!
+        super().__init__(x, y, "boss")
         
         # Boss special abilities
         self.spawn_timer = 0
-        self.spawn_cooldown = 5.0  # Spawn minions every 5 seconds
+        self.well_timer = 0
+        self.well_cooldown = GRAVITY_WELL_COOLDOWN  # Open a gravity well every few seconds
+        
+        # Attack phases (BOSS_PHASES), stepped through as health drops
+        self.volleys = 0      # volleys fired, so radial rings can alternate
+        self.spiral_turn = 0  # angle table step the spiral has turned to
+        self.set_phase(0)
+        self.new_phase = False  # the opening phase isn't announced
         
         # Visual effects
         self.pulse = 0
@@ -43,6 +40,53 @@ class BossZombie(Zombie):
         
         # Spawn minion timer
         self.spawn_timer += dt
+        self.well_timer += dt
+        
+        # Step into the next phase once health drops to its threshold
+        ratio = self.health / self.max_health
+        phase = self.phase
+        while phase + 1 < len(BOSS_PHASES) and ratio <= BOSS_PHASES[phase + 1][0]:
+            phase += 1
+        if phase != self.phase:
+            self.set_phase(phase)
+        
+        for i in range(len(self.volley_timers)):
+            self.volley_timers[i] += dt
+    
+    def set_phase(self, phase):
+        """Switch to an attack phase, restarting its pattern timers."""
+        self.phase = phase
+        _, self.spawn_cooldown, self.patterns = BOSS_PHASES[phase]
+        self.volley_timers = [0.0] * len(self.patterns)
+        self.new_phase = True
+    
+    def entered_phase(self):
+        """Check if the boss changed phase since the last call."""
+        if self.new_phase:
+            self.new_phase = False
+            return True
+        return False
+    
+    def fire(self, shots, target_pos):
+        """Fire every pattern whose cooldown is up into the enemy shot store."""
+        x, y = self.rect.center
+        if not (0 <= x <= WIDTH and 0 <= y <= HEIGHT):
+            return  # hold fire until it's on screen
+        for i, (pattern, cooldown, count, speed) in enumerate(self.patterns):
+            if self.volley_timers[i] < cooldown:
+                continue
+            self.volley_timers[i] = 0
+            self.volleys += 1
+            
+            if pattern == 'radial':
+                # Every other ring is turned half a gap, so there's no safe line
+                directions = radial(count, (self.volleys % 2) * ENEMY_SHOT_ANGLES // (2 * count))
+            elif pattern == 'spiral':
+                self.spiral_turn = (self.spiral_turn + ENEMY_SPIRAL_STEP) % ENEMY_SHOT_ANGLES
+                directions = radial(count, self.spiral_turn)
+            else:  # fan, aimed at the player
+                directions = fan(count, angle_index(target_pos[0] - x, target_pos[1] - y))
+            shots.fire(x, y, directions, speed, PATTERNS.index(pattern))
         
     def should_spawn_minion(self):
         """Check if boss should spawn a minion zombie."""
@@ -51,7 +95,14 @@ class BossZombie(Zombie):
             return True
         return False
     
-    def draw(self, surface):
+    def should_open_well(self):
+        """Check if boss should open a gravity well."""
+        if self.well_timer >= self.well_cooldown:
+            self.well_timer = 0
+            return True
+        return False
+    
+    def draw(self, canvas, health_bar=True, glow=True):
         """Draw the boss with special effects."""
         if not self.alive:
             return
@@ -61,23 +112,24 @@ class BossZombie(Zombie):
         draw_size = self.size + pulse_size
         
         # Draw glow effect
-        glow_rect = pygame.Rect(0, 0, draw_size + 20, draw_size + 20)
-        glow_rect.center = self.rect.center
-        glow_color = (150, 50, 150, 100)
-        pygame.draw.rect(surface, glow_color, glow_rect, border_radius=10)
+        if glow:
+            glow_rect = pygame.Rect(0, 0, draw_size + 20, draw_size + 20)
+            glow_rect.center = self.rect.center
+            glow_color = (150, 50, 150, 100)
+            canvas.rect(glow_color, glow_rect, border_radius=10)
         
         # Draw main body with pulsing
         draw_rect = pygame.Rect(0, 0, draw_size, draw_size)
         draw_rect.center = self.rect.center
-        pygame.draw.rect(surface, self.color, draw_rect)
+        canvas.rect(self.color, draw_rect)
         
         # Draw eyes (scary!)
         eye_size = 8
         left_eye_x = draw_rect.centerx - 15
         right_eye_x = draw_rect.centerx + 15
         eye_y = draw_rect.centery - 10
-        pygame.draw.circle(surface, (255, 0, 0), (left_eye_x, eye_y), eye_size)
-        pygame.draw.circle(surface, (255, 0, 0), (right_eye_x, eye_y), eye_size)
+        canvas.circle((255, 0, 0), (left_eye_x, eye_y), eye_size)
+        canvas.circle((255, 0, 0), (right_eye_x, eye_y), eye_size)
         
         # Draw health bar (BIGGER for boss)
         bar_width = self.size + 20
@@ -86,8 +138,8 @@ class BossZombie(Zombie):
         bar_y = self.rect.y - 20
         
         # Background (dark red)
-        pygame.draw.rect(surface, (60, 0, 0), 
-                        (bar_x, bar_y, bar_width, bar_height))
+        canvas.rect((60, 0, 0), 
+                   (bar_x, bar_y, bar_width, bar_height))
         
         # Health (red to orange gradient based on health)
         health_ratio = self.health / self.max_health
@@ -100,15 +152,15 @@ class BossZombie(Zombie):
         else:
             bar_color = (255, 200, 0)
         
-        pygame.draw.rect(surface, bar_color, 
-                        (bar_x, bar_y, health_width, bar_height))
+        canvas.rect(bar_color, 
+                   (bar_x, bar_y, health_width, bar_height))
         
         # Border
-        pygame.draw.rect(surface, (150, 150, 150), 
-                        (bar_x, bar_y, bar_width, bar_height), 2)
+        canvas.rect((150, 150, 150), 
+                   (bar_x, bar_y, bar_width, bar_height), 2)
         
         # HP text
-        font = pygame.font.SysFont(None, 20)
+        font = get_font(20)
         hp_text = font.render(f"{int(self.health)}/{int(self.max_health)}", True, (255, 255, 255))
         hp_rect = hp_text.get_rect(center=(bar_x + bar_width // 2, bar_y - 12))
-        surface.blit(hp_text, hp_rect)
\ No newline at end of file
+        canvas.blit(hp_text, hp_rect)
\ No newline at end of file
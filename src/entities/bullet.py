@@ -4,14 +4,17 @@ Bullet projectile - fired by player weapons
 import pygame
 import math
 from config import *
+from systems.collision import sweep_rect, swept_hits
 
 
 class Bullet:
     """A projectile fired by weapons."""
     
-    def __init__(self, start_x, start_y, target_x, target_y, damage=BULLET_DAMAGE):
+    def __init__(self, start_x, start_y, target_x, target_y, damage=BULLET_DAMAGE, pierce=0):
         self.x = start_x
         self.y = start_y
+        self.prev_x = start_x  # where the bullet was before this frame's move
+        self.prev_y = start_y
         self.damage = damage
         self.radius = 5
         self.color = COLOR_BULLET
@@ -29,10 +32,15 @@ class Bullet:
             self.vy = 0
         
         self.alive = True
-        self.pierce_count = 0  # how many enemies it can pierce through
+        self.pierce = pierce   # how many enemies it can pierce through
+        self.pierce_count = 0  # how many enemies it has hit so far
+        self.last_hit = None   # don't hit the same enemy again while passing through
+        self.last_hit_generation = 0
     
     def update(self, dt, screen_width, screen_height):
         """Move the bullet and check if it's off screen."""
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.vx * dt
         self.y += self.vy * dt
         
@@ -45,33 +53,60 @@ class Bullet:
         return self.alive
     
     def check_collision(self, zombie):
-        """Check if bullet hit a zombie."""
-        if not self.alive or not zombie.alive:
+        """Check if bullet hit a zombie. The caller deals the damage."""
+        if not self.alive or not zombie.alive or self.passing(zombie):
             return False
         
-        # Simple circle-rect collision
-        closest_x = max(zombie.rect.left, min(self.x, zombie.rect.right))
-        closest_y = max(zombie.rect.top, min(self.y, zombie.rect.bottom))
+        # Swept test over this frame's whole move, so fast bullets can't skip past
+        if sweep_rect(self.prev_x, self.prev_y, self.x - self.prev_x, self.y - self.prev_y,
+                      zombie.rect, self.radius) is None:
+            return False
         
-        distance = math.hypot(self.x - closest_x, self.y - closest_y)
+        self.register_hit(zombie)
+        return True
+    
+    def sweep(self, grid, hits=None):
+        """Zombies hit along this frame's move, in order, until the bullet is spent.
         
-        if distance < self.radius:
-            zombie.take_damage(self.damage)
-            self.pierce_count += 1
-            
-            # Bullet dies unless it can pierce
-            if self.pierce_count >= 1:  # change this for pierce upgrades
-                self.alive = False
-            
-            return True
+        Only the grid cells the move crosses are checked. The caller deals
+        the damage; zombies the hits already queued in hits (a DamageBuffer)
+        will kill are passed over, as if they had died on the first hit.
+        """
+        hit = []
+        if not self.alive:
+            return hit
+        for _, zombie in swept_hits(grid, self.prev_x, self.prev_y,
+                                    self.x, self.y, self.radius):
+            if self.passing(zombie):
+                continue
+            if hits is not None and hits.pending_lethal(zombie):
+                continue
+            hit.append(zombie)
+            self.register_hit(zombie)
+            if not self.alive:
+                break
+        return hit
+    
+    def passing(self, zombie):
+        """True while the bullet is still going through the zombie it last hit."""
+        return zombie is self.last_hit and zombie.generation == self.last_hit_generation
+    
+    def register_hit(self, zombie):
+        """Count a hit against the bullet's pierce."""
+        self.pierce_count += 1
+        self.last_hit = zombie
+        self.last_hit_generation = zombie.generation
         
-        return False
+        # Bullet dies unless it can pierce
+        if self.pierce_count > self.pierce:
+            self.alive = False
     
-    def draw(self, surface):
+    def draw(self, canvas, glow=True):
         """Draw the bullet."""
         if self.alive:
             # Glow effect
-            pygame.draw.circle(surface, (255, 255, 150), 
-                             (int(self.x), int(self.y)), self.radius + 2)
-            pygame.draw.circle(surface, self.color, 
-                             (int(self.x), int(self.y)), self.radius)
\ No newline at end of file
+            if glow:
+                canvas.circle((255, 255, 150), 
+                            (int(self.x), int(self.y)), self.radius + 2)
+            canvas.circle(self.color, 
+                        (int(self.x), int(self.y)), self.radius)
\ No newline at end of file
@@ -50,16 +50,35 @@ class ExpGem:
         # Return True if player collected it (within 10 pixels)
         return distance < 10
     
-    def draw(self, surface):
+    def draw(self, canvas, glow=True):
         """Draw the experience gem with pulsing effect."""
         # Pulsing size
         pulse_size = self.size + int(math.sin(self.pulse) * 2)
         
         # Outer glow
-        glow_color = tuple(min(255, c + 50) for c in self.color)
-        pygame.draw.circle(surface, glow_color, 
-                          (int(self.x), int(self.y)), pulse_size + 2)
+        if glow:
+            glow_color = tuple(min(255, c + 50) for c in self.color)
+            canvas.circle(glow_color, 
+                         (int(self.x), int(self.y)), pulse_size + 2)
         
         # Inner gem
-        pygame.draw.circle(surface, self.color, 
-                          (int(self.x), int(self.y)), pulse_size)
\ No newline at end of file
+        canvas.circle(self.color, 
+                     (int(self.x), int(self.y)), pulse_size)
+
+
+def merge_gems(gems, radius=GEM_MERGE_RADIUS):
+    """Merge gems that share a grid cell into one gem holding their value."""
+    cells = {}
+    merged = []
+    
+    for gem in gems:
+        key = (int(gem.x // radius), int(gem.y // radius))
+        keeper = cells.get(key)
+        if keeper is None:
+            cells[key] = gem
+            merged.append(gem)
+        else:
+            keeper.value += gem.value
+            keeper.attracted = keeper.attracted or gem.attracted
+    
+    return merged
\ No newline at end of file
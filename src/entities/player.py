@@ -13,19 +13,8 @@ class Player:
     
     def __init__(self, pos):
         self.rect = pygame.Rect(0, 0, PLAYER_SIZE, PLAYER_SIZE)
-        self.rect.center = pos
         self.color = COLOR_PLAYER
         
-        # Stats
-        self.max_health = PLAYER_MAX_HEALTH
-        self.health = self.max_health
-        self.speed = PLAYER_SPEED
-        self.pickup_radius = PLAYER_PICKUP_RADIUS
-        
-        # State
-        self.alive = True
-        self.invulnerable_time = 0  # for damage immunity after hit
-        
         # Animation
         sprite_path = os.path.join('assets', 'sprites', 'player_idle.png')
         self.animation = AnimatedSprite(
@@ -37,11 +26,30 @@ class Player:
             layout='vertical'
         )
         
+        self.reset(pos)
+    
+    def reset(self, pos):
+        """Reset stats and state for a new run."""
+        self.rect.center = pos
+        
+        # Stats
+        self.max_health = PLAYER_MAX_HEALTH
+        self.health = self.max_health
+        self.speed = PLAYER_SPEED
+        self.pickup_radius = PLAYER_PICKUP_RADIUS
+        
+        # State
+        self.alive = True
+        self.invulnerable_time = 0  # for damage immunity after hit
+        self.animation.reset()
+        
     def handle_input(self, keys, dt):
         """Handle WASD/Arrow key movement."""
-        if not self.alive:
-            return
-            
+        self.move(*self.read_direction(keys), dt)
+    
+    @staticmethod
+    def read_direction(keys):
+        """Turn WASD/Arrow keys into a (-1..1, -1..1) direction."""
         vx = 0
         vy = 0
         
@@ -53,6 +61,13 @@ class Player:
             vy -= 1
         if keys[pygame.K_s] or keys[pygame.K_DOWN]:
             vy += 1
+        
+        return vx, vy
+    
+    def move(self, vx, vy, dt):
+        """Move in a direction (used for local input and network prediction)."""
+        if not self.alive:
+            return
 
         # Normalize diagonal movement
         if vx != 0 or vy != 0:
@@ -88,7 +103,7 @@ class Player:
         # Update animation
         self.animation.update(dt)
     
-    def draw(self, surface):
+    def draw(self, canvas):
         """Draw the player."""
         # Flash when invulnerable
         if self.invulnerable_time > 0 and int(self.invulnerable_time * 10) % 2:
@@ -100,7 +115,7 @@ class Player:
         # Center the 64x64 sprite on the 32x32 collision rect
         sprite_rect = current_frame.get_rect()
         sprite_rect.center = self.rect.center
-        surface.blit(current_frame, sprite_rect)
+        canvas.blit(current_frame, sprite_rect)
         
         # Draw health bar above player
         bar_width = 64  # Match sprite width
@@ -109,10 +124,10 @@ class Player:
         bar_y = sprite_rect.y - 10
         
         # Background (red)
-        pygame.draw.rect(surface, (100, 0, 0), 
-                        (bar_x, bar_y, bar_width, bar_height))
+        canvas.rect((100, 0, 0), 
+                   (bar_x, bar_y, bar_width, bar_height))
         
         # Health (green)
         health_width = int(bar_width * (self.health / self.max_health))
-        pygame.draw.rect(surface, (0, 255, 0), 
-                        (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
+        canvas.rect((0, 255, 0), 
+                   (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
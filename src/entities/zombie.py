@@ -5,42 +5,83 @@ import pygame
 import math
 import random
 from config import *
+from content import get_content
 
 
 class Zombie:
     """A zombie enemy that chases the player."""
     
     def __init__(self, x, y, zombie_type="basic"):
-        self.rect = pygame.Rect(0, 0, ZOMBIE_SIZE, ZOMBIE_SIZE)
-        self.rect.center = (x, y)
+        self.generation = -1
+        self.respawn(x, y, zombie_type)
+    
+    def respawn(self, x, y, zombie_type="basic"):
+        """Start over as a fresh zombie (pooled zombies come back this way)."""
+        # Anything holding on to this object from its last life can tell
+        # by the generation that it's a different zombie now
+        self.generation += 1
+        # Stats are shared with every zombie of the same type
+        self.archetype = get_content().zombie(zombie_type)
         self.type = zombie_type
+        self.type_id = self.archetype.type_id
+        self.max_health = self.archetype.max_health
+        self.merged = 1  # zombies folded into this one; elites hold more
         
-        # Set stats based on type
-        if zombie_type == "basic":
-            self.max_health = ZOMBIE_BASE_HEALTH
-            self.speed = ZOMBIE_SPEED
-            self.color = (50, 150, 50)
-            self.exp_value = EXP_BASE_VALUE
-            self.damage = 10
-        elif zombie_type == "fast":
-            self.max_health = ZOMBIE_BASE_HEALTH // 2
-            self.speed = ZOMBIE_SPEED * 1.8
-            self.color = (150, 150, 50)
-            self.exp_value = EXP_BASE_VALUE * 1.5
-            self.damage = 8
-        elif zombie_type == "tank":
-            self.max_health = ZOMBIE_BASE_HEALTH * 3
-            self.speed = ZOMBIE_SPEED * 0.6
-            self.color = (150, 50, 50)
-            self.exp_value = EXP_BASE_VALUE * 3
-            self.damage = 20
+        self.rect = pygame.Rect(0, 0, self.archetype.size, self.archetype.size)
+        self.rect.center = (x, y)
         
         self.health = self.max_health
         self.alive = True
         
-        # Velocity for smooth movement
+        # Velocity for smooth movement, and the fraction of a pixel moved
+        # that the rect can't hold yet
         self.vx = 0
         self.vy = 0
+        self.rem_x = 0.0
+        self.rem_y = 0.0
+        
+        # Time not yet simulated (distant zombies update every few ticks),
+        # and which of those ticks is this zombie's turn
+        self.pending_dt = 0
+        self.lod_phase = (round(x) * 7 + round(y) * 3) % 64
+    
+    # Read-only stats come from the archetype
+    @property
+    def speed(self):
+        return self.archetype.speed
+    
+    @property
+    def color(self):
+        return self.archetype.color
+    
+    # An elite is worth, and hits as hard as, everything merged into it
+    @property
+    def exp_value(self):
+        return self.archetype.exp_value * self.merged
+    
+    @property
+    def damage(self):
+        return self.archetype.damage * self.merged
+    
+    @property
+    def size(self):
+        return self.rect.width
+    
+    def absorb(self, others):
+        """Merge other zombies of this type into this one, making it an elite."""
+        for other in others:
+            self.health += other.health
+            self.max_health += other.max_health
+            self.merged += other.merged
+            other.alive = False
+        self.fit_size()
+    
+    def fit_size(self):
+        """Size the body for the zombies merged into it (area grows with the count)."""
+        size = round(self.archetype.size * math.sqrt(self.merged))
+        center = self.rect.center
+        self.rect.size = (size, size)
+        self.rect.center = center
     
     def update(self, dt, player_pos):
         """Move toward the player."""
@@ -57,9 +98,15 @@ class Zombie:
             self.vx = (dx / distance) * self.speed
             self.vy = (dy / distance) * self.speed
             
-            # Move
-            self.rect.x += self.vx * dt
-            self.rect.y += self.vy * dt
+            # Move, carrying what doesn't add up to a whole pixel
+            step_x = self.vx * dt + self.rem_x
+            step_y = self.vy * dt + self.rem_y
+            move_x = round(step_x)
+            move_y = round(step_y)
+            self.rect.x += move_x
+            self.rect.y += move_y
+            self.rem_x = step_x - move_x
+            self.rem_y = step_y - move_y
     
     def take_damage(self, amount):
         """Reduce health and check for death."""
@@ -70,25 +117,27 @@ class Zombie:
             return True  # zombie died
         return False
     
-    def draw(self, surface):
+    def draw(self, canvas, health_bar=True):
         """Draw the zombie."""
         if not self.alive:
             return
         
-        pygame.draw.rect(surface, self.color, self.rect)
+        canvas.rect(self.color, self.rect)
+        if self.merged > 1:
+            canvas.rect(ELITE_OUTLINE_COLOR, self.rect, 2)
         
         # Draw health bar for damaged zombies
-        if self.health < self.max_health:
-            bar_width = ZOMBIE_SIZE
+        if health_bar and self.health < self.max_health:
+            bar_width = self.size
             bar_height = 3
             bar_x = self.rect.x
             bar_y = self.rect.y - 8
             
             # Background (dark red)
-            pygame.draw.rect(surface, (60, 0, 0), 
-                            (bar_x, bar_y, bar_width, bar_height))
+            canvas.rect((60, 0, 0), 
+                       (bar_x, bar_y, bar_width, bar_height))
             
             # Health (red)
             health_width = int(bar_width * (self.health / self.max_health))
-            pygame.draw.rect(surface, (255, 0, 0), 
-                            (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
+            canvas.rect((255, 0, 0), 
+                       (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Fonts - one cached font per size, loaded from a bundled font file
+"""
+import pygame
+from config import *
+
+
+_fonts = {}  # size -> Font
+
+
+def get_font(size):
+    """The shared font at this size, loaded on first use.
+
+    Fonts come straight from FONT_PATH (pygame's bundled font by default),
+    so there's no system font scan at startup and nothing to create per frame.
+    """
+    font = _fonts.get(size)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = _fonts[size] = pygame.font.Font(FONT_PATH, size)
+    return font
@@ -1,5 +1,13 @@
+import time
+
+# Startup is profiled from here, before pygame and the game modules load
+STARTUP_BEGIN = time.perf_counter()
+
 import pygame
+PYGAME_LOADED = time.perf_counter()
 import sys
+import math
+import argparse
 import random
 
 # Import configuration
@@ -8,19 +16,37 @@ from config import *
 # Import entities
 from entities.player import Player
 from entities.zombie import Zombie
-from entities.exp_gem import ExpGem
+from entities.exp_gem import ExpGem, merge_gems
 from entities.bullet import Bullet
 from entities.boss_zombie import BossZombie
 
 # Import systems
 from systems.spawner import ZombieSpawner
+from systems.spawn_director import SpawnDirector
+from systems.population import PopulationCap
 from systems.experience import ExperienceSystem
-from systems.particles import VoidParticle, create_death_particles, create_void_particles
+from systems.particles import create_death_particles
+from systems.quality import QualityGovernor
+from systems.zombie_lod import ZombieLOD
+from systems.spatial_grid import SpatialGrid
+from systems.gravity import GravityField
+from systems.enemy_shots import EnemyShots
+from systems.damage import DamageBuffer
+from systems.startup import StartupProfile
+from systems.jobs import get_scheduler, PRIORITY_HIGH, PRIORITY_LOW
+from systems.starfield import Starfield
+from systems.audio import AudioManager
+from systems.events import (EventBus, LogSink, TelemetrySink, Kill, LevelUp,
+                            BossSpawn, BossPhase, HordeIncoming, PlayerHit,
+                            QualityChange, Shot)
 
 # Import UI
 from ui.hud import HUD
 from ui.upgrade_menu import UpgradeMenu
 from ui.main_menu import MainMenu
+from render.renderer import create_renderer
+from animated_sprite import SpriteSheet
+from fonts import get_font
 
 #Import weapons
 from weapons.auto_gun import AutoGun
@@ -33,30 +59,113 @@ from systems.upgrades import get_available_upgrades
 class Game:
     """Main game class that manages the game loop."""
     
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Space Zombie Survivors")
+    def __init__(self, startup_profile=False, horde_worker=HORDE_WORKER, audio=AUDIO_ENABLED,
+                 render_scale=RENDER_SCALE, renderer=RENDER_BACKEND,
+                 accelerated=RENDER_ACCELERATED, zombie_cap=ZOMBIE_CAP,
+                 rewind=REWIND_ENABLED):
+        self.startup = StartupProfile(STARTUP_BEGIN)
+        self.show_startup_profile = startup_profile
+        self.startup.mark('import pygame', PYGAME_LOADED)
+        self.startup.mark('game modules')
+        
+        # Only the subsystems the game uses (the audio manager starts the
+        # mixer; joysticks stay off)
+        pygame.display.init()
+        pygame.font.init()
+        self.renderer = create_renderer(renderer, WIDTH, HEIGHT, "Space Zombie Survivors",
+                                        render_scale, accelerated)
+        self.screen = self.renderer.screen  # HUD and menus; the world has a canvas
         self.clock = pygame.time.Clock()
-        
-        # Game state
         self.running = True
-        self.paused = False
-        self.game_over = False
+        self.startup.mark('display')
         
-        # Initialize systems
+        # Process-lifetime resources (kept across restarts)
+        self.hud = HUD(WIDTH, HEIGHT)
+        self.upgrade_menu = UpgradeMenu(WIDTH, HEIGHT)
+        self.starfield = Starfield(WIDTH, HEIGHT)
+        self.render_scale = render_scale  # the quality governor may go lower
+        self.main_menu = MainMenu(WIDTH, HEIGHT, self.starfield)
+        self.startup.mark('fonts and ui')
+        
+        # Gameplay events are handled in one batch at the end of each tick
+        self.events = EventBus()
+        self.events.subscribe(Kill, self.on_kills)
+        self.events.subscribe(LevelUp, self.on_level_up)
+        self.events.subscribe(PlayerHit, self.on_player_hit)
+        self.events.add_sink(LogSink())
+        if TELEMETRY_PATH:
+            self.events.add_sink(TelemetrySink(TELEMETRY_PATH))
+        self.quality = QualityGovernor(self.events)
+        self.jobs = get_scheduler()  # deferred work, a slice of each frame
+        self.audio = AudioManager(self.events, enabled=audio)
+        self.startup.mark('audio')
+        
+        # Run systems (reset in place on restart)
         self.player = Player((WIDTH // 2, HEIGHT // 2))
         self.spawner = ZombieSpawner(WIDTH, HEIGHT)
+        self.director = SpawnDirector(self.spawner)
+        self.population = PopulationCap(self.director, zombie_cap)
         self.exp_system = ExperienceSystem()
-        self.hud = HUD(WIDTH, HEIGHT)
-        self.upgrade_menu = UpgradeMenu(WIDTH, HEIGHT)
-        self.main_menu = MainMenu(WIDTH, HEIGHT)    
+        self.zombie_lod = ZombieLOD()
+        self.zombie_grid = SpatialGrid()
+        self.gravity = GravityField()
+        self.enemy_shots = EnemyShots()
+        self.hits = DamageBuffer()
+        self.rewind_enabled = rewind
+        self.history = None  # rewind buffer, made on the first simulated frame
         
         # Entity lists
         self.zombies = []
         self.bullets = []
         self.exp_gems = []
         self.particles = []
+        self.weapons = []
+        
+        # Zombie movement and particles can run in a second process
+        self.horde = None
+        if horde_worker:
+            from systems.horde_worker import HordeWorker
+            self.horde = HordeWorker()
+        
+        self.reset_run()
+        self.startup.mark('game state')
+    
+    def reset_run(self):
+        """Reset all per-run state without touching loaded resources."""
+        # Game state
+        self.paused = False
+        self.game_over = False
+        
+        # Reset systems
+        self.player.reset((WIDTH // 2, HEIGHT // 2))
+        self.spawner.reset()
+        self.director.clear()
+        self.population.clear()
+        self.jobs.clear()  # nothing queued by the last run applies to this one
+        self.queue_atlas_baking()
+        self.exp_system.reset()
+        self.zombie_lod.tick = 0
+        self.gravity.clear()
+        self.enemy_shots.clear()
+        self.hits.clear()
+        if self.horde:
+            self.horde.clear()
+        if self.history is not None:
+            self.history.clear()
+        self.events.clear()
+        self.audio.stop()
+        self.upgrade_menu.active = False
+        self.main_menu.active = True
+        
+        # Clear entity lists in place
+        self.zombies.clear()
+        self.bullets.clear()
+        self.exp_gems.clear()
+        self.particles.clear()
+        
+        # Cosmetic updates can run every few frames under load
+        self.frame_count = 0
+        self.cosmetic_dt = 0
         
         #Boss 
         self.boss = None
@@ -66,6 +175,7 @@ class Game:
         # Game stats
         self.game_time = 0
         self.kills = 0
+        self.boss_kill_time = None
 
         #Screen Shake
         self.screen_shake = 0
@@ -73,7 +183,7 @@ class Game:
         self.shake_offset_y = 0
         
         # Weapon system (basic auto-gun for now)
-        self.weapons = [
+        self.weapons[:] = [
             AutoGun(self.player),
             OrbitingDisc(self.player)
         ] 
@@ -91,6 +201,8 @@ class Game:
                         self.paused = not self.paused
                 elif event.key == pygame.K_r and self.game_over:
                     self.restart()
+                elif event.key == pygame.K_BACKSPACE and (self.paused or self.game_over):
+                    self.rewind()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Handle main menu clicks
                 if self.main_menu.active:
@@ -99,20 +211,51 @@ class Game:
                 elif self.upgrade_menu.active:
                     self.upgrade_menu.handle_click(event.pos)
     
+    def queue_atlas_baking(self):
+        """Queue long-lived images for the GPU (no-op for surfaces); baked ones are skipped."""
+        # A few per frame while the main menu is up
+        self.jobs.schedule(self.renderer.baking(
+            [tile for tile, _, _ in self.starfield.layers]
+            + SpriteSheet.loaded_surfaces() + self.enemy_shots.sprites),
+            PRIORITY_LOW, name='atlas')
+    
     def restart(self):
         """Restart the game."""
-        self.__init__()
+        self.reset_run()
+    
+    def rewind(self):
+        """Step back through recorded snapshots (debugging aid)."""
+        if self.history is None:
+            return
+        data = self.history.rewind(int(REWIND_STEP / SNAPSHOT_INTERVAL))
+        if data:
+            from systems.snapshot import restore_snapshot
+            if self.horde:
+                self.horde.clear()
+            restore_snapshot(self, data)
+            self.game_over = False
+    
+    def get_keys(self):
+        """Get the movement keys for this frame. Overridden by bots."""
+        return pygame.key.get_pressed()
     
     def update(self, dt):
         """Update all game entities and systems."""
+        if not self.paused:
+            self.starfield.update(dt)
+        
         if self.paused or self.game_over or self.upgrade_menu.active or self.main_menu.active:
+            # Nothing to simulate: a good time to catch up on deferred work
+            self.jobs.run(JOB_IDLE_BUDGET_MS)
             return
         
         # Update game time
         self.game_time += dt
+        self.frame_count += 1
+        quality = self.quality.settings
         
         # Update player
-        keys = pygame.key.get_pressed()
+        keys = self.get_keys()
         self.player.handle_input(keys, dt)
         self.player.clamp(WIDTH, HEIGHT)
         self.player.update(dt)
@@ -126,37 +269,38 @@ class Game:
             self.shake_offset_x = 0
             self.shake_offset_y = 0
         
-        # New Weapons update
+        # New Weapons update (area weapons query the grid instead of scanning)
+        self.zombie_grid.update(self.zombies)
         for weapon in self.weapons:
-            new_bullets = weapon.update(dt, self.zombies)
-            self.bullets.extend(new_bullets)
-        
-        # Spawn void particles around player
-        if random.random() < 0.3:
-            self.particles.extend(create_void_particles(
-                self.player.rect.centerx, 
-                self.player.rect.centery, 
-                1
-            ))
-        
-        # Spawn zombies
+            new_bullets = weapon.update(dt, self.zombies, self.zombie_grid, self.hits)
+            if new_bullets:
+                self.bullets.extend(new_bullets)
+                self.events.emit(Shot(weapon, len(new_bullets)))
+        
+        # Queue spawns (let out a few per frame once the damage is resolved)
         if self.spawner.should_spawn(dt):
-            self.zombies.append(self.spawner.spawn_zombie())
+            self.director.queue_edges(1)
+        horde = self.spawner.horde_due()
+        if horde:
+            self.director.queue_edges(horde)
+            self.events.emit(HordeIncoming(horde))
 
         # Spawn boss at specific time
         if not self.boss_spawned and self.game_time >= self.boss_spawn_time:
             self.spawn_boss()
         
-        # Update zombies
-        for zombie in self.zombies[:]:
-            zombie.update(dt, self.player.rect.center)
-            
+        # Update zombies (distant ones less often, or in the horde worker)
+        if self.horde:
+            overflow = self.horde.update(self.zombies, dt, self.player.rect.center,
+                                         self.gravity.wells)
+            self.zombie_lod.update(overflow, dt, self.player.rect.center)
+        else:
+            self.zombie_lod.update(self.zombies, dt, self.player.rect.center)
+        
+        for zombie in self.zombies:
             # Check collision with player
             if zombie.alive and self.player.rect.colliderect(zombie.rect):
-                if self.player.take_damage(zombie.damage):
-                    self.game_over = True
-                else:
-                    self.screen_shake = 10  # Trigger screen shake
+                self.hurt_player(zombie.damage, shake=10)
         
         # Update boss
         if self.boss and self.boss.alive:
@@ -164,73 +308,61 @@ class Game:
             
             # Boss collision with player
             if self.boss.rect.colliderect(self.player.rect):
-                if self.player.take_damage(self.boss.damage):
-                    self.game_over = True
-                else:
-                    self.screen_shake = 15  # Bigger shake for boss!
+                self.hurt_player(self.boss.damage, shake=15)  # Bigger shake for boss!
+            
+            # Boss bullet patterns (they change as it loses health)
+            if self.boss.entered_phase():
+                self.events.emit(BossPhase(self.boss.phase))
+            self.boss.fire(self.enemy_shots, self.player.rect.center)
             
             # Boss spawns minions
             if self.boss.should_spawn_minion():
-                # Spawn 3 zombies around boss
-                for i in range(5):
-                    offset_x = random.randint(-100, 100)
-                    offset_y = random.randint(-100, 100)
-                    minion = Zombie(
-                        self.boss.rect.centerx + offset_x,
-                        self.boss.rect.centery + offset_y,
-                        "fast"
-                    )
-                    self.zombies.append(minion)
+                # Spawn 5 fast zombies around boss
+                self.director.queue_burst(self.boss.rect.centerx, self.boss.rect.centery,
+                                          5, "fast", spread=100)
+            
+            # Boss tears open a singularity somewhere near the player
+            if self.boss.should_open_well():
+                angle = random.uniform(0, math.tau)
+                self.gravity.open(
+                    self.player.rect.centerx + math.cos(angle) * GRAVITY_WELL_DISTANCE,
+                    self.player.rect.centery + math.sin(angle) * GRAVITY_WELL_DISTANCE
+                )
+        
+        # Enemy shots: one batched move and one test against the player
+        if self.enemy_shots:
+            if self.enemy_shots.update(dt, self.player.rect, WIDTH, HEIGHT):
+                self.hurt_player(ENEMY_SHOT_DAMAGE, shake=6)
+        
+        # Gravity wells pull zombies, bullets, gems and particles in one pass
+        if self.gravity.wells:
+            self.zombie_grid.update(self.zombies)  # zombies moved since the weapons ran
+            self.gravity.update(dt, self.zombie_grid, self.bullets,
+                                self.exp_gems, self.particles)
 
-        # Update bullets
+        # Update bullets (swept against the cells each one crosses this frame)
+        self.zombie_grid.update(self.zombies)
         for bullet in self.bullets[:]:
             if not bullet.update(dt, WIDTH, HEIGHT):
                 self.bullets.remove(bullet)
                 continue
             
             # Check bullet-zombie collisions
-            for zombie in self.zombies:
-                if bullet.check_collision(zombie):
-                    if not zombie.alive:
-                        # Zombie died
-                        self.kills += 1
-                        # Drop exp gem
-                        self.exp_gems.append(ExpGem(
-                            zombie.rect.centerx,
-                            zombie.rect.centery,
-                            zombie.exp_value
-                        ))
-                        # Create death particles
-                        self.particles.extend(create_death_particles(
-                            zombie.rect.centerx,
-                            zombie.rect.centery,
-                            zombie.color,
-                            count = 25
-                        ))
-                        self.zombies.remove(zombie)
-                    break
+            for zombie in bullet.sweep(self.zombie_grid, self.hits):
+                self.hits.deal(zombie, bullet.damage, bullet)
                     
             # Check bullet-boss collision
             if self.boss and self.boss.alive and bullet.alive:
                 if bullet.check_collision(self.boss):
-                    if not self.boss.alive:
-                        # BOSS DEFEATED!
-                        self.kills += 1
-                        # Huge XP drop
-                        self.exp_gems.append(ExpGem(
-                            self.boss.rect.centerx,
-                            self.boss.rect.centery,
-                            self.boss.exp_value
-                        ))
-                        # Massive particle explosion!
-                        self.particles.extend(create_death_particles(
-                            self.boss.rect.centerx,
-                            self.boss.rect.centery,
-                            self.boss.color,
-                            count=50  # HUGE explosion!
-                        ))
-                        self.screen_shake = 30  # BIG shake!
-                        self.boss = None
+                    self.hits.deal(self.boss, bullet.damage, bullet)
+        
+        # Apply every hit from this frame and clear out the dead
+        self.resolve_damage()
+        
+        # Merges and spawns come after the hits, so none of this frame's
+        # damage lands on a zombie that has been merged away or reused
+        self.merge_elites()
+        self.director.update(self.zombies, self.population.room(self.zombies))
 
         # Update exp gems
         for gem in self.exp_gems[:]:
@@ -239,19 +371,110 @@ class Game:
                 self.exp_gems.remove(gem)
                 if self.exp_system.add_exp(gem.value):
                     # Level up!
-                    self.on_level_up()
+                    self.events.emit(LevelUp(self.exp_system.level))
+        
+        # Record a snapshot for the debug rewind (the snapshot code loads
+        # here rather than at startup, since the menu never needs it)
+        if self.rewind_enabled:
+            if self.history is None:
+                from systems.snapshot import SnapshotHistory
+                self.history = SnapshotHistory()
+            self.history.update(dt, self)
+        
+        # Merge gems when there are too many lying around
+        if len(self.exp_gems) > quality['gem_merge_threshold']:
+            self.jobs.schedule(self.merge_exp_gems, PRIORITY_HIGH, name='merge gems')
+        
+        # Update particles (less often at low quality)
+        self.cosmetic_dt += dt
+        if self.frame_count % quality['cosmetic_interval'] == 0:
+            self.particles = [p for p in self.particles if p.update(self.cosmetic_dt)]
+            self.cosmetic_dt = 0
+        
+        # Handle everything that happened this tick
+        self.events.dispatch()
+        self.audio.flush()
+        
+        # Deferred work, until this frame's share of the budget is spent
+        self.jobs.run(JOB_BUDGET_MS)
+    
+    def merge_elites(self):
+        """Past the zombie cap, merge nearby zombies into elites, with a burst for each."""
+        elites = self.population.update(self.zombies, self.zombie_grid)
+        count = int(12 * self.quality.settings['particle_scale'])
+        for elite in elites:
+            self.add_particles(elite.rect.centerx, elite.rect.centery,
+                               ELITE_OUTLINE_COLOR, count)
+    
+    def merge_exp_gems(self):
+        """Merge gems that share a cell, if there are still too many (deferred job)."""
+        if len(self.exp_gems) > self.quality.settings['gem_merge_threshold']:
+            self.exp_gems = merge_gems(self.exp_gems)
+    
+    def resolve_damage(self):
+        """Apply the frame's damage buffer and turn every death into a Kill."""
+        dead = self.hits.apply(self.events)
+        if not dead:
+            return
         
-        # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
+        for target in dead:
+            self.events.emit(Kill(target.rect.centerx, target.rect.centery,
+                                  target.color, target.exp_value,
+                                  boss=target is self.boss))
+        if self.boss and not self.boss.alive:
+            self.boss = None  # BOSS DEFEATED!
+            self.enemy_shots.clear()
+        
+        # One compaction for every zombie that died this frame
+        self.zombies[:] = [zombie for zombie in self.zombies if zombie.alive]
+        self.director.recycle(dead)
+    
+    def hurt_player(self, damage, shake):
+        """Damage the player from an enemy hit."""
+        if self.player.invulnerable_time > 0:
+            return
+        fatal = self.player.take_damage(damage)
+        if fatal:
+            self.game_over = True
+        self.events.emit(PlayerHit(damage, shake, fatal))
+    
+    def on_player_hit(self, events):
+        """Shake the screen for the hardest hit this frame."""
+        hits = [event.shake for event in events if not event.fatal]
+        if hits:
+            self.screen_shake = max(self.screen_shake, max(hits))
     
+    def on_kills(self, events):
+        """Drop gems and particles for everything that died this frame."""
+        particle_scale = self.quality.settings['particle_scale']
+        self.kills += len(events)
+        
+        for event in events:
+            # Drop exp gem
+            self.exp_gems.append(ExpGem(event.x, event.y, event.exp_value))
+            
+            if event.boss:
+                self.boss_kill_time = self.game_time
+                # Massive particle explosion!
+                self.add_particles(event.x, event.y, event.color,
+                                   int(50 * particle_scale))  # HUGE explosion!
+                self.screen_shake = 30  # BIG shake!
+            else:
+                # Create death particles
+                self.add_particles(event.x, event.y, event.color,
+                                   int(25 * particle_scale))
 
-    def on_level_up(self):
+    def add_particles(self, x, y, color, count):
+        """Burst death particles here, or have the horde worker do it."""
+        if self.horde:
+            self.horde.burst(x, y, color, count)
+        else:
+            self.particles.extend(create_death_particles(x, y, color, count))
+    
+    def on_level_up(self, events):
         """Handle level up event."""
-        # TODO: Show upgrade menu
-        # For now, just give a stat boost
         available = get_available_upgrades(self.player, self.weapons)
         self.upgrade_menu.show(self.player, self.weapons, available)
-        print(f"Level up! Now level {self.exp_system.level}")
     
     def spawn_boss(self):
         """Spawn the boss zombie!"""
@@ -264,57 +487,73 @@ class Game:
         self.boss = BossZombie(boss_x, boss_y)
         
         # Show warning message
-        print("⚠️  BOSS INCOMING! ⚠️")
+        self.events.emit(BossSpawn(boss_x, boss_y))
 
     def draw(self):
         """Draw all game entities."""
         # Clear screen with void color
-        self.screen.fill(COLOR_BG)
+        self.renderer.begin_frame()
         
         # If main menu is active, only draw menu
         if self.main_menu.active:
             self.main_menu.draw(self.screen)
-            pygame.display.flip()
+            self.renderer.flip()
             return
         
-        # Create a temporary surface for screen shake
-        temp_surface = pygame.Surface((WIDTH, HEIGHT))
-        temp_surface.fill(COLOR_BG)
+        quality = self.quality.settings
+        
+        # The world goes on its own canvas, at a lower resolution under load
+        canvas = self.renderer.begin_world(min(self.render_scale, quality['render_scale']))
+        
+        # Starfield (behind everything), shifted as the player moves
+        self.starfield.draw(canvas,
+                            self.player.rect.centerx - WIDTH // 2,
+                            self.player.rect.centery - HEIGHT // 2,
+                            quality['star_layers'])
         
-        # Draw particles (behind everything)
+        # Draw particles
         for particle in self.particles:
-            particle.draw(temp_surface)
+            particle.draw(canvas)
+        if self.horde:
+            self.horde.draw_particles(canvas)
+        
+        # Draw gravity wells
+        self.gravity.draw(canvas, glow=quality['glow'])
         
         # Draw exp gems
         for gem in self.exp_gems:
-            gem.draw(temp_surface)
+            gem.draw(canvas, glow=quality['glow'])
         
         # Draw zombies
         for zombie in self.zombies:
-            zombie.draw(temp_surface)
+            zombie.draw(canvas, health_bar=quality['small_health_bars'])
 
         # Draw boss
         if self.boss and self.boss.alive:
-            self.boss.draw(temp_surface)
+            self.boss.draw(canvas, glow=quality['glow'])
         
         # Draw bullets
         for bullet in self.bullets:
-            bullet.draw(temp_surface)
+            bullet.draw(canvas, glow=quality['glow'])
         
         # Draw player
-        self.player.draw(temp_surface)
+        self.player.draw(canvas)
         
         # Draw weapons (like orbiting disc)
         for weapon in self.weapons:
-            weapon.draw(temp_surface)
+            weapon.draw(canvas, glow=quality['glow'])
         
-        # Draw HUD (no shake on UI)
-        self.hud.draw(temp_surface, self.player, self.exp_system, 
-                     self.game_time, self.kills)
-        self.hud.draw_fps(temp_surface, self.clock.get_fps())
+        # Enemy shots on top, so they're never hidden
+        self.enemy_shots.draw(canvas)
         
-        # Apply screen shake
-        self.screen.blit(temp_surface, (self.shake_offset_x, self.shake_offset_y))
+        # Scale the world up to the window, applying screen shake
+        self.renderer.end_world((self.shake_offset_x, self.shake_offset_y))
+        
+        # Draw HUD (native resolution, no shake)
+        self.hud.draw(self.screen, self.player, self.exp_system, 
+                     self.game_time, self.kills)
+        self.hud.draw_fps(self.screen, self.clock.get_fps(), quality['name'],
+                          canvas.scale, self.jobs.stats())
         
         # Draw pause overlay (no shake)
         if self.paused:
@@ -327,7 +566,7 @@ class Game:
         # Draw upgrade menu (on top of everything, no shake)
         self.upgrade_menu.draw(self.screen)
         
-        pygame.display.flip()
+        self.renderer.flip()
     
     def draw_pause_screen(self):
         """Draw pause overlay."""
@@ -336,12 +575,12 @@ class Game:
         overlay.fill((0, 0, 0))
         self.screen.blit(overlay, (0, 0))
         
-        font = pygame.font.SysFont(None, 72)
+        font = get_font(72)
         text = font.render("PAUSED", True, (255, 255, 255))
         rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
         self.screen.blit(text, rect)
         
-        font_small = pygame.font.SysFont(None, 36)
+        font_small = get_font(36)
         text2 = font_small.render("Press ESC to resume", True, (200, 200, 200))
         rect2 = text2.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
         self.screen.blit(text2, rect2)
@@ -353,12 +592,12 @@ class Game:
         overlay.fill((20, 0, 0))
         self.screen.blit(overlay, (0, 0))
         
-        font = pygame.font.SysFont(None, 96)
+        font = get_font(96)
         text = font.render("GAME OVER", True, (255, 50, 50))
         rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 80))
         self.screen.blit(text, rect)
         
-        font_medium = pygame.font.SysFont(None, 48)
+        font_medium = get_font(48)
         stats = [
             f"Survived: {int(self.game_time // 60)}:{int(self.game_time % 60):02d}",
             f"Level: {self.exp_system.level}",
@@ -372,24 +611,66 @@ class Game:
             self.screen.blit(text, rect)
             y_offset += 50
         
-        font_small = pygame.font.SysFont(None, 36)
+        font_small = get_font(36)
         text2 = font_small.render("Press R to restart or ESC to quit", True, (200, 200, 200))
         rect2 = text2.get_rect(center=(WIDTH // 2, HEIGHT - 100))
         self.screen.blit(text2, rect2)
     
     def run(self):
         """Main game loop."""
-        while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+        first_frame = True
+        try:
+            while self.running:
+                # Nothing to hold back before the first frame
+                dt = self.clock.tick(0 if first_frame else FPS) / 1000.0
             
-            self.handle_events()
-            self.update(dt)
-            self.draw()
-        
+                frame_start = time.perf_counter()
+                self.handle_events()
+                self.update(dt)
+                self.draw()
+            
+                if first_frame:
+                    first_frame = False
+                    self.startup.mark('first frame')
+                    if self.show_startup_profile:
+                        self.startup.report()
+                        self.running = False
+            
+                # Let the governor know how much of the budget we used
+                if not (self.paused or self.game_over or self.main_menu.active
+                        or self.upgrade_menu.active):
+                    self.quality.record((time.perf_counter() - frame_start) * 1000, dt)
+        finally:
+            # Also on Ctrl+C, so the horde worker's shared memory is freed
+            self.events.close()
+            if self.horde:
+                self.horde.close()
         pygame.quit()
         sys.exit()
 
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Space Zombie Survivors")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="print time to first frame by startup phase, then exit")
+    parser.add_argument('--horde-worker', action='store_true', default=HORDE_WORKER,
+                        help="move zombies and particles in a second process")
+    parser.add_argument('--render-scale', type=float, default=RENDER_SCALE,
+                        choices=RENDER_SCALES,
+                        help="draw the world at this fraction of the window size")
+    parser.add_argument('--renderer', choices=RENDER_BACKENDS, default=RENDER_BACKEND,
+                        help="software surfaces, or SDL2 texture copies (GPU if available)")
+    parser.add_argument('--software-renderer', action='store_const', const=0,
+                        default=RENDER_ACCELERATED, dest='accelerated',
+                        help="with --renderer texture, use SDL's software renderer")
+    parser.add_argument('--rewind', action='store_true', default=REWIND_ENABLED,
+                        help="record snapshots so Backspace can rewind (debugging aid)")
+    parser.add_argument('--zombie-cap', type=int, default=ZOMBIE_CAP,
+                        help="live zombies before nearby ones merge into elites (0: no cap)")
+    args = parser.parse_args()
+    
+    game = Game(startup_profile=args.startup_profile, horde_worker=args.horde_worker,
+                render_scale=args.render_scale, renderer=args.renderer,
+                accelerated=args.accelerated, zombie_cap=args.zombie_cap or None,
+                rewind=args.rewind)
     game.run()
\ No newline at end of file
@@ -0,0 +1 @@
+"""Networked co-op"""
@@ -0,0 +1,174 @@
+"""
+Co-op client - predicts its own player and interpolates everything else
+"""
+import time
+import socket
+from collections import deque
+import pygame
+from config import *
+from fonts import get_font
+from render.canvas import WorldCanvas
+from entities.player import Player
+from entities.zombie import Zombie
+from net.protocol import (MSG_HELLO, MSG_WELCOME, MSG_SNAPSHOT, KIND_PLAYER,
+                          KIND_BULLET, KIND_GEM, ZOMBIE_KINDS, MessageReader,
+                          frame, encode_input, decode_welcome, decode_snapshot)
+
+
+class CoopClient:
+    """Connection to a co-op server plus the client's view of the world."""
+
+    def __init__(self, host, port=NET_PORT):
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setblocking(False)
+        self.reader = MessageReader()
+        self.sock.sendall(frame(MSG_HELLO))
+
+        self.player_id = None
+        self.player = Player((WIDTH // 2, HEIGHT // 2))
+        self.input_seq = 0
+        self.pending_inputs = deque()  # inputs the server hasn't applied yet
+
+        # Latest server state, plus timestamped copies to interpolate between
+        self.table = {}
+        self.snapshots = deque(maxlen=8)
+        self.level = 1
+        self.game_time = 0
+        self.bytes_received = 0
+        self.connected = True
+
+    def receive(self):
+        """Read everything the server has sent so far."""
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionError:
+                data = b''
+            if not data:
+                self.connected = False
+                return
+
+            self.bytes_received += len(data)
+            for msg_type, payload in self.reader.feed(data):
+                if msg_type == MSG_WELCOME:
+                    self.player_id = decode_welcome(payload)
+                elif msg_type == MSG_SNAPSHOT:
+                    self.on_snapshot(payload)
+
+    def on_snapshot(self, payload):
+        (_, ack_input, health, max_health,
+         self.level, self.game_time) = decode_snapshot(payload, self.table)
+        self.snapshots.append((time.perf_counter(), dict(self.table)))
+
+        self.player.health = health
+        self.player.max_health = max(1, max_health)
+        self.player.alive = health > 0
+
+        # Reconcile: start from the server's position and replay unacked input
+        own = self.table.get(self.player_id)
+        if own is None:
+            return
+        self.player.rect.center = (own[1], own[2])
+        while self.pending_inputs and self.pending_inputs[0][0] <= ack_input:
+            self.pending_inputs.popleft()
+        for _, dx, dy, dt_ms in self.pending_inputs:
+            self.player.move(dx, dy, dt_ms / 1000.0)
+            self.player.clamp(WIDTH, HEIGHT)
+
+    def send_input(self, dx, dy, dt):
+        """Send one frame of movement and predict it locally."""
+        if self.player_id is None:
+            return
+        dt_ms = max(1, min(int(dt * 1000), NET_MAX_INPUT_MS))
+        self.input_seq += 1
+        self.pending_inputs.append((self.input_seq, dx, dy, dt_ms))
+
+        # Predict with exactly the dt the server will use
+        self.player.move(dx, dy, dt_ms / 1000.0)
+        self.player.clamp(WIDTH, HEIGHT)
+        try:
+            self.sock.sendall(encode_input(self.input_seq, dx, dy, dt_ms))
+        except ConnectionError:
+            self.connected = False
+
+    def interpolated_entities(self):
+        """Other entities as (id, kind, x, y, health) at the interpolation time."""
+        if not self.snapshots:
+            return []
+
+        render_time = time.perf_counter() - NET_INTERP_DELAY
+        older = newer = self.snapshots[-1]
+        for i in range(len(self.snapshots) - 1, 0, -1):
+            if self.snapshots[i - 1][0] <= render_time:
+                older, newer = self.snapshots[i - 1], self.snapshots[i]
+                break
+
+        span = newer[0] - older[0]
+        alpha = 1.0 if span <= 0 else max(0.0, min(1.0, (render_time - older[0]) / span))
+
+        entities = []
+        for entity_id, (kind, x, y, health) in newer[1].items():
+            if entity_id == self.player_id:
+                continue
+            previous = older[1].get(entity_id)
+            if previous is not None:
+                x = previous[1] + (x - previous[1]) * alpha
+                y = previous[2] + (y - previous[2]) * alpha
+            entities.append((entity_id, kind, x, y, health))
+        return entities
+
+    def close(self):
+        self.sock.close()
+
+
+def run_client(host, port=NET_PORT):
+    """Open a window and play on a co-op server."""
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    canvas = WorldCanvas(WIDTH, HEIGHT, surface=screen)
+    pygame.display.set_caption("Space Zombie Survivors - Co-op")
+    clock = pygame.time.Clock()
+    font = get_font(36)
+
+    client = CoopClient(host, port)
+    zombie_colors = {kind: Zombie(0, 0, zombie_type).color
+                     for kind, zombie_type in ZOMBIE_KINDS.items()}
+
+    running = True
+    while running and client.connected:
+        dt = clock.tick(FPS) / 1000.0
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        client.receive()
+        client.send_input(*Player.read_direction(pygame.key.get_pressed()), dt)
+        client.player.update(dt)
+
+        screen.fill(COLOR_BG)
+        for _, kind, x, y, health in client.interpolated_entities():
+            if kind == KIND_GEM:
+                pygame.draw.circle(screen, COLOR_EXP, (int(x), int(y)), 8)
+            elif kind == KIND_BULLET:
+                pygame.draw.circle(screen, COLOR_BULLET, (int(x), int(y)), 5)
+            elif kind == KIND_PLAYER:
+                rect = pygame.Rect(0, 0, PLAYER_SIZE, PLAYER_SIZE)
+                rect.center = (int(x), int(y))
+                pygame.draw.rect(screen, COLOR_PLAYER, rect, 2)
+            else:
+                rect = pygame.Rect(0, 0, ZOMBIE_SIZE, ZOMBIE_SIZE)
+                rect.center = (int(x), int(y))
+                pygame.draw.rect(screen, zombie_colors[kind], rect)
+        client.player.draw(canvas)
+
+        text = font.render(f"Level {client.level}   HP {int(client.player.health)}"
+                           f"   {int(client.game_time // 60)}:{int(client.game_time % 60):02d}",
+                           True, (255, 255, 255))
+        screen.blit(text, (20, 20))
+        pygame.display.flip()
+
+    client.close()
+    pygame.quit()
@@ -0,0 +1,127 @@
+"""
+Co-op wire protocol - framed binary messages over TCP
+
+Every message is a 4-byte length followed by a 1-byte type and its
+payload.  World snapshots are quantized (whole-pixel int16 positions,
+8-bit health) and delta-compressed against what the client already has.
+"""
+import struct
+from config import *
+from content import get_content
+
+
+# Message types
+MSG_HELLO = 1      # client -> server: join the game
+MSG_WELCOME = 2    # server -> client: your player id
+MSG_INPUT = 3      # client -> server: one frame of movement
+MSG_SNAPSHOT = 4   # server -> client: world changes since the last snapshot
+
+# Entity kinds as sent on the wire. Zombies get one kind per archetype,
+# numbered by its compiled type id, so new archetypes need no changes here.
+KIND_PLAYER = 0
+KIND_BULLET = 1
+KIND_GEM = 2
+KIND_ZOMBIE_FIRST = 3
+KIND_ZOMBIE = {archetype.name: KIND_ZOMBIE_FIRST + archetype.type_id
+               for archetype in get_content().zombies}
+ZOMBIE_KINDS = {kind: zombie_type for zombie_type, kind in KIND_ZOMBIE.items()}
+
+_frame = struct.Struct('<IB')            # payload length, message type
+_welcome = struct.Struct('<I')           # player id
+_input = struct.Struct('<IbbH')          # input seq, dx, dy, dt in ms
+_snapshot = struct.Struct('<IIHHHfHH')   # seq, last input, health, max health,
+                                         # level, game time, removed, changed
+_removed = struct.Struct('<I')           # entity id
+_entity = struct.Struct('<IBhhB')        # id, kind, x, y, health (0-255)
+
+
+def _clamp16(value):
+    return max(-32768, min(32767, int(value)))
+
+
+def frame(msg_type, payload=b''):
+    """Wrap a payload with its length and type."""
+    return _frame.pack(len(payload), msg_type) + payload
+
+
+def encode_welcome(player_id):
+    return frame(MSG_WELCOME, _welcome.pack(player_id))
+
+
+def decode_welcome(payload):
+    return _welcome.unpack(payload)[0]
+
+
+def encode_input(seq, dx, dy, dt_ms):
+    return frame(MSG_INPUT, _input.pack(seq, dx, dy, dt_ms))
+
+
+def decode_input(payload):
+    return _input.unpack(payload)
+
+
+def quantize(kind, x, y, health_ratio):
+    """Quantize one entity to what goes on the wire."""
+    return (kind, _clamp16(x), _clamp16(y),
+            max(0, min(255, int(health_ratio * 255))))
+
+
+def encode_snapshot(seq, ack_input, health, max_health, level, game_time,
+                    baseline, visible):
+    """Encode the difference between the client's baseline and the visible set.
+
+    Both tables map entity id -> quantized tuple. Only removed ids and
+    entries that changed since the baseline are written.
+    """
+    removed = [entity_id for entity_id in baseline if entity_id not in visible]
+    changed = [(entity_id, entry) for entity_id, entry in visible.items()
+               if baseline.get(entity_id) != entry]
+
+    parts = [_snapshot.pack(seq, ack_input, int(health), int(max_health), level,
+                            game_time, len(removed), len(changed))]
+    parts.extend(_removed.pack(entity_id) for entity_id in removed)
+    parts.extend(_entity.pack(entity_id, *entry) for entity_id, entry in changed)
+    return frame(MSG_SNAPSHOT, b''.join(parts))
+
+
+def decode_snapshot(payload, table):
+    """Apply a snapshot to a client's entity table in place.
+
+    Returns the header fields (seq, ack_input, health, max_health, level,
+    game_time).
+    """
+    (seq, ack_input, health, max_health, level, game_time,
+     removed_count, changed_count) = _snapshot.unpack_from(payload, 0)
+    offset = _snapshot.size
+
+    for _ in range(removed_count):
+        entity_id, = _removed.unpack_from(payload, offset)
+        offset += _removed.size
+        table.pop(entity_id, None)
+
+    for _ in range(changed_count):
+        entity_id, kind, x, y, health_byte = _entity.unpack_from(payload, offset)
+        offset += _entity.size
+        table[entity_id] = (kind, x, y, health_byte)
+
+    return seq, ack_input, health, max_health, level, game_time
+
+
+class MessageReader:
+    """Splits a TCP byte stream back into (type, payload) messages."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """Add received bytes and return every complete message."""
+        self.buffer.extend(data)
+        messages = []
+        while len(self.buffer) >= _frame.size:
+            length, msg_type = _frame.unpack_from(self.buffer, 0)
+            end = _frame.size + length
+            if len(self.buffer) < end:
+                break
+            messages.append((msg_type, bytes(self.buffer[_frame.size:end])))
+            del self.buffer[:end]
+        return messages
@@ -0,0 +1,160 @@
+"""
+Co-op server - headless authoritative simulation over TCP
+"""
+import os
+import time
+import socket
+import selectors
+
+# The server never opens a real window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config import *
+from net.world import CoopWorld
+from net.protocol import (MSG_HELLO, MSG_INPUT, MessageReader, decode_input,
+                          encode_welcome, encode_snapshot)
+
+
+class ClientConnection:
+    """Server-side state for one connected client."""
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.reader = MessageReader()
+        self.outgoing = bytearray()
+        self.player_id = None
+        self.last_input = 0
+        self.baseline = {}   # what this client currently knows about
+        self.bytes_sent = 0
+
+
+class CoopServer:
+    """Accepts clients, applies their inputs and streams world snapshots."""
+
+    def __init__(self, host='0.0.0.0', port=NET_PORT):
+        # Entities need a display surface for their sprites, even headless
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        self.world = CoopWorld()
+        self.selector = selectors.DefaultSelector()
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+        self.port = self.listener.getsockname()[1]
+        self.clients = {}
+        self.tick = 0
+        self.snapshot_seq = 0
+        self.running = True
+
+    def accept(self):
+        sock, address = self.listener.accept()
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = ClientConnection(sock, address)
+        self.clients[sock] = client
+        self.selector.register(sock, selectors.EVENT_READ, client)
+
+    def disconnect(self, client):
+        self.selector.unregister(client.sock)
+        client.sock.close()
+        self.clients.pop(client.sock, None)
+        if client.player_id is not None:
+            self.world.remove_player(client.player_id)
+            print(f"Player {client.player_id} left")
+
+    def receive(self, client):
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except ConnectionError:
+            data = b''
+        if not data:
+            self.disconnect(client)
+            return
+
+        for msg_type, payload in client.reader.feed(data):
+            if msg_type == MSG_HELLO and client.player_id is None:
+                client.player_id = self.world.add_player()
+                client.outgoing += encode_welcome(client.player_id)
+                print(f"Player {client.player_id} joined from {client.address[0]}")
+            elif msg_type == MSG_INPUT and client.player_id is not None:
+                seq, dx, dy, dt_ms = decode_input(payload)
+                if seq > client.last_input:
+                    client.last_input = seq
+                    self.world.move_player(client.player_id, dx, dy,
+                                           min(dt_ms, NET_MAX_INPUT_MS) / 1000.0)
+
+    def flush(self, client):
+        if not client.outgoing:
+            return
+        try:
+            sent = client.sock.send(client.outgoing)
+        except (BlockingIOError, InterruptedError):
+            return
+        except ConnectionError:
+            self.disconnect(client)
+            return
+        client.bytes_sent += sent
+        del client.outgoing[:sent]
+
+    def send_snapshots(self):
+        self.snapshot_seq += 1
+        world = self.world
+        for client in list(self.clients.values()):
+            player = world.players.get(client.player_id)
+            if player is None:
+                continue
+            # Don't pile snapshots onto a client that can't keep up
+            if len(client.outgoing) > NET_MAX_BACKLOG:
+                continue
+
+            visible = world.visible_entities(client.player_id)
+            client.outgoing += encode_snapshot(
+                self.snapshot_seq, client.last_input, player.health,
+                player.max_health, world.exp_system.level, world.game_time,
+                client.baseline, visible)
+            client.baseline = visible
+            self.flush(client)
+
+    def poll(self, timeout):
+        for key, _ in self.selector.select(timeout):
+            if key.fileobj is self.listener:
+                self.accept()
+            else:
+                self.receive(key.data)
+
+    def run(self):
+        """Run the fixed-rate simulation until stopped."""
+        tick_time = 1.0 / NET_TICK_RATE
+        next_tick = time.perf_counter()
+        print(f"Co-op server listening on port {self.port}")
+
+        while self.running:
+            self.poll(max(0.0, next_tick - time.perf_counter()))
+            if time.perf_counter() < next_tick:
+                continue
+            next_tick += tick_time
+
+            self.world.update(tick_time)
+            self.tick += 1
+            if self.tick % NET_SNAPSHOT_EVERY == 0:
+                self.send_snapshots()
+            for client in list(self.clients.values()):
+                self.flush(client)
+
+        self.close()
+
+    def close(self):
+        for client in list(self.clients.values()):
+            self.disconnect(client)
+        self.selector.unregister(self.listener)
+        self.listener.close()
@@ -0,0 +1,186 @@
+"""
+Co-op world - the authoritative simulation run by the server
+"""
+import random
+import itertools
+from config import *
+from entities.player import Player
+from entities.exp_gem import ExpGem
+from systems.spawner import ZombieSpawner
+from systems.experience import ExperienceSystem
+from systems.spatial_grid import SpatialGrid
+from systems.damage import DamageBuffer
+from weapons.auto_gun import AutoGun
+from weapons.orbiting_disc import OrbitingDisc
+from net.protocol import (KIND_PLAYER, KIND_ZOMBIE, KIND_BULLET, KIND_GEM,
+                          quantize)
+
+
+class CoopWorld:
+    """Simulates one shared run for any number of players."""
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.players = {}   # player id -> Player
+        self.weapons = {}   # player id -> list of weapons
+        self.spawner = ZombieSpawner(WIDTH, HEIGHT)
+        self.exp_system = ExperienceSystem()
+        self.zombie_grid = SpatialGrid()
+        self.hits = DamageBuffer()
+        self.zombies = []
+        self.bullets = []
+        self.exp_gems = []
+        self.game_time = 0
+
+    def add_player(self):
+        """Add a player near the middle of the arena and return its id."""
+        player_id = next(self.ids)
+        offset = (len(self.players) % 4) * 40 - 60
+        player = Player((WIDTH // 2 + offset, HEIGHT // 2))
+        player.net_id = player_id
+        self.players[player_id] = player
+        self.weapons[player_id] = [AutoGun(player), OrbitingDisc(player)]
+        return player_id
+
+    def remove_player(self, player_id):
+        self.players.pop(player_id, None)
+        self.weapons.pop(player_id, None)
+
+    def reset(self):
+        """Start a new run with the same players."""
+        self.spawner.reset()
+        self.exp_system.reset()
+        self.zombies.clear()
+        self.bullets.clear()
+        self.exp_gems.clear()
+        self.hits.clear()
+        self.game_time = 0
+        for player_id, player in self.players.items():
+            player.reset((WIDTH // 2, HEIGHT // 2))
+            self.weapons[player_id] = [AutoGun(player), OrbitingDisc(player)]
+
+    def move_player(self, player_id, dx, dy, dt):
+        """Apply one input from a client (same code the client predicts with)."""
+        player = self.players.get(player_id)
+        if player:
+            player.move(dx, dy, dt)
+            player.clamp(WIDTH, HEIGHT)
+
+    def _tag(self, entity):
+        entity.net_id = next(self.ids)
+        return entity
+
+    def _nearest_player(self, x, y):
+        nearest = None
+        min_dist = float('inf')
+        for player in self.players.values():
+            if not player.alive:
+                continue
+            dx = player.rect.centerx - x
+            dy = player.rect.centery - y
+            dist = dx * dx + dy * dy
+            if dist < min_dist:
+                min_dist = dist
+                nearest = player
+        return nearest
+
+    def update(self, dt):
+        """Advance the world by one tick."""
+        living = [p for p in self.players.values() if p.alive]
+        if not living:
+            if self.players:
+                self.reset()
+            return
+
+        self.game_time += dt
+        for player in living:
+            player.update(dt)
+
+        if self.spawner.should_spawn(dt):
+            self.zombies.append(self._tag(self.spawner.spawn_zombie()))
+
+        self.zombie_grid.update(self.zombies)
+        for player_id, weapons in self.weapons.items():
+            if not self.players[player_id].alive:
+                continue
+            for weapon in weapons:
+                self.bullets.extend(self._tag(b) for b in weapon.update(
+                    dt, self.zombies, self.zombie_grid, self.hits))
+
+        # Zombies chase whichever player is closest
+        for zombie in self.zombies:
+            target = self._nearest_player(zombie.rect.centerx, zombie.rect.centery)
+            if target is None:
+                break
+            zombie.update(dt, target.rect.center)
+            if zombie.alive and target.rect.colliderect(zombie.rect):
+                target.take_damage(zombie.damage)
+
+        self.zombie_grid.update(self.zombies)
+        for bullet in self.bullets:
+            if not bullet.update(dt, WIDTH, HEIGHT):
+                continue
+            for zombie in bullet.sweep(self.zombie_grid, self.hits):
+                self.hits.deal(zombie, bullet.damage, bullet)
+        self.bullets = [b for b in self.bullets if b.alive]
+        self.hits.apply()
+
+        # Every dead zombie drops its gem, whatever killed it
+        survivors = []
+        for zombie in self.zombies:
+            if zombie.alive:
+                survivors.append(zombie)
+            else:
+                self.exp_gems.append(self._tag(ExpGem(
+                    zombie.rect.centerx, zombie.rect.centery, zombie.exp_value)))
+        self.zombies = survivors
+
+        remaining = []
+        for gem in self.exp_gems:
+            player = self._nearest_player(gem.x, gem.y)
+            if player and gem.update(dt, player.rect.center, player.pickup_radius):
+                if self.exp_system.add_exp(gem.value):
+                    self.on_level_up()
+            else:
+                remaining.append(gem)
+        self.exp_gems = remaining
+
+    def on_level_up(self):
+        """No menus in co-op: every player gets a random weapon upgrade."""
+        for weapons in self.weapons.values():
+            random.choice(weapons).upgrade()
+
+    def visible_entities(self, player_id, limit=NET_MAX_ENTITIES):
+        """Quantized entities in a player's view, nearest first, up to limit."""
+        viewer = self.players[player_id]
+        cx, cy = viewer.rect.center
+        half_w = WIDTH // 2 + NET_VIEW_MARGIN
+        half_h = HEIGHT // 2 + NET_VIEW_MARGIN
+
+        candidates = []
+        for zombie in self.zombies:
+            x, y = zombie.rect.center
+            if abs(x - cx) <= half_w and abs(y - cy) <= half_h:
+                candidates.append((zombie.net_id, KIND_ZOMBIE[zombie.type], x, y,
+                                   zombie.health / zombie.max_health))
+        for bullet in self.bullets:
+            if abs(bullet.x - cx) <= half_w and abs(bullet.y - cy) <= half_h:
+                candidates.append((bullet.net_id, KIND_BULLET, bullet.x, bullet.y, 1))
+        for gem in self.exp_gems:
+            if abs(gem.x - cx) <= half_w and abs(gem.y - cy) <= half_h:
+                candidates.append((gem.net_id, KIND_GEM, gem.x, gem.y, 1))
+
+        # Keep bandwidth bounded: only the closest entities make the cut
+        if len(candidates) > limit:
+            candidates.sort(key=lambda c: (c[2] - cx) ** 2 + (c[3] - cy) ** 2)
+            del candidates[limit:]
+
+        visible = {entity_id: quantize(kind, x, y, health)
+                   for entity_id, kind, x, y, health in candidates}
+
+        # Players are always sent
+        for other_id, player in self.players.items():
+            visible[other_id] = quantize(KIND_PLAYER, player.rect.centerx,
+                                         player.rect.centery,
+                                         player.health / player.max_health)
+        return visible
@@ -0,0 +1,3 @@
+"""Rendering targets"""
+from .canvas import WorldCanvas
+from .renderer import Renderer, SurfaceRenderer, create_renderer
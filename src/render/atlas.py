@@ -0,0 +1,104 @@
+"""
+Texture atlas - many small images packed into a few large GPU textures
+"""
+import weakref
+import pygame
+
+
+class AtlasPage:
+    """One texture plus the CPU copy it's packed on, filled shelf by shelf."""
+
+    def __init__(self, renderer, size, texture_type):
+        self.size = size
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self.texture = texture_type.from_surface(renderer, self.surface)
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def place(self, width, height, padding):
+        """Top-left of a free width x height spot, or None if the page is full."""
+        width += padding
+        height += padding
+        if self.shelf_x + width > self.size:
+            # Start a new shelf under the tallest thing on this one
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height
+            self.shelf_height = 0
+        if width > self.size or self.shelf_y + height > self.size:
+            return None
+        spot = (self.shelf_x, self.shelf_y)
+        self.shelf_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return spot
+
+
+class TextureAtlas:
+    """Images packed onto shared textures so drawing them rarely switches texture.
+
+    add() copies an image onto a page and uploads just that region. Images
+    are keyed by the Surface they came from, so baking a sprite frame once
+    is enough for every later draw of it. Pages are never repacked: the
+    atlas is for long-lived images (sprite frames, starfield tiles, shape
+    stamps), not per-frame text.
+    """
+
+    PADDING = 1  # transparent gap so smoothed sampling doesn't bleed
+
+    def __init__(self, renderer, texture_type, page_size):
+        self.renderer = renderer
+        self.texture_type = texture_type
+        self.page_size = page_size
+        self.pages = []
+        self.regions = weakref.WeakKeyDictionary()  # Surface -> (texture, Rect)
+
+    def get(self, image):
+        """(texture, source rect) for a baked image, or None."""
+        return self.regions.get(image)
+
+    def bake(self, images):
+        """Pack a batch of images, then upload each page they landed on once."""
+        touched = set()
+        for image in images:
+            if image not in self.regions:
+                touched.add(self.add(image, upload=False)[0])
+        for page in self.pages:
+            if page.texture in touched:
+                page.texture.update(page.surface)
+
+    def add(self, image, upload=True):
+        """Pack an image (if it isn't already) and return its (texture, source rect)."""
+        region = self.regions.get(image)
+        if region is not None:
+            return region
+
+        width, height = image.get_size()
+        if width > self.page_size or height > self.page_size:
+            # Too big to share a page: it gets a texture to itself
+            texture = self.texture_type.from_surface(self.renderer, image)
+            region = (texture, pygame.Rect(0, 0, width, height))
+            self.regions[image] = region
+            return region
+
+        page, spot = self.find_spot(width, height)
+        area = pygame.Rect(spot, (width, height))
+        if image.get_flags() & pygame.SRCALPHA:
+            # Copy the alpha as is rather than blending onto the empty page
+            page.surface.blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            page.surface.blit(image, area)
+        if upload:
+            page.texture.update(page.surface.subsurface(area), area)
+        region = (page.texture, area)
+        self.regions[image] = region
+        return region
+
+    def find_spot(self, width, height):
+        for page in self.pages:
+            spot = page.place(width, height, self.PADDING)
+            if spot is not None:
+                return page, spot
+        page = AtlasPage(self.renderer, self.page_size, self.texture_type)
+        self.pages.append(page)
+        return page, page.place(width, height, self.PADDING)
@@ -0,0 +1,116 @@
+"""
+World canvas - the world drawn at a fraction of the window size, then upscaled
+"""
+import math
+import weakref
+import pygame
+from config import *
+
+
+class WorldCanvas:
+    """What entities draw the world onto.
+
+    Callers use window coordinates and the same arguments as pygame.draw.
+    The canvas scales positions and sizes to its own surface, which can be
+    smaller than the window to save fill rate. present() then stretches it
+    over the window in a single scale call. At scale 1 it's a thin layer
+    over the usual pygame.draw calls.
+    """
+
+    def __init__(self, width, height, scale=1.0, smooth=RENDER_SMOOTH, surface=None):
+        self.width = width
+        self.height = height
+        self.smooth = smooth
+        self.target = surface  # draw straight onto this instead (scale 1 only)
+        self.upscaled = None   # full-size buffer for presenting with an offset
+        self.scale = None
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        """Switch to a new resolution scale, dropping the cached images."""
+        if scale == self.scale:
+            return
+        if self.target is not None and scale != 1:
+            raise ValueError("a canvas over an existing surface can't be scaled")
+
+        self.scale = scale
+        if self.target is not None:
+            self.surface = self.target
+        else:
+            self.surface = pygame.Surface((max(1, round(self.width * scale)),
+                                           max(1, round(self.height * scale))))
+        self.images = weakref.WeakKeyDictionary()  # image -> copy at this scale
+
+    def fill(self, color):
+        self.surface.fill(color)
+
+    def circle(self, color, center, radius, width=0):
+        s = self.scale
+        pygame.draw.circle(self.surface, color, (center[0] * s, center[1] * s),
+                           max(1, radius * s), width and max(1, round(width * s)))
+
+    def rect(self, color, rect, width=0, border_radius=0):
+        pygame.draw.rect(self.surface, color, self.scale_rect(rect),
+                         width and max(1, round(width * self.scale)),
+                         round(border_radius * self.scale))
+
+    def line(self, color, start, end, width=1):
+        s = self.scale
+        pygame.draw.line(self.surface, color, (start[0] * s, start[1] * s),
+                         (end[0] * s, end[1] * s), max(1, round(width * s)))
+
+    def lines(self, color, closed, points, width=1):
+        s = self.scale
+        pygame.draw.lines(self.surface, color, closed,
+                          [(x * s, y * s) for x, y in points], max(1, round(width * s)))
+
+    def scaled(self, image):
+        """image at the canvas scale (made once per image and scale)."""
+        s = self.scale
+        if s == 1:
+            return image
+        scaled = self.images.get(image)
+        if scaled is None:
+            # Round up so tiled images still meet without gaps
+            width, height = image.get_size()
+            scaled = pygame.transform.scale(
+                image, (math.ceil(width * s), math.ceil(height * s)))
+            self.images[image] = scaled
+        return scaled
+
+    def blit(self, image, dest):
+        """Draw an image with its top-left at dest (a point or a rect)."""
+        s = self.scale
+        self.surface.blit(self.scaled(image), (round(dest[0] * s), round(dest[1] * s)))
+
+    def blits(self, image, points):
+        """Draw one image at many top-left points in a single call."""
+        s = self.scale
+        image = self.scaled(image)
+        self.surface.blits([(image, (round(x * s), round(y * s))) for x, y in points],
+                           doreturn=False)
+
+    def scale_rect(self, rect):
+        """A window-space rect in canvas pixels; nothing non-empty shrinks to zero."""
+        x, y, width, height = rect
+        s = self.scale
+        return (round(x * s), round(y * s),
+                width and max(1, round(width * s)), height and max(1, round(height * s)))
+
+    def present(self, screen, offset=(0, 0)):
+        """Put the finished world on the screen, stretched back to window size."""
+        if self.surface is screen:
+            return
+        if self.scale == 1:
+            screen.blit(self.surface, offset)
+            return
+
+        stretch = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+        size = (self.width, self.height)
+        if offset == (0, 0) and screen.get_size() == size:
+            stretch(self.surface, size, screen)
+            return
+        if self.upscaled is None:
+            self.upscaled = pygame.Surface(size)
+        stretch(self.surface, size, self.upscaled)
+        screen.blit(self.upscaled, offset)
@@ -0,0 +1,84 @@
+"""
+Renderers - how a finished frame gets to the window
+"""
+import pygame
+from config import *
+from render.canvas import WorldCanvas
+
+
+class Renderer:
+    """What the game draws a frame through.
+
+    A frame goes begin_frame(), then begin_world() for the canvas the world
+    is drawn on, end_world() to put it in the window with a shake offset,
+    then HUD and menus on screen (a window-sized Surface) and flip().
+    """
+
+    name = None
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.screen = None  # Surface the HUD and menus draw on
+        self.world = None   # canvas the world draws on
+
+    def bake(self, images):
+        """Hint that these images will be drawn often (sprite frames, tiles)."""
+
+    def baking(self, images):
+        """bake() as a job: a generator that bakes one image per step."""
+        return iter(())
+
+    def begin_frame(self):
+        raise NotImplementedError
+
+    def begin_world(self, scale):
+        """The world canvas, at this render scale."""
+        self.world.set_scale(scale)
+        return self.world
+
+    def end_world(self, offset=(0, 0)):
+        raise NotImplementedError
+
+    def flip(self):
+        raise NotImplementedError
+
+    def screenshot(self):
+        """The last finished frame as a Surface."""
+        raise NotImplementedError
+
+
+class SurfaceRenderer(Renderer):
+    """Software drawing onto the display surface, shown with display.flip()."""
+
+    name = 'surface'
+
+    def __init__(self, width, height, title, scale=1.0):
+        super().__init__(width, height)
+        self.screen = pygame.display.set_mode((width, height))
+        pygame.display.set_caption(title)
+        self.world = WorldCanvas(width, height, scale)
+
+    def begin_frame(self):
+        self.screen.fill(COLOR_BG)
+
+    def end_world(self, offset=(0, 0)):
+        self.world.present(self.screen, offset)
+
+    def flip(self):
+        pygame.display.flip()
+
+    def screenshot(self):
+        return self.screen.copy()
+
+
+def create_renderer(backend, width, height, title, scale=1.0,
+                    accelerated=RENDER_ACCELERATED):
+    """A renderer for backend, falling back to 'surface' if SDL2 rendering fails."""
+    if backend == 'texture':
+        try:
+            from render.texture_renderer import TextureRenderer
+            return TextureRenderer(width, height, title, scale, accelerated)
+        except (ImportError, RuntimeError, pygame.error) as e:
+            print(f"Warning: Texture renderer unavailable, using surfaces: {e}")
+    return SurfaceRenderer(width, height, title, scale)
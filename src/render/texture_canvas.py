@@ -0,0 +1,194 @@
+"""
+Texture canvas - the world drawn as texture copies by an SDL2 renderer
+"""
+import math
+import weakref
+import pygame
+from config import *
+
+
+class TextureCanvas:
+    """WorldCanvas's drawing calls, done as copies from a texture atlas.
+
+    Shapes are copies too: circles use white disc and ring stamps baked
+    into the atlas, rects and lines stretch a single white texel, and the
+    texture's color mod tints them. With nearly everything coming from one
+    texture, SDL can batch a frame's copies into a few draw calls. The
+    world is drawn onto a target texture at the render scale and stretched
+    over the window by the GPU in present().
+    """
+
+    def __init__(self, renderer, atlas, width, height, scale=1.0):
+        self.renderer = renderer
+        self.atlas = atlas
+        self.width = width
+        self.height = height
+        self.transient = weakref.WeakKeyDictionary()  # unbaked image -> Texture
+
+        # Plain white pixels to stretch into rects and lines (the middle
+        # one, so smoothed sampling never reaches the padding)
+        self.white = pygame.Surface((3, 3), pygame.SRCALPHA)
+        self.white.fill((255, 255, 255, 255))
+        self.stamps = {}  # (radius, width) -> Surface, kept alive for the atlas
+        self.atlas.bake([self.white] + [self.stamp_surface(radius, width)
+                                        for radius in range(1, CIRCLE_STAMP_MAX + 1)
+                                        for width in range(4) if width < radius])
+        texture, area = self.atlas.get(self.white)
+        self.pixel = (texture, pygame.Rect(area.x + 1, area.y + 1, 1, 1))
+
+        self.scale = None
+        self.texture = None
+        self.set_scale(scale)
+
+    def stamp_surface(self, radius, width):
+        """A white disc (width 0) or ring of the given radius."""
+        surface = self.stamps.get((radius, width))
+        if surface is None:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            pygame.draw.circle(surface, (255, 255, 255), (radius, radius), radius, width)
+            self.stamps[(radius, width)] = surface
+        return surface
+
+    def set_scale(self, scale):
+        """Switch to a new resolution scale (a new target texture)."""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        size = (max(1, round(self.width * scale)), max(1, round(self.height * scale)))
+        self.texture = self.atlas.texture_type(self.renderer, size, target=True)
+
+    def begin(self):
+        """Point the renderer at the world texture."""
+        self.renderer.target = self.texture
+
+    def copy(self, region, color, dest, angle=0, origin=None):
+        texture, area = region
+        texture.color = color
+        if angle:
+            texture.draw(area, dest, angle, origin)
+        else:
+            texture.draw(area, dest)
+
+    def fill(self, color):
+        self.renderer.draw_color = (*color[:3], 255)
+        self.renderer.clear()
+
+    def circle(self, color, center, radius, width=0):
+        s = self.scale
+        radius = max(1, round(radius * s))
+        width = width and max(1, round(width * s))
+        if width >= radius:
+            width = 0
+        x = round(center[0] * s)
+        y = round(center[1] * s)
+
+        if radius <= CIRCLE_STAMP_MAX:
+            region = self.atlas.add(self.stamp_surface(radius, width))
+            self.copy(region, color, (x - radius, y - radius, radius * 2, radius * 2))
+        elif not width:
+            # Stretch the biggest disc; its edge gets a little blocky
+            region = self.atlas.get(self.stamp_surface(CIRCLE_STAMP_MAX, 0))
+            self.copy(region, color, (x - radius, y - radius, radius * 2, radius * 2))
+        else:
+            # Big rings are polygons, with enough sides to look round
+            sides = min(128, max(24, radius // 3))
+            step = math.tau / sides
+            points = [(x + math.cos(i * step) * radius, y + math.sin(i * step) * radius)
+                      for i in range(sides + 1)]
+            for start, end in zip(points, points[1:]):
+                self.segment(color, start, end, width)
+
+    def rect(self, color, rect, width=0, border_radius=0):
+        x, y, w, h = self.scale_rect(rect)
+        if width:
+            t = max(1, round(width * self.scale))
+            for edge in ((x, y, w, t), (x, y + h - t, w, t),
+                         (x, y + t, t, h - 2 * t), (x + w - t, y + t, t, h - 2 * t)):
+                self.copy(self.pixel, color, edge)
+            return
+
+        r = min(round(border_radius * self.scale), w // 2, h // 2)
+        if r <= 0:
+            self.copy(self.pixel, color, (x, y, w, h))
+            return
+        # Rounded: a cross of rects with a disc in each corner
+        self.copy(self.pixel, color, (x + r, y, w - 2 * r, h))
+        self.copy(self.pixel, color, (x, y + r, w, h - 2 * r))
+        corner = self.atlas.add(self.stamp_surface(min(r, CIRCLE_STAMP_MAX), 0))
+        for cx, cy in ((x, y), (x + w - 2 * r, y), (x, y + h - 2 * r),
+                       (x + w - 2 * r, y + h - 2 * r)):
+            self.copy(corner, color, (cx, cy, 2 * r, 2 * r))
+
+    def line(self, color, start, end, width=1):
+        s = self.scale
+        self.segment(color, (start[0] * s, start[1] * s), (end[0] * s, end[1] * s),
+                     max(1, round(width * s)))
+
+    def lines(self, color, closed, points, width=1):
+        s = self.scale
+        points = [(x * s, y * s) for x, y in points]
+        if closed:
+            points.append(points[0])
+        width = max(1, round(width * s))
+        for start, end in zip(points, points[1:]):
+            self.segment(color, start, end, width)
+
+    def segment(self, color, start, end, width):
+        """A line in canvas pixels: the white texel stretched and rotated."""
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return
+        half = width / 2
+        self.copy(self.pixel, color,
+                  (round(start[0]), round(start[1] - half), math.ceil(length), width),
+                  math.degrees(math.atan2(dy, dx)), (0, half))
+
+    def blit(self, image, dest):
+        """Draw an image with its top-left at dest (a point or a rect)."""
+        region = self.atlas.get(image)
+        if region is None:
+            # Not baked (text, one-off surfaces): its own texture while it lives
+            texture = self.transient.get(image)
+            if texture is None:
+                texture = self.atlas.texture_type.from_surface(self.renderer, image)
+                self.transient[image] = texture
+            region = (texture, None)
+        s = self.scale
+        width, height = image.get_size()
+        self.copy(region, (255, 255, 255),
+                  (round(dest[0] * s), round(dest[1] * s),
+                   math.ceil(width * s), math.ceil(height * s)))
+
+    def blits(self, image, points):
+        """Draw one image at many top-left points."""
+        region = self.atlas.get(image)
+        if region is None:
+            for point in points:
+                self.blit(image, point)
+            return
+        texture, area = region
+        texture.color = (255, 255, 255)
+        s = self.scale
+        width = math.ceil(image.get_width() * s)
+        height = math.ceil(image.get_height() * s)
+        draw = texture.draw
+        for x, y in points:
+            draw(area, (round(x * s), round(y * s), width, height))
+
+    def scale_rect(self, rect):
+        """A window-space rect in canvas pixels; nothing non-empty shrinks to zero."""
+        x, y, width, height = rect
+        s = self.scale
+        return (round(x * s), round(y * s),
+                width and max(1, round(width * s)), height and max(1, round(height * s)))
+
+    def present(self, offset=(0, 0)):
+        """Stretch the finished world over the window, shifted by offset."""
+        renderer = self.renderer
+        renderer.target = None
+        renderer.draw_color = (*COLOR_BG, 255)
+        renderer.clear()
+        self.texture.draw(None, (offset[0], offset[1], self.width, self.height))
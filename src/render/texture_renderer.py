@@ -0,0 +1,83 @@
+"""
+Texture renderer - frames sent to the window as SDL2 texture copies
+"""
+import os
+import pygame
+from pygame._sdl2 import video
+from config import *
+from render.renderer import Renderer
+from render.atlas import TextureAtlas
+from render.texture_canvas import TextureCanvas
+
+
+class TextureRenderer(Renderer):
+    """An SDL2 Renderer on its own window, drawing from uploaded textures.
+
+    accelerated=-1 takes a GPU driver when there is one and SDL's software
+    renderer otherwise; 0 forces the software renderer (no GPU needed, so
+    it also runs under the dummy video driver). The world goes through a
+    TextureCanvas. HUD and menus are still drawn with pygame onto a
+    transparent window-sized Surface, uploaded once per frame and laid
+    over the world.
+    """
+
+    name = 'texture'
+
+    def __init__(self, width, height, title, scale=1.0, accelerated=RENDER_ACCELERATED,
+                 smooth=RENDER_SMOOTH):
+        super().__init__(width, height)
+        # SDL reads these hints from the environment: group copies of the
+        # same texture into one draw call, and pick how stretched textures
+        # are sampled
+        os.environ.setdefault('SDL_RENDER_BATCHING', '1')
+        os.environ['SDL_RENDER_SCALE_QUALITY'] = 'linear' if smooth else 'nearest'
+
+        self.window = video.Window(title, (width, height))
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=accelerated,
+                                           target_texture=True)
+        except video.error:
+            self.window.destroy()
+            raise
+
+        self.atlas = TextureAtlas(self.renderer, video.Texture, ATLAS_PAGE_SIZE)
+        self.world = TextureCanvas(self.renderer, self.atlas, width, height, scale)
+        self.screen = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.overlay = video.Texture(self.renderer, (width, height), streaming=True)
+        self.overlay.blend_mode = 1  # SDL_BLENDMODE_BLEND
+        self.world_drawn = False
+
+    def bake(self, images):
+        self.atlas.bake(images)
+
+    def baking(self, images):
+        for image in images:
+            self.atlas.add(image)
+            yield
+
+    def begin_frame(self):
+        self.screen.fill((0, 0, 0, 0))
+        self.world_drawn = False
+
+    def begin_world(self, scale):
+        world = super().begin_world(scale)
+        world.begin()
+        return world
+
+    def end_world(self, offset=(0, 0)):
+        self.world.present(offset)
+        self.world_drawn = True
+
+    def flip(self):
+        renderer = self.renderer
+        if not self.world_drawn:
+            # Menus only: nothing under the overlay
+            renderer.target = None
+            renderer.draw_color = (*COLOR_BG, 255)
+            renderer.clear()
+        self.overlay.update(self.screen)
+        self.overlay.draw()
+        renderer.present()
+
+    def screenshot(self):
+        return self.renderer.to_surface()
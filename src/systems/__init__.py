@@ -1,4 +1,4 @@
 """Game systems"""
 from .experience import ExperienceSystem
 from .spawner import ZombieSpawner
-from .particles import VoidParticle
+from .particles import DeathParticle
@@ -0,0 +1,203 @@
+"""
+Audio - event-driven sound effects from a preloaded bank on a fixed channel pool
+"""
+import math
+import random
+from array import array
+import pygame
+from config import *
+from systems.events import Kill, Damage, LevelUp, BossSpawn, BossPhase, PlayerHit, Shot
+
+
+# name -> (volume, max voices at once, priority, synth settings).
+# Synth settings: (start Hz, end Hz, seconds, wave, decay per second)
+SOUND_BANK = {
+    'shot':        (0.20, 3, 1, (880, 440, 0.06, 'square', 30)),
+    'hit':         (0.18, 4, 1, (220, 160, 0.05, 'noise', 40)),
+    'kill':        (0.30, 4, 2, (320, 60, 0.18, 'noise', 14)),
+    'player_hurt': (0.55, 1, 4, (180, 90, 0.25, 'square', 8)),
+    'level_up':    (0.60, 1, 5, (440, 1320, 0.45, 'sine', 3)),
+    'boss_roar':   (0.80, 1, 6, (90, 40, 1.20, 'square', 1.5)),
+    'boss_death':  (0.90, 1, 6, (400, 30, 1.00, 'noise', 2)),
+}
+
+
+def synthesize(start_hz, end_hz, seconds, wave, decay, rate, seed=0):
+    """16-bit mono samples of a swept tone (or noise) with an exponential fade."""
+    noise = random.Random(seed)
+    count = int(seconds * rate)
+    sweep = (end_hz - start_hz) / count
+    fade = math.exp(-decay / rate)  # envelope multiplier per sample
+    sin, tau = math.sin, math.tau
+
+    samples = [0] * count
+    phase = 0.0
+    envelope = 30000.0
+    cycle = -1
+    level = 0.0
+    for i in range(count):
+        phase += (start_hz + sweep * i) / rate
+        if wave == 'sine':
+            value = sin(phase * tau)
+        elif wave == 'square':
+            value = 1.0 if phase % 1 < 0.5 else -1.0
+        else:
+            # Noise held for one cycle of the sweep, so it still has a pitch
+            if int(phase) != cycle:
+                cycle = int(phase)
+                level = noise.uniform(-1, 1)
+            value = level
+        samples[i] = int(value * envelope)
+        envelope *= fade
+    return array('h', samples)
+
+
+class Voice:
+    """A sound playing on one pool channel."""
+    __slots__ = ('channel', 'name', 'priority', 'started')
+
+    def __init__(self, channel, name, priority, started):
+        self.channel = channel
+        self.name = name
+        self.priority = priority
+        self.started = started
+
+
+class AudioManager:
+    """Plays sound effects for gameplay events.
+
+    Handlers only count what happened. flush() then plays each sound at
+    most once per frame, louder when several fired together. A sound that
+    is already at its voice limit cuts off its own oldest voice. When the
+    pool is full, the new sound steals a channel from the lowest-priority
+    voice, or is dropped if everything playing outranks it.
+    """
+
+    def __init__(self, events, enabled=AUDIO_ENABLED, channels=AUDIO_CHANNELS):
+        self.enabled = enabled and self.init_mixer()
+        self.pending = {}  # sound name -> times it was asked for this frame
+        self.voices = []
+        self.frame = 0
+        self.played = 0
+        self.merged = 0    # requests folded into another playback
+        self.dropped = 0   # requests with no channel to play on
+
+        if self.enabled:
+            pygame.mixer.set_num_channels(channels)
+            self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+            self.sounds = self.load_bank()
+
+        events.subscribe(Shot, self.on_shots)
+        events.subscribe(Damage, self.on_damage)
+        events.subscribe(Kill, self.on_kills)
+        events.subscribe(PlayerHit, self.on_player_hit)
+        events.subscribe(LevelUp, self.on_level_up)
+        events.subscribe(BossSpawn, self.on_boss_spawn)
+        events.subscribe(BossPhase, self.on_boss_spawn)
+
+    @staticmethod
+    def init_mixer():
+        """Start the mixer if nobody has yet. False if there's no audio device."""
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init(AUDIO_SAMPLE_RATE, -16, 1, AUDIO_BUFFER)
+        except pygame.error as e:
+            print(f"Warning: Audio disabled: {e}")
+            return False
+        return True
+
+    def load_bank(self):
+        """Render every sound once, in whatever format the mixer ended up with."""
+        rate, _, channels = pygame.mixer.get_init()
+        sounds = {}
+        for seed, (name, (_, _, _, synth)) in enumerate(SOUND_BANK.items()):
+            samples = synthesize(*synth, rate, seed)
+            if channels > 1:
+                samples = array('h', (s for s in samples for _ in range(channels)))
+            sounds[name] = pygame.mixer.Sound(buffer=samples.tobytes())
+        return sounds
+
+    def request(self, name, count=1):
+        """Ask for a sound this frame; repeats are merged in flush()."""
+        self.pending[name] = self.pending.get(name, 0) + count
+
+    def on_shots(self, events):
+        self.request('shot', sum(event.count for event in events))
+
+    def on_damage(self, events):
+        self.request('hit', len(events))
+
+    def on_kills(self, events):
+        for event in events:
+            self.request('boss_death' if event.boss else 'kill')
+
+    def on_player_hit(self, events):
+        self.request('player_hurt', len(events))
+
+    def on_level_up(self, events):
+        self.request('level_up')
+
+    def on_boss_spawn(self, events):
+        self.request('boss_roar')  # also when it changes phase
+
+    def flush(self):
+        """Play this frame's sounds, one playback per sound."""
+        self.frame += 1
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = {}
+        if not self.enabled:
+            return
+
+        # Forget voices whose sound has finished
+        self.voices = [voice for voice in self.voices if voice.channel.get_busy()]
+
+        # Most important first, so they get channels before anything is dropped
+        for name in sorted(pending, key=lambda name: -SOUND_BANK[name][2]):
+            count = pending[name]
+            volume, max_voices, priority, _ = SOUND_BANK[name]
+            self.merged += count - 1
+
+            # More of the same at once plays louder, not more often
+            volume = min(1.0, volume * (1 + AUDIO_MERGE_BOOST * math.log2(count)))
+
+            channel = self.find_channel(name, max_voices, priority)
+            if channel is None:
+                self.dropped += 1
+                continue
+            channel.play(self.sounds[name])
+            channel.set_volume(volume)
+            self.voices.append(Voice(channel, name, priority, self.frame))
+            self.played += 1
+
+    def find_channel(self, name, max_voices, priority):
+        """A channel for a new voice of name, cutting off an older one if needed."""
+        own = [voice for voice in self.voices if voice.name == name]
+        if len(own) >= max_voices:
+            return self.steal(min(own, key=lambda voice: voice.started))
+
+        busy = {voice.channel for voice in self.voices}
+        for channel in self.channels:
+            if channel not in busy:
+                return channel
+
+        # Pool is full: take over the least important, oldest voice
+        victim = min(self.voices, key=lambda voice: (voice.priority, voice.started))
+        if victim.priority > priority:
+            return None
+        return self.steal(victim)
+
+    def steal(self, voice):
+        voice.channel.stop()
+        self.voices.remove(voice)
+        return voice.channel
+
+    def stop(self):
+        """Silence everything (new run)."""
+        self.pending.clear()
+        if self.enabled:
+            for voice in self.voices:
+                voice.channel.stop()
+        self.voices.clear()
@@ -0,0 +1,59 @@
+"""
+Swept collision - continuous hit tests for fast projectiles
+"""
+import math
+
+
+def sweep_rect(x0, y0, dx, dy, rect, pad):
+    """When a point moving from (x0, y0) by (dx, dy) enters a rect grown by pad.
+
+    Returns the entry time as a fraction of the move (0..1), or None if the
+    path misses.  A point already inside enters at 0.
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for start, delta, low, high in ((x0, dx, rect.left - pad, rect.right + pad),
+                                    (y0, dy, rect.top - pad, rect.bottom + pad)):
+        if delta == 0:
+            if start < low or start > high:
+                return None
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        if t_low > t_enter:
+            t_enter = t_low
+        if t_high < t_exit:
+            t_exit = t_high
+        if t_enter > t_exit:
+            return None
+    return t_enter
+
+
+def swept_hits(grid, x0, y0, x1, y1, pad):
+    """Entities a moving point of radius pad touches between two positions.
+
+    Only the grid cells the path crosses are searched.  Returns
+    (entry time, entity) pairs in the order they are hit.
+    """
+    if grid.stale:
+        grid.rebuild()  # so max_half_size is current
+
+    dx = x1 - x0
+    dy = y1 - y0
+    length = math.hypot(dx, dy)
+    if length == 0:
+        candidates = grid.query_radius(x1, y1, pad + grid.max_half_size)
+    else:
+        # Widen the beam so square corners sticking out toward the path count
+        width = 2 * pad + grid.max_half_size
+        candidates = [entity for _, entity in
+                      grid.query_ray(x0, y0, dx / length, dy / length, length, width)]
+
+    hits = []
+    for entity in candidates:
+        t = sweep_rect(x0, y0, dx, dy, entity.rect, pad)
+        if t is not None:
+            hits.append((t, entity))
+    hits.sort(key=lambda hit: hit[0])
+    return hits
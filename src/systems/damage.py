@@ -0,0 +1,54 @@
+"""
+Damage buffer - every hit in a frame is recorded, then applied in one batch
+"""
+from systems.events import Damage
+
+
+class DamageBuffer:
+    """Collects (target, amount, source) hits and resolves them together.
+
+    Weapons and bullets only record hits; nothing dies mid-frame, so every
+    damage source sees the same horde and deaths are handled in one place.
+    The damage queued against each target is tallied, so a bullet can pass
+    over a zombie that this frame's hits will already kill.
+    """
+
+    def __init__(self, immediate=False):
+        self.records = []
+        self.pending = {}  # target -> damage queued against it
+        self.immediate = immediate  # apply hits as they are dealt (no game loop to resolve them)
+
+    def deal(self, target, amount, source=None):
+        """Record a hit on a target."""
+        if self.immediate:
+            target.take_damage(amount)
+        else:
+            self.records.append((target, amount, source))
+            self.pending[target] = self.pending.get(target, 0) + amount
+
+    def pending_lethal(self, target):
+        """True if the hits queued so far will kill the target."""
+        return self.pending.get(target, 0) >= target.health
+
+    def apply(self, events=None):
+        """Apply every recorded hit and return the targets that died.
+
+        Hits on a target that already died earlier in the batch are dropped.
+        """
+        records = self.records
+        self.records = []
+        self.pending = {}
+
+        dead = []
+        for target, amount, source in records:
+            if not target.alive:
+                continue
+            if events is not None:
+                events.emit(Damage(target, amount, source))
+            if target.take_damage(amount):
+                dead.append(target)
+        return dead
+
+    def clear(self):
+        self.records.clear()
+        self.pending.clear()
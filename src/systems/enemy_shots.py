@@ -0,0 +1,148 @@
+"""
+Enemy shots - the boss's bullet patterns, kept as parallel lists
+"""
+import math
+from functools import lru_cache
+import pygame
+from config import *
+
+
+# Pattern names; a shot's kind is its pattern's index here
+PATTERNS = ('radial', 'spiral', 'fan')
+PATTERN_COLORS = ((255, 90, 90), (255, 160, 60), (230, 80, 255))
+
+# Unit vectors for ENEMY_SHOT_ANGLES evenly spaced directions. Patterns
+# are lists of indices into these, so firing never calls trig per bullet.
+ANGLE_COS = tuple(math.cos(i * math.tau / ENEMY_SHOT_ANGLES) for i in range(ENEMY_SHOT_ANGLES))
+ANGLE_SIN = tuple(math.sin(i * math.tau / ENEMY_SHOT_ANGLES) for i in range(ENEMY_SHOT_ANGLES))
+
+
+def angle_index(dx, dy):
+    """The table direction closest to (dx, dy)."""
+    return round(math.atan2(dy, dx) * ENEMY_SHOT_ANGLES / math.tau) % ENEMY_SHOT_ANGLES
+
+
+@lru_cache(maxsize=None)
+def _ring(count):
+    return tuple(i * ENEMY_SHOT_ANGLES // count for i in range(count))
+
+
+def radial(count, offset=0):
+    """count directions spaced evenly around a circle, turned by offset steps."""
+    return [(d + offset) % ENEMY_SHOT_ANGLES for d in _ring(count)]
+
+
+def fan(count, center, step=ENEMY_FAN_STEP):
+    """count directions step apart, centered on the center direction."""
+    first = center - (count - 1) * step // 2
+    return [(first + i * step) % ENEMY_SHOT_ANGLES for i in range(count)]
+
+
+class EnemyShots:
+    """Every hostile projectile, as one list per field instead of one object each.
+
+    Moving them is a list comprehension per axis, and hitting the player is
+    a single pass over the positions against the player's rect grown by
+    the shot radius; only shots inside that get the exact circle test.
+    """
+
+    def __init__(self, capacity=ENEMY_SHOT_CAPACITY, radius=ENEMY_SHOT_RADIUS):
+        self.capacity = capacity
+        self.radius = radius
+        self.xs = []
+        self.ys = []
+        self.vxs = []
+        self.vys = []
+        self.kinds = []
+        self.dropped = 0  # shots that didn't fit under capacity
+        self.sprites = [self.render_sprite(color) for color in PATTERN_COLORS]
+
+    def render_sprite(self, color):
+        """One shot: a soft glow around a bright core."""
+        r = self.radius
+        size = (r + 3) * 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, 90), (size // 2, size // 2), r + 3)
+        pygame.draw.circle(sprite, color, (size // 2, size // 2), r)
+        pygame.draw.circle(sprite, (255, 255, 255), (size // 2, size // 2), r // 2)
+        return sprite
+
+    def __len__(self):
+        return len(self.xs)
+
+    def clear(self):
+        for store in (self.xs, self.ys, self.vxs, self.vys, self.kinds):
+            store.clear()
+
+    def fire(self, x, y, directions, speed, kind):
+        """Add one shot from (x, y) per angle table index in directions."""
+        room = self.capacity - len(self.xs)
+        if room < len(directions):
+            self.dropped += len(directions) - max(0, room)
+            if room <= 0:
+                return
+            directions = directions[:room]
+        count = len(directions)
+        self.xs.extend([x] * count)
+        self.ys.extend([y] * count)
+        self.vxs.extend([ANGLE_COS[d] * speed for d in directions])
+        self.vys.extend([ANGLE_SIN[d] * speed for d in directions])
+        self.kinds.extend([kind] * count)
+
+    def update(self, dt, target, width, height):
+        """Move every shot and drop those off screen or inside the target rect.
+
+        Returns how many shots hit the target.
+        """
+        xs = self.xs = [x + vx * dt for x, vx in zip(self.xs, self.vxs)]
+        ys = self.ys = [y + vy * dt for y, vy in zip(self.ys, self.vys)]
+        if not xs:
+            return 0
+
+        r = self.radius
+        left, right = target.left - r, target.right + r
+        top, bottom = target.top - r, target.bottom + r
+        near = [i for i, (x, y) in enumerate(zip(xs, ys))
+                if left < x < right and top < y < bottom]
+
+        # Corners of the grown rect are further than r from the real one
+        hits = set()
+        for i in near:
+            dx = xs[i] - max(target.left, min(xs[i], target.right))
+            dy = ys[i] - max(target.top, min(ys[i], target.bottom))
+            if dx * dx + dy * dy < r * r:
+                hits.add(i)
+
+        m = ENEMY_SHOT_MARGIN
+        if hits or min(xs) < -m or max(xs) > width + m or min(ys) < -m or max(ys) > height + m:
+            keep = [i for i, (x, y) in enumerate(zip(xs, ys))
+                    if -m < x < width + m and -m < y < height + m and i not in hits]
+            self.xs = [xs[i] for i in keep]
+            self.ys = [ys[i] for i in keep]
+            self.vxs = [self.vxs[i] for i in keep]
+            self.vys = [self.vys[i] for i in keep]
+            self.kinds = [self.kinds[i] for i in keep]
+        return len(hits)
+
+    def draw(self, canvas):
+        """Draw every shot, one batch of blits per pattern color."""
+        half = self.sprites[0].get_width() // 2
+        batches = [[] for _ in self.sprites]
+        for x, y, kind in zip(self.xs, self.ys, self.kinds):
+            batches[kind].append((x - half, y - half))
+        for sprite, points in zip(self.sprites, batches):
+            if points:
+                canvas.blits(sprite, points)
+
+    def pack(self):
+        """Flat (x, y, vx, vy, kind) values for a snapshot."""
+        return [value for shot in zip(self.xs, self.ys, self.vxs, self.vys, self.kinds)
+                for value in shot]
+
+    def restore(self, values):
+        """Load values written by pack()."""
+        self.xs = list(values[0::5])
+        self.ys = list(values[1::5])
+        self.vxs = list(values[2::5])
+        self.vys = list(values[3::5])
+        self.kinds = [int(kind) for kind in values[4::5]]
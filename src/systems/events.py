@@ -0,0 +1,241 @@
+"""
+Event bus - gameplay events batched per frame, with off-thread sinks
+"""
+import sys
+import time
+import queue
+import threading
+from collections import defaultdict, Counter
+
+
+class Event:
+    """Base class for gameplay events."""
+    __slots__ = ()
+
+    def describe(self):
+        """One-line text for the log, or None to keep it out of the log."""
+        return None
+
+
+class Kill(Event):
+    """A zombie or the boss died."""
+    __slots__ = ('x', 'y', 'color', 'exp_value', 'boss')
+
+    def __init__(self, x, y, color, exp_value, boss=False):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.exp_value = exp_value
+        self.boss = boss
+
+    def describe(self):
+        return "BOSS DEFEATED!" if self.boss else None
+
+
+class Damage(Event):
+    """Something took damage."""
+    __slots__ = ('target', 'amount', 'source')
+
+    def __init__(self, target, amount, source=None):
+        self.target = target
+        self.amount = amount
+        self.source = source
+
+
+class Shot(Event):
+    """A weapon fired projectiles."""
+    __slots__ = ('weapon', 'count')
+
+    def __init__(self, weapon, count):
+        self.weapon = weapon
+        self.count = count
+
+
+class LevelUp(Event):
+    """The player reached a new level."""
+    __slots__ = ('level',)
+
+    def __init__(self, level):
+        self.level = level
+
+    def describe(self):
+        return f"Level up! Now level {self.level}"
+
+
+class BossSpawn(Event):
+    """The boss entered the arena."""
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def describe(self):
+        return "⚠️  BOSS INCOMING! ⚠️"
+
+
+class HordeIncoming(Event):
+    """A horde event started spawning."""
+    __slots__ = ('count',)
+
+    def __init__(self, count):
+        self.count = count
+
+    def describe(self):
+        return f"A horde of {self.count} zombies is closing in!"
+
+
+class BossPhase(Event):
+    """The boss was hurt enough to change its attacks."""
+    __slots__ = ('phase',)
+
+    def __init__(self, phase):
+        self.phase = phase
+
+    def describe(self):
+        return f"The boss enters phase {self.phase + 1}!"
+
+
+class PlayerHit(Event):
+    """The player was hurt by an enemy."""
+    __slots__ = ('damage', 'shake', 'fatal')
+
+    def __init__(self, damage, shake, fatal=False):
+        self.damage = damage
+        self.shake = shake
+        self.fatal = fatal
+
+
+class QualityChange(Event):
+    """The quality governor switched levels."""
+    __slots__ = ('old', 'new', 'average_ms', 'budget_ms')
+
+    def __init__(self, old, new, average_ms, budget_ms):
+        self.old = old
+        self.new = new
+        self.average_ms = average_ms
+        self.budget_ms = budget_ms
+
+    def describe(self):
+        reason = "over" if self.average_ms > self.budget_ms else "under"
+        return (f"Quality {self.old} -> {self.new} "
+                f"(avg {self.average_ms:.1f}ms {reason} {self.budget_ms:.1f}ms budget)")
+
+
+class EventBus:
+    """Collects events during a frame and dispatches them in one batch."""
+
+    def __init__(self):
+        self.handlers = defaultdict(list)
+        self.sinks = []
+        self.pending = []
+
+    def subscribe(self, event_type, handler):
+        """Call handler(events) with every batch of this event type."""
+        self.handlers[event_type].append(handler)
+
+    def add_sink(self, sink):
+        """Send every batch to a sink (usually running on another thread)."""
+        self.sinks.append(sink)
+
+    def emit(self, event):
+        self.pending.append(event)
+
+    def dispatch(self):
+        """Hand this frame's events to their handlers, grouped by type."""
+        while self.pending:
+            batch = self.pending
+            self.pending = []
+
+            by_type = defaultdict(list)
+            for event in batch:
+                by_type[type(event)].append(event)
+            for event_type, events in by_type.items():
+                for handler in self.handlers.get(event_type, ()):
+                    handler(events)
+
+            # Handlers may emit follow-up events; those go out in the next pass
+            for sink in self.sinks:
+                sink.submit(batch)
+
+    def clear(self):
+        self.pending.clear()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class QueueSink:
+    """Drains event batches on a background thread so the frame never waits."""
+
+    def __init__(self):
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, batch):
+        self.queue.put(batch)
+
+    def _run(self):
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                break
+            self.process(batch)
+        self.flush()
+
+    def process(self, batch):
+        """Handle one batch of events (on the sink thread)."""
+        raise NotImplementedError("Subclasses must implement process()")
+
+    def flush(self):
+        """Called once on the sink thread when it shuts down."""
+        pass
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join(timeout=1.0)
+
+
+class LogSink(QueueSink):
+    """Writes readable events to a stream."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        super().__init__()
+
+    def process(self, batch):
+        stream = self.stream or sys.stdout
+        for event in batch:
+            text = event.describe()
+            if text:
+                print(text, file=stream)
+        stream.flush()
+
+
+class TelemetrySink(QueueSink):
+    """Counts events by type and appends a JSON line per interval to a file."""
+
+    def __init__(self, path, interval=10.0):
+        self.path = path
+        self.interval = interval
+        self.counts = Counter()
+        self.last_write = time.time()
+        super().__init__()
+
+    def process(self, batch):
+        for event in batch:
+            self.counts[type(event).__name__] += 1
+        if time.time() - self.last_write >= self.interval:
+            self.flush()
+
+    def flush(self):
+        import json  # only loaded when telemetry is on
+        if not self.counts:
+            return
+        with open(self.path, 'a') as telemetry_file:
+            telemetry_file.write(json.dumps({'time': time.time(),
+                                             'counts': dict(self.counts)}) + '\n')
+        self.counts.clear()
+        self.last_write = time.time()
@@ -8,6 +8,10 @@ class ExperienceSystem:
     """Manages player experience and level ups."""
     
     def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Start over at level 1."""
         self.level = 1
         self.current_exp = 0
         self.exp_to_next_level = EXP_TO_LEVEL
@@ -0,0 +1,133 @@
+"""
+Gravity wells - singularities opened by the boss that pull everything in
+"""
+import math
+import pygame
+from config import *
+
+
+class GravityWell:
+    """One open singularity."""
+    __slots__ = ('x', 'y', 'radius', 'strength', 'duration', 'time_left')
+
+    def __init__(self, x, y, radius, strength, duration):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.strength = strength
+        self.duration = duration
+        self.time_left = duration
+
+    @property
+    def fade(self):
+        """0..1 ramp as the well opens and collapses."""
+        return max(0.0, min(1.0, self.time_left / 0.5,
+                            (self.duration - self.time_left) / 0.5))
+
+
+class GravityField:
+    """Every open well, applied to all entity stores once per frame."""
+
+    # Bullets and particles are pulled through their velocity so they curve in
+    VELOCITY_GAIN = 3.0
+
+    def __init__(self):
+        self.wells = []
+        self.spin = 0  # drives the inward-rippling rings
+
+    def open(self, x, y, radius=GRAVITY_WELL_RADIUS, strength=GRAVITY_WELL_STRENGTH,
+             duration=GRAVITY_WELL_DURATION):
+        self.wells.append(GravityWell(x, y, radius, strength, duration))
+
+    def clear(self):
+        self.wells.clear()
+
+    def update(self, dt, zombie_grid, bullets, gems, particles):
+        """Age the wells and pull every store toward them."""
+        self.spin += dt
+        for well in self.wells:
+            well.time_left -= dt
+        self.wells = [well for well in self.wells if well.time_left > 0]
+        if not self.wells:
+            return
+
+        field = [(well.x, well.y, well.radius, well.radius * well.radius,
+                  well.strength * well.fade) for well in self.wells]
+
+        self.pull_zombies(field, zombie_grid, dt)
+        pull_points(gems, field, dt, velocity=False)
+        pull_points(bullets, field, dt * self.VELOCITY_GAIN, velocity=True)
+        pull_points(particles, field, dt * self.VELOCITY_GAIN, velocity=True)
+
+    def pull_zombies(self, field, zombie_grid, dt):
+        """Drag zombies in range; the grid keeps this to the zombies inside a well."""
+        core = GRAVITY_WELL_CORE
+        for wx, wy, radius, _, strength in field:
+            for zombie in zombie_grid.query_radius(wx, wy, radius):
+                rect = zombie.rect
+                dx = wx - rect.centerx
+                dy = wy - rect.centery
+                dist = math.hypot(dx, dy)
+                if core < dist < radius:
+                    pull = strength * (1 - dist / radius) * dt / dist
+                    rect.x += round(dx * pull)
+                    rect.y += round(dy * pull)
+
+    def draw(self, canvas, glow=True):
+        """Draw each well as a dark core with rings rippling inward."""
+        core = GRAVITY_WELL_CORE
+        for well in self.wells:
+            fade = well.fade
+            center = (int(well.x), int(well.y))
+
+            if glow:
+                for ring in range(3):
+                    progress = (self.spin * 0.6 + ring / 3) % 1
+                    ring_radius = int(well.radius * fade * (1 - progress))
+                    if ring_radius > core * 2:
+                        shade = int(140 * progress * fade)
+                        canvas.circle((shade // 2, shade // 5, shade),
+                                    center, ring_radius, 1)
+
+            core_radius = max(1, int(core * 2 * fade))
+            canvas.circle((5, 0, 10), center, core_radius)
+            canvas.circle((160, 60, 220), center, core_radius, 2)
+
+
+def pull_points(entities, field, scale, velocity):
+    """Sum the pull of every well on each entity with x/y attributes.
+
+    Wells are pre-flattened into tuples and each entity is rejected with a
+    bounding-box test before any square root, so entities outside every
+    well cost a couple of comparisons.
+    """
+    sqrt = math.sqrt
+    core_sq = GRAVITY_WELL_CORE * GRAVITY_WELL_CORE
+
+    for entity in entities:
+        x = entity.x
+        y = entity.y
+        force_x = force_y = 0.0
+
+        for wx, wy, radius, radius_sq, strength in field:
+            dx = wx - x
+            if dx > radius or dx < -radius:
+                continue
+            dy = wy - y
+            if dy > radius or dy < -radius:
+                continue
+            dist_sq = dx * dx + dy * dy
+            if dist_sq >= radius_sq or dist_sq <= core_sq:
+                continue
+            dist = sqrt(dist_sq)
+            pull = strength * (1 - dist / radius) / dist
+            force_x += dx * pull
+            force_y += dy * pull
+
+        if force_x or force_y:
+            if velocity:
+                entity.vx += force_x * scale
+                entity.vy += force_y * scale
+            else:
+                entity.x += force_x * scale
+                entity.y += force_y * scale
@@ -0,0 +1,375 @@
+"""
+Horde worker - zombie movement, separation and particles in a second process
+
+The main process keeps its Zombie objects. Each tick it copies their
+positions into shared memory, and the worker sends back where they moved.
+The worker also owns the death particles, and writes out only what is
+needed to draw them.
+
+Shared memory holds two slots. The worker fills one slot while the main
+process draws the particles from the other. Ticks are handed over as
+one-byte messages on a pipe, so nothing is pickled once the worker is up.
+"""
+import math
+import multiprocessing
+import signal
+from array import array
+from collections import defaultdict
+from multiprocessing.shared_memory import SharedMemory
+import pygame
+from config import *
+from content import get_content
+from systems.particles import create_death_particles
+from systems.gravity import GravityField, pull_points
+
+
+# Header doubles at the start of each slot
+(H_COUNT, H_PLAYER_X, H_PLAYER_Y, H_DT, H_BURSTS, H_WELLS, H_RESET,
+ H_PARTICLES) = range(8)
+HEADER = 8
+
+BURST_FIELDS = 6     # x, y, r, g, b, count
+WELL_FIELDS = 4      # x, y, radius, strength (already faded)
+PARTICLE_FIELDS = 4  # x, y, radius, packed rgb
+
+STOP = b'\xff'
+
+
+class HordeLayout:
+    """Where each array lives inside a slot, in doubles."""
+
+    def __init__(self, capacity=HORDE_CAPACITY, particle_capacity=HORDE_PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.particle_capacity = particle_capacity
+
+        offset = HEADER
+        # Zombies in: center x, center y, type id. Zombies out: center x, y
+        self.xs, self.ys, self.types, self.out_xs, self.out_ys = (
+            offset + capacity * i for i in range(5))
+        offset += capacity * 5
+        self.bursts = offset
+        offset += HORDE_MAX_BURSTS * BURST_FIELDS
+        self.wells = offset
+        offset += HORDE_MAX_WELLS * WELL_FIELDS
+        self.particles = offset
+        offset += particle_capacity * PARTICLE_FIELDS
+        self.slot_size = offset
+
+    @property
+    def nbytes(self):
+        return self.slot_size * 2 * 8
+
+    def views(self, buf):
+        """A double view of buf, and one view per slot inside it."""
+        doubles = buf.cast('d')
+        size = self.slot_size
+        return doubles, [doubles[size * i:size * (i + 1)] for i in range(2)]
+
+
+class HordeWorker:
+    """Main-process side: packs each tick into shared memory and applies the results.
+
+    Movement runs one tick behind. While the worker is busy, the main
+    process keeps adding up frame time, and the next tick covers all of
+    it, the same way ZombieLOD catches up distant zombies.
+    """
+
+    def __init__(self, capacity=HORDE_CAPACITY, particle_capacity=HORDE_PARTICLE_CAPACITY):
+        self.layout = HordeLayout(capacity, particle_capacity)
+        self.shm = SharedMemory(create=True, size=self.layout.nbytes)
+        self.doubles, self.slots = self.layout.views(self.shm.buf)
+
+        # Spawn, not fork: the child shouldn't inherit the display
+        context = multiprocessing.get_context('spawn')
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=run_worker, args=(self.shm.name, capacity, particle_capacity, child_conn),
+            daemon=True)
+        self.process.start()
+
+        self.front = 0       # slot with the latest finished tick
+        self.busy = False    # a tick is in flight in the other slot
+        self.pending_dt = 0  # frame time the worker hasn't simulated yet
+        self.reset = False
+
+        # The tick in flight: zombies and where they were when it was sent
+        self.sent = []
+        self.sent_xs = array('d')
+        self.sent_ys = array('d')
+
+        self.bursts = []  # particle bursts waiting to be handed over
+
+    def update(self, zombies, dt, player_pos, wells):
+        """Collect the finished tick, if any, and send the next one.
+
+        Returns the zombies past the worker's capacity, which the caller
+        still has to move itself.
+        """
+        self.pending_dt += dt
+        if self.busy:
+            if not self.conn.poll():
+                return zombies[self.layout.capacity:]  # still working, time carries over
+            self.conn.recv_bytes()
+            self.busy = False
+            self.front = 1 - self.front
+            self.apply()
+
+        self.send(zombies, player_pos, wells)
+        return zombies[self.layout.capacity:]
+
+    def send(self, zombies, player_pos, wells):
+        """Pack the horde, particle bursts and wells into the free slot and start a tick."""
+        layout = self.layout
+        slot = self.slots[1 - self.front]
+
+        sent = zombies[:layout.capacity]
+        count = len(sent)
+        xs = array('d', [zombie.rect.centerx for zombie in sent])
+        ys = array('d', [zombie.rect.centery for zombie in sent])
+        slot[layout.xs:layout.xs + count] = xs
+        slot[layout.ys:layout.ys + count] = ys
+        slot[layout.types:layout.types + count] = array('d', [zombie.type_id for zombie in sent])
+
+        bursts = self.bursts[:HORDE_MAX_BURSTS]
+        del self.bursts[:HORDE_MAX_BURSTS]
+        for i, burst in enumerate(bursts):
+            start = layout.bursts + i * BURST_FIELDS
+            slot[start:start + BURST_FIELDS] = array('d', burst)
+
+        live_wells = wells[:HORDE_MAX_WELLS]
+        for i, well in enumerate(live_wells):
+            start = layout.wells + i * WELL_FIELDS
+            slot[start:start + WELL_FIELDS] = array(
+                'd', (well.x, well.y, well.radius, well.strength * well.fade))
+
+        slot[H_COUNT] = count
+        slot[H_PLAYER_X], slot[H_PLAYER_Y] = player_pos
+        slot[H_DT] = self.pending_dt
+        slot[H_BURSTS] = len(bursts)
+        slot[H_WELLS] = len(live_wells)
+        slot[H_RESET] = float(self.reset)
+
+        self.conn.send_bytes(bytes((1 - self.front,)))
+        self.busy = True
+        self.pending_dt = 0
+        self.reset = False
+        self.sent, self.sent_xs, self.sent_ys = sent, xs, ys
+
+    def apply(self):
+        """Move each zombie of the finished tick by however far the worker moved it.
+
+        Moving by the difference keeps whatever else pushed the zombie in
+        the meantime, such as gravity wells, and zombies that died since
+        are skipped.
+        """
+        layout = self.layout
+        slot = self.slots[self.front]
+        count = len(self.sent)
+        out_xs = slot[layout.out_xs:layout.out_xs + count].tolist()
+        out_ys = slot[layout.out_ys:layout.out_ys + count].tolist()
+
+        for zombie, x0, y0, x1, y1 in zip(self.sent, self.sent_xs, self.sent_ys,
+                                          out_xs, out_ys):
+            if zombie.alive:
+                rect = zombie.rect
+                rect.x += x1 - x0
+                rect.y += y1 - y0
+        self.sent = []
+
+    def burst(self, x, y, color, count):
+        """Queue a burst of death particles for the worker."""
+        if count > 0:
+            self.bursts.append((x, y, *color, count))
+
+    def draw_particles(self, canvas):
+        """Draw the particles from the last finished tick."""
+        slot = self.slots[self.front]
+        start = self.layout.particles
+        data = slot[start:start + int(slot[H_PARTICLES]) * PARTICLE_FIELDS].tolist()
+
+        circle = canvas.circle
+        for i in range(0, len(data), PARTICLE_FIELDS):
+            rgb = int(data[i + 3])
+            circle((rgb >> 16, (rgb >> 8) & 255, rgb & 255),
+                   (int(data[i]), int(data[i + 1])), int(data[i + 2]))
+
+    def clear(self):
+        """Drop the tick in flight and every particle (new run or rewind)."""
+        if self.busy:
+            self.conn.recv_bytes()  # its moves belong to the old state
+            self.busy = False
+            self.front = 1 - self.front
+        self.slots[self.front][H_PARTICLES] = 0
+        self.sent = []
+        self.bursts.clear()
+        self.pending_dt = 0
+        self.reset = True
+
+    def close(self):
+        """Stop the worker and free the shared memory.
+
+        The worker may already be gone (killed, or it crashed), so the
+        handshake is best effort. Every view over the buffer is released
+        whatever happens, since SharedMemory.close() refuses while one is
+        alive, and this process created the segment, so it unlinks it.
+        Calling close() again does nothing.
+        """
+        if self.shm is None:
+            return
+        try:
+            if self.busy:
+                self.conn.recv_bytes()
+            self.conn.send_bytes(STOP)
+        except (EOFError, OSError):
+            pass
+        finally:
+            self.busy = False
+            self.sent = []
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+            self.conn.close()
+
+            for slot in self.slots:
+                slot.release()
+            self.doubles.release()
+            self.slots = []
+            self.doubles = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+def separate(xs, ys, sizes, strength, limit=HORDE_SEPARATION_NEIGHBOURS):
+    """Push overlapping zombies apart by a share of their overlap.
+
+    Zombies are bucketed into cells one zombie wide, and each cell is
+    only checked against itself and the four neighbours ahead of it, so
+    every pair is looked at once. Each zombie checks at most limit others,
+    which keeps a packed horde from going quadratic; the rest get their
+    turn on later ticks as the horde shuffles.
+    """
+    cell = max(sizes)
+    cells = defaultdict(list)
+    for i in range(len(xs)):
+        cells[(int(xs[i] // cell), int(ys[i] // cell))].append(i)
+
+    sqrt = math.sqrt
+    get = cells.get
+    for (cell_x, cell_y), members in cells.items():
+        candidates = (members
+                      + get((cell_x + 1, cell_y), [])
+                      + get((cell_x - 1, cell_y + 1), [])
+                      + get((cell_x, cell_y + 1), [])
+                      + get((cell_x + 1, cell_y + 1), []))
+        if len(candidates) < 2:
+            continue
+
+        for index, i in enumerate(members):
+            x = xs[i]
+            y = ys[i]
+            size = sizes[i]
+            for j in candidates[index + 1:index + 1 + limit]:
+                dx = xs[j] - x
+                dy = ys[j] - y
+                reach = (size + sizes[j]) / 2
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= reach * reach or dist_sq == 0:
+                    continue
+                dist = sqrt(dist_sq)
+                push = (reach - dist) * strength / 2 / dist
+                x -= dx * push
+                y -= dy * push
+                xs[j] += dx * push
+                ys[j] += dy * push
+            xs[i] = x
+            ys[i] = y
+
+
+def step_zombies(slot, layout, archetypes):
+    """Chase the player, then spread the horde out, writing the new centers."""
+    count = int(slot[H_COUNT])
+    if not count:
+        return
+    px = slot[H_PLAYER_X]
+    py = slot[H_PLAYER_Y]
+    dt = slot[H_DT]
+
+    xs = slot[layout.xs:layout.xs + count].tolist()
+    ys = slot[layout.ys:layout.ys + count].tolist()
+    types = [archetypes[int(type_id)] for type_id in
+             slot[layout.types:layout.types + count].tolist()]
+
+    hypot = math.hypot
+    for i in range(count):
+        dx = px - xs[i]
+        dy = py - ys[i]
+        dist = hypot(dx, dy)
+        if dist > 0:
+            step = types[i].speed * dt / dist
+            xs[i] += dx * step
+            ys[i] += dy * step
+
+    if HORDE_SEPARATION:
+        separate(xs, ys, [archetype.size for archetype in types], HORDE_SEPARATION)
+
+    slot[layout.out_xs:layout.out_xs + count] = array('d', xs)
+    slot[layout.out_ys:layout.out_ys + count] = array('d', ys)
+
+
+def step_particles(slot, layout, particles):
+    """Spawn this tick's bursts, pull and move every particle, and write them out."""
+    if slot[H_RESET]:
+        particles = []
+
+    for i in range(int(slot[H_BURSTS])):
+        start = layout.bursts + i * BURST_FIELDS
+        x, y, r, g, b, count = slot[start:start + BURST_FIELDS].tolist()
+        particles.extend(create_death_particles(x, y, (int(r), int(g), int(b)), int(count)))
+
+    dt = slot[H_DT]
+    wells = []
+    for i in range(int(slot[H_WELLS])):
+        start = layout.wells + i * WELL_FIELDS
+        x, y, radius, strength = slot[start:start + WELL_FIELDS].tolist()
+        wells.append((x, y, radius, radius * radius, strength))
+    if wells:
+        pull_points(particles, wells, dt * GravityField.VELOCITY_GAIN, velocity=True)
+
+    particles = [p for p in particles if p.update(dt)]
+    del particles[:-layout.particle_capacity]  # oldest go first when full
+
+    out = array('d')
+    for p in particles:
+        life = p.life
+        r, g, b = (min(255, int(c * life)) for c in p.color)
+        out.extend((p.x, p.y, p.size, (r << 16) | (g << 8) | b))
+    slot[layout.particles:layout.particles + len(out)] = out
+    slot[H_PARTICLES] = len(particles)
+    return particles
+
+
+def run_worker(name, capacity, particle_capacity, conn):
+    """Worker process: run each tick the main process sends, until told to stop."""
+    # Ctrl+C reaches the whole process group; the main process stops us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shm = SharedMemory(name=name)
+    layout = HordeLayout(capacity, particle_capacity)
+    doubles, slots = layout.views(shm.buf)
+    archetypes = get_content().zombies
+    particles = []
+    try:
+        while True:
+            message = conn.recv_bytes()
+            if message == STOP:
+                break
+            slot = slots[message[0]]
+            step_zombies(slot, layout, archetypes)
+            particles = step_particles(slot, layout, particles)
+            conn.send_bytes(message)
+    finally:
+        for slot in slots:
+            slot.release()
+        doubles.release()
+        shm.close()
@@ -0,0 +1,119 @@
+"""
+Job scheduler - deferred work run a slice at a time under a per-frame budget
+"""
+import heapq
+import itertools
+import time
+from config import *
+
+
+# Lower runs first
+PRIORITY_HIGH = 0    # affects gameplay soon (gem merging)
+PRIORITY_NORMAL = 1  # housekeeping (pruning stale cooldowns)
+PRIORITY_LOW = 2     # anything that can wait for an idle screen (atlas baking)
+
+
+class Job:
+    """A queued callable (runs once) or generator (runs one step per slice)."""
+    __slots__ = ('priority', 'order', 'name', 'work', 'steps')
+
+    def __init__(self, priority, order, name, work):
+        self.priority = priority
+        self.order = order
+        self.name = name
+        self.work = work
+        self.steps = 0
+
+    def __lt__(self, other):
+        return (self.priority, self.order) < (other.priority, other.order)
+
+    def step(self):
+        """Run one slice. False once the job has nothing left to do."""
+        self.steps += 1
+        if callable(self.work):
+            self.work()
+            return False
+        try:
+            next(self.work)
+        except StopIteration:
+            return False
+        return True
+
+
+class JobScheduler:
+    """Runs queued jobs until the frame's millisecond budget is spent.
+
+    Subsystems queue a function, or a generator that yields between
+    slices of a long job. Each run() takes jobs in priority order (oldest
+    first within a priority) and stops once the budget is used. A
+    generator that isn't finished keeps its place in line. Named jobs
+    are queued at most once at a time, so a subsystem can ask every
+    frame. A run always gets at least one slice done; a slice that runs
+    long can carry a run past JOB_OVERRUN_RATIO times its budget, which
+    is counted as an overrun.
+    """
+
+    def __init__(self):
+        self.queue = []          # heap of Job
+        self.pending = set()     # names of queued jobs
+        self.order = itertools.count()
+        self.slices = 0          # slices run, ever
+        self.overruns = 0        # runs that went well past their budget
+        self.worst_ms = 0.0      # longest run
+        self.last_ms = 0.0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def schedule(self, work, priority=PRIORITY_NORMAL, name=None):
+        """Queue work unless a job with this name is already waiting."""
+        if name is not None:
+            if name in self.pending:
+                return
+            self.pending.add(name)
+        heapq.heappush(self.queue, Job(priority, next(self.order), name, work))
+
+    def clear(self):
+        """Drop every queued job (new run)."""
+        self.queue.clear()
+        self.pending.clear()
+
+    def run(self, budget_ms=JOB_BUDGET_MS):
+        """Run job slices until budget_ms is spent or the queue is empty."""
+        queue = self.queue
+        if not queue:
+            self.last_ms = 0.0
+            return
+
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000
+        while queue:
+            job = queue[0]
+            more = job.step()
+            self.slices += 1
+            if not more:
+                heapq.heappop(queue)
+                self.pending.discard(job.name)
+            if time.perf_counter() >= deadline:
+                break
+
+        self.last_ms = (time.perf_counter() - start) * 1000
+        self.worst_ms = max(self.worst_ms, self.last_ms)
+        if self.last_ms > budget_ms * JOB_OVERRUN_RATIO:
+            self.overruns += 1
+
+    def stats(self):
+        """Queue depth and budget overruns, for the debug line."""
+        return {'depth': len(self.queue), 'overruns': self.overruns,
+                'slices': self.slices, 'last_ms': self.last_ms, 'worst_ms': self.worst_ms}
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    """The process-wide scheduler (systems without a Game reference queue here)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler()
+    return _scheduler
@@ -0,0 +1,87 @@
+"""
+Population cap - past the cap, nearby zombies of one type merge into elites
+"""
+from entities.zombie import Zombie
+from config import *
+
+
+class PopulationCap:
+    """Keeps the live horde under a cap without easing off the pressure.
+
+    When the horde plus the spawns the director lets out next would go
+    past the cap, update() folds same-type neighbours found through the
+    spatial grid into one zombie each, a few at a time. The elite keeps
+    their combined health, contact damage and experience, so the fight
+    is as hard as before with fewer zombies to move and draw. Each frame
+    looks at a bounded number of zombies, picking up where the last one
+    stopped; spawns that still don't fit wait in the director's queue.
+    """
+
+    def __init__(self, director, cap=ZOMBIE_CAP, radius=ELITE_MERGE_RADIUS,
+                 group=ELITE_MERGE_GROUP, max_merged=ELITE_MAX_MERGED, scan=ELITE_MERGE_SCAN):
+        self.director = director
+        self.cap = cap
+        self.radius = radius
+        self.group = group
+        self.max_merged = max_merged
+        self.scan = scan
+        self.cursor = 0     # where the next frame's scan starts
+        self.merges = 0     # elites made or grown
+        self.absorbed = 0   # zombies merged away
+
+    def clear(self):
+        self.cursor = 0
+
+    def room(self, zombies):
+        """How many more zombies fit under the cap (None if uncapped)."""
+        if self.cap is None:
+            return None
+        return max(0, self.cap - len(zombies))
+
+    def update(self, zombies, grid):
+        """Merge zombies until this frame's spawns fit. Returns the elites touched."""
+        if self.cap is None:
+            return []
+        director = self.director
+        excess = len(zombies) + min(len(director), director.budget) - self.cap
+        if excess <= 0 or not zombies:
+            return []
+
+        grid.update(zombies)
+        elites = []
+        absorbed = []
+        count = len(zombies)
+        start = self.cursor % count
+        for i in range(min(self.scan, count)):
+            if excess <= 0:
+                break
+            zombie = zombies[(start + i) % count]
+            if not zombie.alive or type(zombie) is not Zombie:
+                continue
+            total = zombie.merged
+            if total >= self.max_merged:
+                continue
+
+            group = []
+            x, y = zombie.rect.center
+            for other in grid.query_radius(x, y, self.radius):
+                if (other is zombie or other.type_id != zombie.type_id
+                        or type(other) is not Zombie or total + other.merged > self.max_merged):
+                    continue
+                group.append(other)
+                total += other.merged
+                if len(group) >= min(self.group - 1, excess):
+                    break
+            if group:
+                zombie.absorb(group)
+                elites.append(zombie)
+                absorbed.extend(group)
+                excess -= len(group)
+        self.cursor = start + min(self.scan, count)
+
+        if absorbed:
+            zombies[:] = [zombie for zombie in zombies if zombie.alive]
+            director.recycle(absorbed)
+            self.merges += len(elites)
+            self.absorbed += len(absorbed)
+        return elites
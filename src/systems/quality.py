@@ -0,0 +1,105 @@
+"""
+Quality governor - scales back cosmetic work to hold the frame-time budget
+"""
+import time
+from collections import deque
+from config import *
+from systems.events import QualityChange
+
+
+# Quality levels from best to cheapest
+QUALITY_LEVELS = [
+    {
+        'name': 'high',
+        'particle_scale': 1.0,        # fraction of particles emitted
+        'glow': True,                 # extra glow circles on bullets/gems/discs
+        'gem_merge_threshold': 400,   # merge gems once there are this many
+        'small_health_bars': True,    # health bars on regular zombies
+        'cosmetic_interval': 1,       # update particles every N frames
+        'star_layers': 3,             # parallax starfield layers drawn
+        'render_scale': 1.0,          # world resolution (capped by RENDER_SCALE)
+    },
+    {
+        'name': 'medium',
+        'particle_scale': 0.6,
+        'glow': True,
+        'gem_merge_threshold': 200,
+        'small_health_bars': True,
+        'cosmetic_interval': 1,
+        'star_layers': 3,
+        'render_scale': 1.0,
+    },
+    {
+        'name': 'low',
+        'particle_scale': 0.3,
+        'glow': False,
+        'gem_merge_threshold': 100,
+        'small_health_bars': False,
+        'cosmetic_interval': 2,
+        'star_layers': 2,
+        'render_scale': 0.67,
+    },
+    {
+        'name': 'minimal',
+        'particle_scale': 0.1,
+        'glow': False,
+        'gem_merge_threshold': 40,
+        'small_health_bars': False,
+        'cosmetic_interval': 3,
+        'star_layers': 1,
+        'render_scale': 0.5,
+    },
+]
+
+
+class QualityGovernor:
+    """Watches frame times and steps quality down under load, up with headroom."""
+
+    def __init__(self, events=None, target_fps=FPS):
+        self.events = events  # EventBus that gets a QualityChange per switch
+        self.budget_ms = 1000.0 / target_fps
+        self.frame_times = deque(maxlen=QUALITY_WINDOW)
+        self.level = 0
+        self.enabled = True
+
+        # Wait this long after a change before judging the new level
+        self.cooldown = 0
+        self.history = []  # (timestamp, from, to, average ms)
+
+    @property
+    def settings(self):
+        """Settings for the current quality level."""
+        return QUALITY_LEVELS[self.level]
+
+    def record(self, frame_ms, dt):
+        """Record how long the last frame's work took."""
+        self.frame_times.append(frame_ms)
+
+        if self.cooldown > 0:
+            self.cooldown -= dt
+            return
+        if not self.enabled or len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        average = sum(self.frame_times) / len(self.frame_times)
+
+        if average > self.budget_ms * QUALITY_DOWNGRADE_RATIO:
+            self.set_level(self.level + 1, average)
+        elif average < self.budget_ms * QUALITY_UPGRADE_RATIO:
+            self.set_level(self.level - 1, average)
+
+    def set_level(self, level, average=0.0):
+        """Switch to a quality level and record the change in history."""
+        level = max(0, min(level, len(QUALITY_LEVELS) - 1))
+        if level == self.level:
+            return
+
+        old_name = self.settings['name']
+        self.level = level
+        self.frame_times.clear()
+        self.cooldown = QUALITY_COOLDOWN
+
+        self.history.append((time.time(), old_name, self.settings['name'], average))
+        if self.events:
+            self.events.emit(QualityChange(old_name, self.settings['name'],
+                                           average, self.budget_ms))
@@ -0,0 +1,404 @@
+"""
+Snapshot system - packs the whole simulation into a compact binary buffer
+
+Snapshots contain no pickled objects: every field is written with struct
+or array, so they are small, fast and safe to load.  Particles are
+cosmetic and are not saved.
+"""
+import math
+import zlib
+import random
+import struct
+from array import array
+from collections import deque
+import pygame
+from entities.zombie import Zombie
+from entities.bullet import Bullet
+from entities.exp_gem import ExpGem
+from entities.boss_zombie import BossZombie
+from weapons import weapon_class
+from content import get_content
+from config import *
+
+
+SNAPSHOT_MAGIC = b'SZS8'
+
+# Per-entity float fields, in the order they are packed
+ZOMBIE_FIELDS = 11  # x, y, health, max_health, vx, vy, pending_dt, merged,
+                    # rem_x, rem_y, lod_phase
+BULLET_FIELDS = 8   # x, y, vx, vy, damage, pierce, pierce_count, radius
+GEM_FIELDS = 5      # x, y, value, pulse, attracted
+WELL_FIELDS = 6     # x, y, radius, strength, duration, time_left
+BOSS_FIELDS = 10    # x, y, health, max_health, spawn_timer, pulse, well_timer,
+                    # phase, volleys, spiral_turn (then one timer per pattern)
+
+_count = struct.Struct('<I')
+_weapon_header = struct.Struct('<BHB')  # name length, level, field count
+
+
+def _pack_doubles(values):
+    """Pack a flat list of numbers as little-endian doubles."""
+    return _count.pack(len(values)) + array('d', values).tobytes()
+
+
+class _Reader:
+    """Reads back the pieces written by save_snapshot."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt):
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def raw(self, size):
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+    def doubles(self):
+        count, = self.unpack(_count)
+        values = array('d')
+        values.frombytes(self.raw(count * 8))
+        return values
+
+
+def _pack_rng():
+    """Pack the state of the global random module."""
+    version, internal, gauss_next = random.getstate()
+    has_gauss = gauss_next is not None
+    return (struct.pack('<BBd', version, has_gauss, gauss_next if has_gauss else 0.0)
+            + _count.pack(len(internal)) + array('I', internal).tobytes())
+
+
+def _unpack_rng(reader):
+    """Restore the global random module from a snapshot."""
+    version, has_gauss, gauss_next = reader.unpack(struct.Struct('<BBd'))
+    count, = reader.unpack(_count)
+    internal = array('I')
+    internal.frombytes(reader.raw(count * 4))
+    random.setstate((version, tuple(internal), gauss_next if has_gauss else None))
+
+
+def save_snapshot(game):
+    """Pack the full simulation state of a game into bytes."""
+    player = game.player
+    exp = game.exp_system
+    spawner = game.spawner
+    parts = [SNAPSHOT_MAGIC]
+
+    # Game, player, experience and spawner state
+    parts.append(_pack_doubles([
+        game.game_time, game.kills,
+        math.nan if game.boss_kill_time is None else game.boss_kill_time,
+        game.boss_spawned, game.screen_shake, game.frame_count, game.cosmetic_dt,
+        game.zombie_lod.tick,
+        player.rect.centerx, player.rect.centery, player.health, player.max_health,
+        player.speed, player.pickup_radius, player.invulnerable_time, player.alive,
+        exp.level, exp.current_exp, exp.exp_to_next_level, exp.total_exp,
+        spawner.spawn_timer, spawner.game_time, spawner.zombies_spawned,
+        spawner.hordes_sent, game.population.cursor,
+    ]))
+
+    # Zombies: one byte of type each, then their float fields
+    zombies = game.zombies
+    parts.append(_count.pack(len(zombies)))
+    parts.append(bytes(z.type_id for z in zombies))
+    parts.append(_pack_doubles([
+        value for z in zombies for value in (
+            z.rect.x, z.rect.y, z.health, z.max_health, z.vx, z.vy, z.pending_dt,
+            z.merged, z.rem_x, z.rem_y, z.lod_phase)
+    ]))
+
+    # Spawns still queued: one byte of type each, then x, y
+    types, positions = game.director.pack()
+    parts.append(_count.pack(len(types)))
+    parts.append(types)
+    parts.append(_pack_doubles(positions))
+
+    parts.append(_pack_doubles([
+        value for b in game.bullets for value in (
+            b.x, b.y, b.vx, b.vy, b.damage, b.pierce, b.pierce_count, b.radius)
+    ]))
+
+    parts.append(_pack_doubles([
+        value for g in game.exp_gems for value in (
+            g.x, g.y, g.value, g.pulse, g.attracted)
+    ]))
+
+    # Boss (empty list when there is none)
+    boss = game.boss
+    parts.append(_pack_doubles([] if boss is None else [
+        boss.rect.centerx, boss.rect.centery, boss.health, boss.max_health,
+        boss.spawn_timer, boss.pulse, boss.well_timer,
+        boss.phase, boss.volleys, boss.spiral_turn, *boss.volley_timers,
+    ]))
+    parts.append(_pack_doubles(game.enemy_shots.pack()))
+
+    parts.append(_pack_doubles([
+        value for w in game.gravity.wells for value in (
+            w.x, w.y, w.radius, w.strength, w.duration, w.time_left)
+    ]))
+
+    # Weapons: class name, level, each weapon's own timers, then whatever
+    # it has in flight (zombies it points at are saved as indices)
+    zombie_index = {zombie: i for i, zombie in enumerate(zombies)}
+    parts.append(_count.pack(len(game.weapons)))
+    for weapon in game.weapons:
+        name = weapon.__class__.__name__.encode()
+        fields = [getattr(weapon, field) for field in weapon.snapshot_fields]
+        parts.append(_weapon_header.pack(len(name), weapon.level, len(fields)))
+        parts.append(name)
+        parts.append(array('d', fields).tobytes())
+        parts.append(_pack_doubles(weapon.pack_state(zombie_index)))
+
+    parts.append(_pack_rng())
+    return b''.join(parts)
+
+
+def _resize(store, count, cls, template):
+    """Trim or grow an entity list to count objects, cloning new ones from a template."""
+    del store[count:]
+    for _ in range(count - len(store)):
+        instance = cls.__new__(cls)
+        instance.__dict__.update(template)
+        if 'rect' in template:
+            instance.rect = template['rect'].copy()
+        store.append(instance)
+    return store
+
+
+def restore_snapshot(game, data):
+    """Restore a game to the state packed by save_snapshot."""
+    reader = _Reader(data)
+    if bytes(reader.raw(4)) != SNAPSHOT_MAGIC:
+        raise ValueError("Not a game snapshot")
+
+    (game_time, kills, boss_kill_time, boss_spawned, screen_shake, frame_count,
+     cosmetic_dt, lod_tick,
+     px, py, health, max_health, speed, pickup_radius, invulnerable_time, alive,
+     level, current_exp, exp_to_next, total_exp,
+     spawn_timer, spawner_time, zombies_spawned, hordes_sent,
+     merge_cursor) = reader.doubles()
+
+    game.game_time = game_time
+    game.kills = int(kills)
+    game.boss_kill_time = None if math.isnan(boss_kill_time) else boss_kill_time
+    game.boss_spawned = bool(boss_spawned)
+    game.screen_shake = screen_shake
+    game.frame_count = int(frame_count)
+    game.cosmetic_dt = cosmetic_dt
+    game.zombie_lod.tick = int(lod_tick)
+
+    player = game.player
+    player.rect.center = (int(px), int(py))
+    player.health = health
+    player.max_health = max_health
+    player.speed = speed
+    player.pickup_radius = pickup_radius
+    player.invulnerable_time = invulnerable_time
+    player.alive = bool(alive)
+
+    exp = game.exp_system
+    exp.level = int(level)
+    exp.current_exp = current_exp
+    exp.exp_to_next_level = int(exp_to_next)
+    exp.total_exp = total_exp
+
+    game.spawner.spawn_timer = spawn_timer
+    game.spawner.game_time = spawner_time
+    game.spawner.zombies_spawned = int(zombies_spawned)
+    game.spawner.hordes_sent = int(hordes_sent)
+    game.population.cursor = int(merge_cursor)
+
+    # Entity objects already in the stores are reused; missing ones are
+    # cloned from a template instead of running __init__
+    count, = reader.unpack(_count)
+    types = bytes(reader.raw(count))
+    values = iter(reader.doubles())
+    templates = [vars(Zombie(0, 0, archetype.name))
+                 for archetype in get_content().zombies]
+    zombies = _resize(game.zombies, count, Zombie, templates[0])
+    for (zombie, type_id, x, y, health, max_health, vx, vy, pending_dt, merged,
+         rem_x, rem_y, lod_phase) in zip(
+            zombies, types, *([values] * ZOMBIE_FIELDS)):
+        if zombie.type_id != type_id:
+            zombie.__dict__.update(templates[type_id])
+            zombie.rect = templates[type_id]['rect'].copy()
+        if zombie.merged != merged:
+            zombie.merged = int(merged)
+            zombie.fit_size()
+        zombie.rect.x = x
+        zombie.rect.y = y
+        zombie.health = health
+        zombie.max_health = max_health
+        zombie.alive = health > 0
+        zombie.vx = vx
+        zombie.vy = vy
+        zombie.pending_dt = pending_dt
+        zombie.rem_x = rem_x
+        zombie.rem_y = rem_y
+        zombie.lod_phase = int(lod_phase)
+
+    count, = reader.unpack(_count)
+    types = bytes(reader.raw(count))
+    game.director.restore(types, reader.doubles())
+
+    values = reader.doubles()
+    bullets = _resize(game.bullets, len(values) // BULLET_FIELDS,
+                      Bullet, vars(Bullet(0, 0, 1, 0)))
+    values = iter(values)
+    for bullet, x, y, vx, vy, damage, pierce, pierce_count, radius in zip(
+            bullets, *([values] * BULLET_FIELDS)):
+        bullet.x = x
+        bullet.y = y
+        bullet.vx = vx
+        bullet.vy = vy
+        bullet.damage = damage
+        bullet.pierce = int(pierce)
+        bullet.pierce_count = int(pierce_count)
+        bullet.last_hit = None
+        bullet.radius = radius
+        bullet.alive = True
+
+    values = reader.doubles()
+    gems = _resize(game.exp_gems, len(values) // GEM_FIELDS,
+                   ExpGem, vars(ExpGem(0, 0)))
+    values = iter(values)
+    for gem, x, y, value, pulse, attracted in zip(gems, *([values] * GEM_FIELDS)):
+        gem.x = x
+        gem.y = y
+        gem.value = value
+        gem.pulse = pulse
+        gem.attracted = attracted > 0
+
+    values = reader.doubles()
+    if values:
+        (bx, by, b_health, b_max_health, b_spawn_timer, pulse, well_timer,
+         phase, volleys, spiral_turn) = values[:BOSS_FIELDS]
+        boss = BossZombie(int(bx), int(by))
+        boss.health = b_health
+        boss.max_health = b_max_health
+        boss.spawn_timer = b_spawn_timer
+        boss.pulse = pulse
+        boss.well_timer = well_timer
+        boss.set_phase(int(phase))
+        boss.new_phase = False
+        boss.volleys = int(volleys)
+        boss.spiral_turn = int(spiral_turn)
+        boss.volley_timers = list(values[BOSS_FIELDS:])
+        game.boss = boss
+    else:
+        game.boss = None
+    game.enemy_shots.restore(reader.doubles())
+
+    values = iter(reader.doubles())
+    game.gravity.clear()
+    for x, y, radius, strength, duration, time_left in zip(*([values] * WELL_FIELDS)):
+        game.gravity.open(x, y, radius, strength, duration)
+        game.gravity.wells[-1].time_left = time_left
+
+    # Weapons are rebuilt by replaying their upgrades, then their timers restored
+    count, = reader.unpack(_count)
+    weapons = []
+    for _ in range(count):
+        name_length, weapon_level, field_count = reader.unpack(_weapon_header)
+        name = bytes(reader.raw(name_length)).decode()
+        fields = array('d')
+        fields.frombytes(reader.raw(field_count * 8))
+
+        weapon = weapon_class(name)(game.player)
+        for _ in range(weapon_level - 1):
+            weapon.upgrade()
+        for field, value in zip(weapon.snapshot_fields, fields):
+            setattr(weapon, field, value)
+        weapon.restore_state(reader.doubles(), zombies)
+        weapons.append(weapon)
+    game.weapons[:] = weapons
+
+    _unpack_rng(reader)
+    game.particles.clear()
+
+
+def _xor(data, previous):
+    """XOR two buffers, padding the shorter one with zeros."""
+    length = max(len(data), len(previous))
+    value = int.from_bytes(data, 'little') ^ int.from_bytes(previous, 'little')
+    return value.to_bytes(length, 'little')
+
+
+class SnapshotHistory:
+    """Ring buffer of delta-encoded snapshots for rewinding a run."""
+
+    def __init__(self, seconds=SNAPSHOT_HISTORY_SECONDS,
+                 interval=SNAPSHOT_INTERVAL, keyframe_every=SNAPSHOT_KEYFRAME_EVERY):
+        self.interval = interval
+        self.keyframe_every = keyframe_every
+        self.timer = 0
+
+        # Entries are (is_keyframe, length, compressed bytes)
+        self.entries = deque(maxlen=int(seconds / interval))
+        self.previous = None
+        self.since_keyframe = 0
+
+    def clear(self):
+        """Forget all recorded snapshots."""
+        self.entries.clear()
+        self.previous = None
+        self.since_keyframe = 0
+        self.timer = 0
+
+    def update(self, dt, game):
+        """Record a snapshot every interval."""
+        self.timer += dt
+        if self.timer >= self.interval:
+            self.timer = 0
+            self.push(save_snapshot(game))
+
+    def push(self, data):
+        """Add a snapshot, stored as a diff from the previous one."""
+        if self.previous is None or self.since_keyframe >= self.keyframe_every:
+            self.entries.append((True, len(data), zlib.compress(data, 1)))
+            self.since_keyframe = 0
+        else:
+            delta = _xor(data, self.previous)
+            self.entries.append((False, len(data), zlib.compress(delta, 1)))
+            self.since_keyframe += 1
+        self.previous = data
+
+        # Deltas are useless once their keyframe falls off the ring
+        while self.entries and not self.entries[0][0]:
+            self.entries.popleft()
+
+    def decode(self, index):
+        """Rebuild the full snapshot at an index in the ring."""
+        start = index
+        while not self.entries[start][0]:
+            start -= 1
+
+        data = b''
+        for is_keyframe, length, compressed in list(self.entries)[start:index + 1]:
+            raw = zlib.decompress(compressed)
+            data = raw if is_keyframe else _xor(raw, data)[:length]
+        return data
+
+    def rewind(self, steps):
+        """Drop the newest snapshots and return the one `steps` back, or None."""
+        if not self.entries:
+            return None
+
+        steps = min(steps, len(self.entries) - 1)
+        for _ in range(steps):
+            self.entries.pop()
+
+        data = self.decode(len(self.entries) - 1)
+        self.previous = data
+        self.timer = 0
+        self.since_keyframe = 0
+        for is_keyframe, _, _ in reversed(self.entries):
+            if is_keyframe:
+                break
+            self.since_keyframe += 1
+        return data
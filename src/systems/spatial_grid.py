@@ -0,0 +1,189 @@
+"""
+Spatial grid - uniform hash grid for range queries over the horde
+"""
+from collections import defaultdict
+from config import *
+
+
+class SpatialGrid:
+    """Buckets entities by cell so range queries only touch nearby cells."""
+
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)  # (cell x, cell y) -> entities
+        self.entities = ()
+        self.stale = False
+        self.max_half_size = 0  # widest entity's half size, pads queries
+
+    def update(self, entities):
+        """Track this frame's entities. Cells are rebuilt on the first query."""
+        self.entities = entities
+        self.stale = True
+
+    def rebuild(self):
+        """Re-bucket every living entity by the cell its center is in."""
+        cells = self.cells
+        cells.clear()
+        size = self.cell_size
+        widest = 0
+
+        for entity in self.entities:
+            if not entity.alive:
+                continue
+            rect = entity.rect
+            cells[(rect.centerx // size, rect.centery // size)].append(entity)
+            if rect.width > widest:
+                widest = rect.width
+
+        self.max_half_size = widest / 2
+        self.stale = False
+
+    def query_radius(self, x, y, radius):
+        """Living entities whose body overlaps the circle at (x, y)."""
+        if self.stale:
+            self.rebuild()
+
+        size = self.cell_size
+        reach = radius + self.max_half_size
+        first_x, last_x = int((x - reach) // size), int((x + reach) // size)
+        first_y, last_y = int((y - reach) // size), int((y + reach) // size)
+
+        found = []
+        cells = self.cells
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    if not entity.alive:
+                        continue
+                    rect = entity.rect
+                    dx = rect.centerx - x
+                    dy = rect.centery - y
+                    touch = radius + rect.width / 2
+                    if dx * dx + dy * dy <= touch * touch:
+                        found.append(entity)
+        return found
+
+    def nearest(self, x, y, max_radius, exclude=()):
+        """Closest living entity center within max_radius, or None.
+
+        Searches rings of cells outward and stops as soon as no unvisited
+        ring can hold anything closer.
+        """
+        if self.stale:
+            self.rebuild()
+
+        size = self.cell_size
+        cells = self.cells
+        center_x, center_y = int(x // size), int(y // size)
+
+        best = None
+        best_dist = max_radius * max_radius
+        for ring in range(int(max_radius // size) + 2):
+            for cell in self._ring(center_x, center_y, ring):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    if not entity.alive or entity in exclude:
+                        continue
+                    dx = entity.rect.centerx - x
+                    dy = entity.rect.centery - y
+                    dist = dx * dx + dy * dy
+                    if dist <= best_dist:
+                        best_dist = dist
+                        best = entity
+
+            # Everything in the next ring is at least ring * size away
+            reach = ring * size
+            if best is not None and best_dist <= reach * reach:
+                break
+        return best
+
+    def query_ray(self, x, y, dir_x, dir_y, length, width):
+        """Living entities a beam touches, as (distance along beam, entity), nearest first.
+
+        dir_x, dir_y must be a unit vector.  The cells under the beam are
+        walked with a DDA traversal, so the cost follows the beam length
+        rather than the number of entities.
+        """
+        if self.stale:
+            self.rebuild()
+
+        size = self.cell_size
+        cells = self.cells
+        half_width = width / 2
+
+        # Entities centered in neighbouring cells can still reach the beam
+        spread = int((half_width + self.max_half_size) // size) + 1
+
+        cell_x, cell_y = int(x // size), int(y // size)
+        step_x = 1 if dir_x >= 0 else -1
+        step_y = 1 if dir_y >= 0 else -1
+
+        # Distance along the beam to the next vertical / horizontal cell edge
+        if dir_x:
+            edge_x = (cell_x + (step_x > 0)) * size
+            next_x = (edge_x - x) / dir_x
+            delta_x = size / abs(dir_x)
+        else:
+            next_x = delta_x = float('inf')
+        if dir_y:
+            edge_y = (cell_y + (step_y > 0)) * size
+            next_y = (edge_y - y) / dir_y
+            delta_y = size / abs(dir_y)
+        else:
+            next_y = delta_y = float('inf')
+
+        seen = set()
+        hits = []
+        travelled = 0
+        while travelled <= length:
+            for near_x in range(cell_x - spread, cell_x + spread + 1):
+                for near_y in range(cell_y - spread, cell_y + spread + 1):
+                    cell = (near_x, near_y)
+                    if cell in seen:
+                        continue
+                    seen.add(cell)
+                    bucket = cells.get(cell)
+                    if not bucket:
+                        continue
+                    for entity in bucket:
+                        if not entity.alive:
+                            continue
+                        rx = entity.rect.centerx - x
+                        ry = entity.rect.centery - y
+                        along = rx * dir_x + ry * dir_y
+                        reach = half_width + entity.rect.width / 2
+                        if along < -reach or along > length + reach:
+                            continue
+                        if abs(rx * dir_y - ry * dir_x) <= reach:
+                            hits.append((along, entity))
+
+            # Step into whichever neighbouring cell the beam reaches first
+            if next_x < next_y:
+                travelled = next_x
+                next_x += delta_x
+                cell_x += step_x
+            else:
+                travelled = next_y
+                next_y += delta_y
+                cell_y += step_y
+
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    @staticmethod
+    def _ring(center_x, center_y, ring):
+        """Cells on the square ring `ring` cells away from the center cell."""
+        if ring == 0:
+            yield (center_x, center_y)
+            return
+        for cell_x in range(center_x - ring, center_x + ring + 1):
+            yield (cell_x, center_y - ring)
+            yield (cell_x, center_y + ring)
+        for cell_y in range(center_y - ring + 1, center_y + ring):
+            yield (center_x - ring, cell_y)
+            yield (center_x + ring, cell_y)
@@ -0,0 +1,91 @@
+"""
+Spawn director - queued spawns let out under a per-frame budget
+"""
+import random
+from collections import deque
+from entities.zombie import Zombie
+from content import get_content
+from config import *
+
+
+class SpawnDirector:
+    """Spreads big spawns across frames and reuses dead zombies.
+
+    Horde events and boss minion bursts only queue their zombies, with
+    every position sampled in one batch up front. update() then lets out
+    at most budget of them per frame, so a 500-zombie horde arrives over
+    a couple dozen frames instead of in one. Dead zombies handed to
+    recycle() are respawned in place of new ones.
+    """
+
+    def __init__(self, spawner, budget=SPAWN_BUDGET, pool_size=SPAWN_POOL_SIZE):
+        self.spawner = spawner
+        self.budget = budget
+        self.pool_size = pool_size
+        self.queue = deque()  # (zombie type, x, y) waiting to spawn
+        self.pool = []        # dead zombies waiting to be reused
+        self.spawned = 0
+        self.reused = 0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def clear(self):
+        """Drop everything still queued (the pool is kept)."""
+        self.queue.clear()
+
+    def queue_edges(self, count, zombie_type=None):
+        """Queue count zombies along the screen edges.
+
+        Types follow the spawner's difficulty unless zombie_type is given.
+        """
+        spawner = self.spawner
+        points = spawner.edge_points(count)
+        if zombie_type is None:
+            types = [spawner.choose_zombie_type() for _ in range(count)]
+        else:
+            types = [zombie_type] * count
+        self.queue.extend((kind, x, y) for kind, (x, y) in zip(types, points))
+        spawner.zombies_spawned += count
+
+    def queue_burst(self, x, y, count, zombie_type, spread):
+        """Queue count zombies scattered up to spread px around (x, y)."""
+        offsets = [random.randint(-spread, spread) for _ in range(count * 2)]
+        self.queue.extend((zombie_type, x + dx, y + dy)
+                          for dx, dy in zip(offsets[::2], offsets[1::2]))
+
+    def update(self, zombies, room=None):
+        """Spawn up to the budget (and room, if given) from the front of the queue."""
+        queue = self.queue
+        pool = self.pool
+        count = min(self.budget, len(queue))
+        if room is not None:
+            count = min(count, room)
+        for _ in range(count):
+            zombie_type, x, y = queue.popleft()
+            if pool:
+                zombie = pool.pop()
+                zombie.respawn(x, y, zombie_type)
+                self.reused += 1
+            else:
+                zombie = Zombie(x, y, zombie_type)
+            zombies.append(zombie)
+            self.spawned += 1
+
+    def recycle(self, dead):
+        """Keep dead zombies (not the boss) to respawn later."""
+        room = self.pool_size - len(self.pool)
+        if room > 0:
+            self.pool.extend([zombie for zombie in dead if type(zombie) is Zombie][:room])
+
+    def pack(self):
+        """Queued spawns as (type ids, flat x/y values) for a snapshot."""
+        content = get_content()
+        return (bytes(content.zombie(kind).type_id for kind, _, _ in self.queue),
+                [value for _, x, y in self.queue for value in (x, y)])
+
+    def restore(self, type_ids, values):
+        """Load a queue written by pack()."""
+        archetypes = get_content().zombies
+        self.queue = deque((archetypes[type_id].name, int(x), int(y))
+                           for type_id, x, y in zip(type_ids, values[0::2], values[1::2]))
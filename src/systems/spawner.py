@@ -13,15 +13,21 @@ class ZombieSpawner:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.spawn_timer = 0
         self.spawn_rate = ZOMBIE_SPAWN_RATE  # seconds between spawns
         
+        # Spawn edges (top, right, bottom, left)
+        self.spawn_margin = 50
+        
+        self.reset()
+    
+    def reset(self):
+        """Reset timers and difficulty for a new run."""
+        self.spawn_timer = 0
+        
         # Difficulty scaling
         self.game_time = 0
         self.zombies_spawned = 0
-        
-        # Spawn edges (top, right, bottom, left)
-        self.spawn_margin = 50
+        self.hordes_sent = 0
     
     def update(self, dt):
         """Update spawn timer and increase difficulty over time."""
@@ -43,29 +49,40 @@ class ZombieSpawner:
             return True
         return False
     
-    def spawn_zombie(self):
-        """Spawn a zombie at a random edge position."""
-        # Choose random edge
-        edge = random.choice(['top', 'right', 'bottom', 'left'])
-        
-        if edge == 'top':
-            x = random.randint(0, self.screen_width)
-            y = -self.spawn_margin
-        elif edge == 'right':
-            x = self.screen_width + self.spawn_margin
-            y = random.randint(0, self.screen_height)
-        elif edge == 'bottom':
-            x = random.randint(0, self.screen_width)
-            y = self.screen_height + self.spawn_margin
-        else:  # left
-            x = -self.spawn_margin
-            y = random.randint(0, self.screen_height)
+    def horde_due(self):
+        """Size of the horde event due now, or 0 if there isn't one."""
+        if self.game_time < HORDE_EVENT_INTERVAL * (self.hordes_sent + 1):
+            return 0
+        size = HORDE_EVENT_SIZE + HORDE_EVENT_GROWTH * self.hordes_sent
+        self.hordes_sent += 1
+        return size
+    
+    def edge_points(self, count):
+        """count random spawn points just off screen, sampled in one batch.
         
-        # Determine zombie type based on game time
-        zombie_type = self.choose_zombie_type()
+        Each point is a distance along the screen's perimeter, so every
+        stretch of edge is equally likely.
+        """
+        width = self.screen_width
+        height = self.screen_height
+        margin = self.spawn_margin
+        perimeter = 2 * (width + height)
         
-        self.zombies_spawned += 1
-        return Zombie(x, y, zombie_type)
+        points = []
+        for t in [int(random.random() * perimeter) for _ in range(count)]:
+            if t < width:
+                points.append((t, -margin))                            # top
+            elif t < width + height:
+                points.append((width + margin, t - width))             # right
+            elif t < 2 * width + height:
+                points.append((t - width - height, height + margin))  # bottom
+            else:
+                points.append((-margin, t - 2 * width - height))       # left
+        return points
+    
+    def spawn_zombie(self):
+        """Spawn a zombie at a random edge position."""
+        return self.spawn_batch(1)[0]
     
     def choose_zombie_type(self):
         """Choose zombie type based on difficulty."""
@@ -88,7 +105,5 @@ class ZombieSpawner:
     
     def spawn_batch(self, count):
         """Spawn multiple zombies at once."""
-        zombies = []
-        for _ in range(count):
-            zombies.append(self.spawn_zombie())
-        return zombies
\ No newline at end of file
+        self.zombies_spawned += count
+        return [Zombie(x, y, self.choose_zombie_type()) for x, y in self.edge_points(count)]
\ No newline at end of file
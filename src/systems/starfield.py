@@ -0,0 +1,76 @@
+"""
+Starfield - parallax background drawn from pre-rendered, tiling star layers
+"""
+import random
+import pygame
+from config import *
+
+
+# The sky drifts up and to the left; y moves at this fraction of x
+DRIFT_SLOPE = 0.4
+
+
+class Starfield:
+    """Layers of stars that scroll at different rates behind everything else.
+
+    Each layer is one pre-rendered tile of stars that wraps seamlessly, so
+    drawing a layer is just a handful of tile blits at its scroll offset.
+    The back layer is opaque and replaces the background fill.
+    """
+
+    KEY = (0, 0, 0)  # transparent color of the front layers
+
+    def __init__(self, width, height, layers=STARFIELD_LAYERS,
+                 tile_size=STARFIELD_TILE, seed=7):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.scroll = 0.0  # seconds of drift so far
+
+        # Own generator: the same sky every run, and the game's RNG is untouched
+        rng = random.Random(seed)
+        self.layers = []  # (tile, parallax depth, drift speed)
+        for index, (depth, drift, count, color, max_size) in enumerate(layers):
+            tile = self.render_tile(rng, count, color, max_size, opaque=index == 0)
+            self.layers.append((tile, depth, drift))
+
+    def render_tile(self, rng, count, color, max_size, opaque):
+        """One square of sky whose stars wrap around its edges."""
+        size = self.tile_size
+        tile = pygame.Surface((size, size))
+        tile.fill(COLOR_BG if opaque else self.KEY)
+
+        for _ in range(count):
+            x = rng.randrange(size)
+            y = rng.randrange(size)
+            radius = rng.randint(1, max_size)
+            shade = rng.uniform(0.5, 1.0)
+            star_color = tuple(int(c * shade) for c in color)
+
+            # Stars on an edge continue on the opposite side, so tiles join up
+            for offset_x in (-size, 0, size):
+                for offset_y in (-size, 0, size):
+                    pygame.draw.circle(tile, star_color,
+                                       (x + offset_x, y + offset_y), radius)
+
+        if not opaque:
+            tile.set_colorkey(self.KEY, pygame.RLEACCEL)
+        return tile
+
+    def update(self, dt):
+        """Let the sky drift."""
+        self.scroll += dt
+
+    def draw(self, surface, focus_x=0, focus_y=0, max_layers=None):
+        """Draw the layers, shifted by depth times how far the view moved.
+
+        focus_x, focus_y is the point the view follows, relative to the
+        screen center. max_layers drops the front layers first.
+        """
+        size = self.tile_size
+        for tile, depth, drift in self.layers[:max_layers]:
+            offset_x = int(self.scroll * drift + focus_x * depth) % size
+            offset_y = int(self.scroll * drift * DRIFT_SLOPE + focus_y * depth) % size
+            for x in range(-offset_x, self.width, size):
+                for y in range(-offset_y, self.height, size):
+                    surface.blit(tile, (x, y))
@@ -0,0 +1,35 @@
+"""
+Startup profile - time to first frame, broken down by phase
+"""
+import time
+
+
+class StartupProfile:
+    """Records how long each startup phase took, in the order they ran."""
+
+    def __init__(self, begin=None):
+        self.begin = time.perf_counter() if begin is None else begin
+        self.last = self.begin
+        self.phases = []  # (phase name, milliseconds)
+
+    def mark(self, phase, now=None):
+        """End the phase that has been running since the previous mark.
+
+        now is a perf_counter() reading, for phases timed before the
+        profile existed.
+        """
+        if now is None:
+            now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    @property
+    def total_ms(self):
+        return (self.last - self.begin) * 1000
+
+    def report(self):
+        """Print each phase and the total time to first frame."""
+        print("Startup profile:")
+        for phase, ms in self.phases:
+            print(f"  {phase:<16}{ms:8.1f} ms")
+        print(f"  {'first frame at':<16}{self.total_ms:8.1f} ms")
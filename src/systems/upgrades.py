@@ -1,117 +1,88 @@
 """
 Upgrade definitions - all available upgrades in the game
+
+The upgrades themselves live in assets/data/upgrades.json and are compiled
+once by content.py.
 """
+from content import get_content
+from weapons import weapon_class
 
 
 def get_all_upgrades():
     """Return list of all possible upgrades."""
-    return [
-        # Weapon Upgrades
-        {
-            'type': 'weapon_upgrade',
-            'weapon': 'AutoGun',
-            'name': 'Gun Upgrade',
-            'icon': '🔫',
-            'description': 'Upgrade your Auto Gun. Increases fire rate or adds more bullets!'
-        },
-        {
-            'type': 'weapon_upgrade',
-            'weapon': 'OrbitingDisc',
-            'name': 'Disc Upgrade',
-            'icon': '⚔️',
-            'description': 'Upgrade your Orbiting Disc. Adds more discs or increases damage!'
-        },
-        
-        # Stat Boosts
-        {
-            'type': 'stat_boost',
-            'stat': 'max_health',
-            'value': 20,
-            'name': 'Max Health +20',
-            'icon': '❤️',
-            'description': 'Increase maximum health by 20. Also fully heals you!'
-        },
-        {
-            'type': 'stat_boost',
-            'stat': 'max_health',
-            'value': 50,
-            'name': 'Max Health +50',
-            'icon': '💚',
-            'description': 'Massive health boost! Gain 50 max HP and full heal!'
-        },
-        {
-            'type': 'stat_boost',
-            'stat': 'speed',
-            'value': 50,
-            'name': 'Movement Speed',
-            'icon': '⚡',
-            'description': 'Move 50 units faster. Dodge zombies more easily!'
-        },
-        {
-            'type': 'stat_boost',
-            'stat': 'speed',
-            'value': 100,
-            'name': 'Super Speed',
-            'icon': '💨',
-            'description': 'Major speed boost! Move 100 units faster!'
-        },
-        {
-            'type': 'stat_boost',
-            'stat': 'pickup_radius',
-            'value': 40,
-            'name': 'Magnet',
-            'icon': '🧲',
-            'description': 'Collect XP from further away. Increases pickup radius by 40!'
-        },
-        {
-            'type': 'stat_boost',
-            'stat': 'pickup_radius',
-            'value': 80,
-            'name': 'Super Magnet',
-            'icon': '🌟',
-            'description': 'Massive pickup range! Pull XP from across the screen!'
-        },
-        
-        # Healing
-        {
-            'type': 'stat_boost',
-            'stat': 'heal',
-            'value': 50,
-            'name': 'Health Potion',
-            'icon': '🍷',
-            'description': 'Restore 50 HP immediately. Great for emergencies!'
-        },
-        {
-            'type': 'stat_boost',
-            'stat': 'heal',
-            'value': 100,
-            'name': 'Full Heal',
-            'icon': '✨',
-            'description': 'Restore all health to maximum! Complete recovery!'
-        },
-    ]
+    return get_content().upgrades
 
 
 def get_available_upgrades(player, weapons):
     """Filter upgrades based on current game state."""
-    all_upgrades = get_all_upgrades()
+    owned = {weapon.kind for weapon in weapons}
     available = []
     
-    for upgrade in all_upgrades:
+    for upgrade in get_all_upgrades():
         # Always allow weapon upgrades if weapon exists
         if upgrade['type'] == 'weapon_upgrade':
-            weapon_name = upgrade['weapon']
-            has_weapon = any(w.__class__.__name__ == weapon_name for w in weapons)
-            if has_weapon:
+            if upgrade['weapon'] in owned:
                 available.append(upgrade)
         
-        # Allow stat boosts
-        elif upgrade['type'] == 'stat_boost':
-            # Don't offer full heal if already at max health
-            if upgrade['stat'] == 'heal':
-                if player.health < player.max_health:
-                    available.append(upgrade)
-            else:
+        # Only offer new weapons the player doesn't have yet
+        elif upgrade['type'] == 'new_weapon':
+            if upgrade['weapon'] not in owned:
+                available.append(upgrade)
+        
+        # Don't offer heals if already at max health
+        elif upgrade['stat'] == 'heal':
+            if player.health < player.max_health:
                 available.append(upgrade)
+        
+        # Allow stat boosts
+        else:
+            available.append(upgrade)
     
-    return available
\ No newline at end of file
+    return available
+
+
+def upgrade_weapon(upgrade, player, weapons):
+    """Upgrade an existing weapon."""
+    for weapon in weapons:
+        if weapon.kind == upgrade['weapon']:
+            weapon.upgrade()
+            break
+
+
+def add_weapon(upgrade, player, weapons):
+    """Give the player a new weapon."""
+    weapons.append(weapon_class(upgrade['weapon'])(player))
+
+
+def boost_max_health(upgrade, player, weapons):
+    player.max_health += upgrade['value']
+    player.health = player.max_health
+
+
+def boost_speed(upgrade, player, weapons):
+    player.speed += upgrade['value']
+
+
+def boost_pickup_radius(upgrade, player, weapons):
+    player.pickup_radius += upgrade['value']
+
+
+def heal(upgrade, player, weapons):
+    player.health = min(player.health + upgrade['value'], player.max_health)
+
+
+# Indexed by the 'handler' id compiled into each upgrade
+# (same order as content.UPGRADE_HANDLER_KEYS)
+UPGRADE_HANDLERS = (
+    upgrade_weapon,
+    add_weapon,
+    boost_max_health,
+    boost_speed,
+    boost_pickup_radius,
+    heal,
+)
+
+
+def apply_upgrade(upgrade, player, weapons):
+    """Apply a compiled upgrade."""
+    UPGRADE_HANDLERS[upgrade['handler']](upgrade, player, weapons)
@@ -0,0 +1,44 @@
+"""
+Zombie LOD - updates distant zombies less often to save AI time
+"""
+from config import *
+
+
+class ZombieLOD:
+    """Buckets zombies by distance off screen and time-slices the far buckets."""
+    
+    def __init__(self, buckets=ZOMBIE_LOD_BUCKETS, width=WIDTH, height=HEIGHT):
+        # (max distance outside the screen, update every N ticks), nearest first
+        self.buckets = [(max_dist * max_dist, every) for max_dist, every in buckets]
+        self.width = width
+        self.height = height
+        self.tick = 0
+        self.updated = 0  # zombies updated last tick (for profiling)
+    
+    def update(self, zombies, dt, player_pos):
+        """Update zombies on screen every tick and far ones round-robin."""
+        self.tick += 1
+        self.updated = 0
+        width = self.width
+        height = self.height
+        
+        for zombie in zombies:
+            zombie.pending_dt += dt
+            
+            x, y = zombie.rect.center
+            dx = -x if x < 0 else (x - width if x > width else 0)
+            dy = -y if y < 0 else (y - height if y > height else 0)
+            dist_sq = dx * dx + dy * dy
+            
+            every = self.buckets[-1][1]
+            for max_dist_sq, bucket_every in self.buckets:
+                if dist_sq <= max_dist_sq:
+                    every = bucket_every
+                    break
+            
+            # Each zombie keeps its own phase, so a bucket is updated an even
+            # slice at a time however the list is reordered
+            if (self.tick + zombie.lod_phase) % every == 0:
+                zombie.update(zombie.pending_dt, player_pos)
+                zombie.pending_dt = 0
+                self.updated += 1
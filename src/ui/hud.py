@@ -3,6 +3,7 @@ HUD - Heads-up display for game information
 """
 import pygame
 from config import *
+from fonts import get_font
 
 
 class HUD:
@@ -11,9 +12,9 @@ class HUD:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.SysFont(None, 36)
-        self.font_medium = pygame.font.SysFont(None, 28)
-        self.font_small = pygame.font.SysFont(None, 24)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(28)
+        self.font_small = get_font(24)
     
     def draw(self, surface, player, exp_system, game_time, kills):
         """Draw all HUD elements."""
@@ -107,7 +108,16 @@ class HUD:
         text_rect.center = (bar_x + bar_width // 2, bar_y + bar_height // 2)
         surface.blit(health_text, text_rect)
     
-    def draw_fps(self, surface, fps):
+    def draw_fps(self, surface, fps, quality=None, render_scale=1.0, jobs=None):
         """Draw FPS counter (for debugging)."""
-        fps_text = self.font_small.render(f"FPS: {int(fps)}", True, (150, 150, 150))
-        surface.blit(fps_text, (self.screen_width - 100, self.screen_height - 30))
\ No newline at end of file
+        label = f"FPS: {int(fps)}"
+        if quality:
+            label += f" ({quality})"
+        if render_scale < 1:
+            label += f" @{render_scale:.0%}"
+        if jobs and (jobs['depth'] or jobs['overruns']):
+            label += f" jobs {jobs['depth']}, {jobs['overruns']} over"
+        fps_text = self.font_small.render(label, True, (150, 150, 150))
+        fps_rect = fps_text.get_rect()
+        fps_rect.topright = (self.screen_width - 20, self.screen_height - 30)
+        surface.blit(fps_text, fps_rect)
\ No newline at end of file
@@ -3,18 +3,20 @@ Main Menu - Title screen with start button
 """
 import pygame
 from config import *
+from fonts import get_font
 
 
 class MainMenu:
     """Main menu / title screen."""
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, starfield):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_title = pygame.font.SysFont(None, 96)
-        self.font_large = pygame.font.SysFont(None, 48)
-        self.font_medium = pygame.font.SysFont(None, 36)
-        self.font_small = pygame.font.SysFont(None, 24)
+        self.starfield = starfield  # shared with gameplay
+        self.font_title = get_font(96)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(24)
         
         self.active = True
         
@@ -39,14 +41,7 @@ class MainMenu:
             return
         
         # Background
-        surface.fill(COLOR_BG)
-        
-        # Draw some decorative particles/stars
-        for i in range(50):
-            x = (i * 137) % self.screen_width
-            y = (i * 193) % self.screen_height
-            size = (i % 3) + 1
-            pygame.draw.circle(surface, (100, 100, 150), (x, y), size)
+        self.starfield.draw(surface)
         
         # Title
         title = self.font_title.render("SPACE ZOMBIE", True, (255, 100, 100))
@@ -4,6 +4,8 @@ Upgrade Menu - Shows upgrade choices when player levels up
 import pygame
 import random
 from config import *
+from fonts import get_font
+from systems.upgrades import apply_upgrade
 
 
 class UpgradeMenu:
@@ -12,9 +14,9 @@ class UpgradeMenu:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.SysFont(None, 48)
-        self.font_medium = pygame.font.SysFont(None, 32)
-        self.font_small = pygame.font.SysFont(None, 24)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
         
         self.active = False
         self.upgrade_options = []
@@ -64,34 +66,7 @@ class UpgradeMenu:
     
     def apply_upgrade(self, upgrade):
         """Apply the selected upgrade."""
-        upgrade_type = upgrade['type']
-        
-        if upgrade_type == 'weapon_upgrade':
-            # Upgrade existing weapon
-            weapon_name = upgrade['weapon']
-            for weapon in self.weapons:
-                if weapon.__class__.__name__ == weapon_name:
-                    weapon.upgrade()
-                    break
-        
-        elif upgrade_type == 'new_weapon':
-            # Add new weapon (we'll implement this next)
-            pass
-        
-        elif upgrade_type == 'stat_boost':
-            # Boost player stats
-            stat = upgrade['stat']
-            value = upgrade['value']
-            
-            if stat == 'max_health':
-                self.player.max_health += value
-                self.player.health = self.player.max_health
-            elif stat == 'speed':
-                self.player.speed += value
-            elif stat == 'pickup_radius':
-                self.player.pickup_radius += value
-            elif stat == 'heal':
-                self.player.health = min(self.player.health + value, self.player.max_health)
+        apply_upgrade(upgrade, self.player, self.weapons)
     
     def draw(self, surface):
         """Draw the upgrade menu."""
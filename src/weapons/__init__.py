@@ -1,4 +1,30 @@
-"""Weapon classes"""
+"""Weapon classes
+
+Weapon modules are imported the first time a weapon is asked for, so
+startup only pays for the weapons a run begins with.
+"""
+from importlib import import_module
 from .weapon_base import Weapon
-from .auto_gun import AutoGun
-from .orbiting_disc import OrbitingDisc
\ No newline at end of file
+
+# Weapon class names, as used in the data files and snapshots, by module
+WEAPON_MODULES = {
+    'AutoGun': 'auto_gun',
+    'OrbitingDisc': 'orbiting_disc',
+    'NovaAura': 'nova_aura',
+    'ShellLauncher': 'shell_launcher',
+    'ChainLightning': 'chain_lightning',
+    'HomingMissiles': 'homing_missiles',
+    'PiercingLaser': 'piercing_laser',
+}
+
+
+def weapon_class(name):
+    """The weapon class with this name, importing its module if needed."""
+    return getattr(import_module(f'.{WEAPON_MODULES[name]}', __name__), name)
+
+
+def __getattr__(name):
+    # Keeps `from weapons import NovaAura` working without eager imports
+    if name in WEAPON_MODULES:
+        return weapon_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,20 +10,18 @@ from config import *
 class AutoGun(Weapon):
     """Automatically shoots bullets at the nearest enemy."""
     
+    snapshot_fields = ('shoot_timer',)
+    
     def __init__(self, owner):
+        # Weapon stats (fire_rate, damage, bullet_count, pierce) come from
+        # the level table
         super().__init__(owner)
         
-        # Weapon stats
-        self.fire_rate = 3.0  # Shots per second
-        self.damage = BULLET_DAMAGE
-        self.bullet_count = 1  # How many bullets per shot
-        self.pierce = 0  # How many enemies bullet can pierce
-        
         # Internal state
         self.shoot_timer = 0
         self.shoot_cooldown = 1.0 / self.fire_rate
     
-    def update(self, dt, targets):
+    def update(self, dt, targets, grid=None, hits=None):
         """Update shooting logic."""
         self.shoot_timer += dt
         
@@ -66,7 +64,8 @@ class AutoGun(Weapon):
                 self.owner.rect.centery,
                 nearest.rect.centerx,
                 nearest.rect.centery,
-                damage=self.damage
+                damage=self.damage,
+                pierce=self.pierce
             )
             bullets.append(bullet)
         else:
@@ -93,7 +92,8 @@ class AutoGun(Weapon):
                     self.owner.rect.centery,
                     target_x,
                     target_y,
-                    damage=self.damage
+                    damage=self.damage,
+                    pierce=self.pierce
                 )
                 bullets.append(bullet)
         
@@ -101,18 +101,7 @@ class AutoGun(Weapon):
     
     def apply_upgrade(self):
         """Apply upgrades based on level."""
-        if self.level == 2:
-            self.fire_rate = 4.0  # Faster shooting
-        elif self.level == 3:
-            self.bullet_count = 2  # Double shot
-        elif self.level == 4:
-            self.fire_rate = 5.0  # Even faster
-        elif self.level == 5:
-            self.bullet_count = 3  # Triple shot
-        elif self.level == 6:
-            self.damage = BULLET_DAMAGE * 1.5  # More damage
-        elif self.level >= 7:
-            self.fire_rate = 6.0  # Max fire rate
+        super().apply_upgrade()
         
         # Update cooldown based on fire rate
         self.shoot_cooldown = 1.0 / self.fire_rate
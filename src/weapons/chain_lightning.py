@@ -0,0 +1,86 @@
+"""
+Chain Lightning - Strikes the nearest enemy and jumps between nearby ones
+"""
+import random
+import pygame
+from weapons.weapon_base import Weapon
+from config import *
+
+
+class ChainLightning(Weapon):
+    """A bolt that chains from enemy to enemy, losing power with each jump."""
+
+    snapshot_fields = ('strike_timer',)
+
+    def __init__(self, owner):
+        # Weapon stats (cooldown, damage, chain_count, chain_range, range,
+        # falloff) come from the level table
+        super().__init__(owner)
+
+        # Visual
+        self.color = (150, 220, 255)  # Pale blue
+        self.bolt_duration = 0.15
+
+        # Internal state
+        self.strike_timer = 0
+        self.bolts = []  # [points, time left] of recent strikes
+
+    def update(self, dt, targets, grid=None, hits=None):
+        """Strike when the cooldown is up."""
+        self.strike_timer += dt
+        if self.strike_timer >= self.cooldown:
+            if self.strike(self.target_grid(targets, grid), self.damage_buffer(hits)):
+                self.strike_timer = 0
+
+        for bolt in self.bolts:
+            bolt[1] -= dt
+        self.bolts = [bolt for bolt in self.bolts if bolt[1] > 0]
+
+        return []  # Lightning hits instantly
+
+    def strike(self, grid, hits):
+        """Hit the nearest enemy, then hop to the nearest one not yet hit."""
+        x, y = self.owner.rect.center
+        target = grid.nearest(x, y, self.range)
+        if target is None:
+            return False
+
+        hit = set()
+        points = [(x, y)]
+        damage = self.damage
+
+        while target is not None and len(hit) <= self.chain_count:
+            hit.add(target)
+            tx, ty = target.rect.center
+
+            # Jagged midpoint so the bolt reads as lightning
+            mid_x = (x + tx) / 2 + random.uniform(-10, 10)
+            mid_y = (y + ty) / 2 + random.uniform(-10, 10)
+            points.extend(((mid_x, mid_y), (tx, ty)))
+
+            hits.deal(target, damage, self)
+            damage *= self.falloff
+            x, y = tx, ty
+            target = grid.nearest(x, y, self.chain_range, exclude=hit)
+
+        self.bolts.append([points, self.bolt_duration])
+        return True
+
+    def draw(self, canvas, glow=True):
+        """Draw recent bolts."""
+        for points, _ in self.bolts:
+            if glow:
+                canvas.lines((60, 90, 160), False, points, 5)
+            canvas.lines(self.color, False, points, 2)
+
+    def get_info(self):
+        """Get weapon information."""
+        return {
+            'name': 'Chain Lightning',
+            'level': self.level,
+            'description': f'Bolt jumps {self.chain_count} time(s) every {self.cooldown:.1f}s',
+            'cooldown': self.cooldown,
+            'chain_count': self.chain_count,
+            'damage': self.damage,
+            'chain_range': self.chain_range
+        }
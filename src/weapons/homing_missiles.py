@@ -0,0 +1,186 @@
+"""
+Homing Missiles - Volleys of missiles that steer toward their targets
+"""
+import math
+from array import array
+import pygame
+from weapons.weapon_base import Weapon
+from config import *
+
+
+class HomingMissiles(Weapon):
+    """Fires missiles that lock on and turn toward targets at a limited rate.
+
+    Missiles are stored as parallel arrays (one slot per missile) and all of
+    them are steered in a single pass, so hundreds in flight stay cheap.
+    """
+
+    snapshot_fields = ('shoot_timer',)
+
+    def __init__(self, owner):
+        # Weapon stats (fire_rate, missile_count, damage, speed, turn_rate,
+        # lifetime, range) come from the level table
+        super().__init__(owner)
+
+        # Visual
+        self.color = (255, 90, 90)  # Red
+        self.missile_radius = 4
+        self.spread = math.radians(40)  # fan of a volley at launch
+
+        # Internal state
+        self.shoot_timer = 0
+        self.clear()
+
+    def clear(self):
+        """Remove every missile in flight."""
+        self.xs = array('d')
+        self.ys = array('d')
+        self.headings = array('d')  # radians
+        self.lives = array('d')     # seconds left before the missile fizzles
+        self.targets = []           # locked zombie per missile, or None
+        self.generations = []       # each target's generation when it was locked
+
+    def update(self, dt, targets, grid=None, hits=None):
+        """Launch a volley when ready and steer every missile."""
+        grid = self.target_grid(targets, grid)
+
+        self.shoot_timer += dt
+        if self.shoot_timer >= 1.0 / self.fire_rate:
+            if self.launch(grid):
+                self.shoot_timer = 0
+
+        if self.xs:
+            self.steer(dt, grid, self.damage_buffer(hits))
+
+        return []  # Missiles are tracked by the weapon itself
+
+    def launch(self, grid):
+        """Fan a volley out from the player, each missile locked to its own target."""
+        x, y = self.owner.rect.center
+        first = grid.nearest(x, y, self.range)
+        if first is None:
+            return False
+
+        aim = math.atan2(first.rect.centery - y, first.rect.centerx - x)
+        step = self.spread / max(1, self.missile_count - 1)
+        start = aim - self.spread / 2 if self.missile_count > 1 else aim
+
+        locked = {first}
+        target = first
+        for i in range(self.missile_count):
+            self.xs.append(x)
+            self.ys.append(y)
+            self.headings.append(start + i * step)
+            self.lives.append(self.lifetime)
+            self.targets.append(target)
+            self.generations.append(target.generation)
+
+            # Spread the volley over different zombies while there are any
+            target = grid.nearest(x, y, self.range, exclude=locked) or first
+            locked.add(target)
+        return True
+
+    def steer(self, dt, grid, hits):
+        """Turn, move and hit-test all missiles in one pass."""
+        xs, ys, headings, lives, targets, generations = (
+            self.xs, self.ys, self.headings, self.lives, self.targets, self.generations)
+        cos, sin, atan2 = math.cos, math.sin, math.atan2
+        pi, tau = math.pi, math.tau
+        max_turn = self.turn_rate * dt
+        step = self.speed * dt
+        damage = self.damage
+        radius = self.missile_radius
+        reacquire_range = self.range
+        expired = False
+
+        for i in range(len(xs)):
+            x = xs[i]
+            y = ys[i]
+            heading = headings[i]
+
+            # Lost the target (dead, or dead and respawned from the pool):
+            # lock onto whatever is closest now
+            target = targets[i]
+            if target is None or not target.alive or target.generation != generations[i]:
+                target = targets[i] = grid.nearest(x, y, reacquire_range)
+                generations[i] = -1 if target is None else target.generation
+
+            if target is not None:
+                tx, ty = target.rect.center
+                turn = (atan2(ty - y, tx - x) - heading + pi) % tau - pi
+                if turn > max_turn:
+                    turn = max_turn
+                elif turn < -max_turn:
+                    turn = -max_turn
+                heading += turn
+                headings[i] = heading
+
+            x += cos(heading) * step
+            y += sin(heading) * step
+            xs[i] = x
+            ys[i] = y
+            lives[i] -= dt
+
+            if target is not None:
+                dx = target.rect.centerx - x
+                dy = target.rect.centery - y
+                reach = radius + target.rect.width / 2
+                if dx * dx + dy * dy <= reach * reach:
+                    hits.deal(target, damage, self)
+                    lives[i] = 0
+
+            if lives[i] <= 0:
+                expired = True
+
+        if expired:
+            self.compact()
+
+    def compact(self):
+        """Drop spent missiles from the arrays."""
+        keep = [i for i, life in enumerate(self.lives) if life > 0]
+        self.xs = array('d', [self.xs[i] for i in keep])
+        self.ys = array('d', [self.ys[i] for i in keep])
+        self.headings = array('d', [self.headings[i] for i in keep])
+        self.lives = array('d', [self.lives[i] for i in keep])
+        self.targets = [self.targets[i] for i in keep]
+        self.generations = [self.generations[i] for i in keep]
+
+    def pack_state(self, zombie_index):
+        """Each missile as x, y, heading, life and its target's index (-1 for none)."""
+        return [value for x, y, heading, life, target, generation in zip(
+                    self.xs, self.ys, self.headings, self.lives, self.targets,
+                    self.generations)
+                for value in (x, y, heading, life,
+                              zombie_index.get(target, -1)
+                              if target is not None and target.generation == generation
+                              else -1)]
+
+    def restore_state(self, values, zombies):
+        self.xs = array('d', values[0::5])
+        self.ys = array('d', values[1::5])
+        self.headings = array('d', values[2::5])
+        self.lives = array('d', values[3::5])
+        self.targets = [zombies[int(i)] if i >= 0 else None for i in values[4::5]]
+        self.generations = [-1 if target is None else target.generation
+                            for target in self.targets]
+
+    def draw(self, canvas, glow=True):
+        """Draw each missile as a short streak along its heading."""
+        length = 10
+        for x, y, heading in zip(self.xs, self.ys, self.headings):
+            tail = (x - math.cos(heading) * length, y - math.sin(heading) * length)
+            if glow:
+                canvas.line((255, 200, 120), tail, (x, y), 5)
+            canvas.line(self.color, tail, (x, y), 2)
+
+    def get_info(self):
+        """Get weapon information."""
+        return {
+            'name': 'Homing Missiles',
+            'level': self.level,
+            'description': f'Fires {self.missile_count} homing missile(s) at {self.fire_rate:.1f}/sec',
+            'fire_rate': self.fire_rate,
+            'missile_count': self.missile_count,
+            'damage': self.damage,
+            'turn_rate': self.turn_rate
+        }
@@ -0,0 +1,68 @@
+"""
+Nova Aura - Pulses damage to every enemy near the player
+"""
+import pygame
+from weapons.weapon_base import Weapon
+from config import *
+
+
+class NovaAura(Weapon):
+    """Periodically blasts all enemies within a radius around the player."""
+
+    snapshot_fields = ('pulse_timer', 'ring_time')
+
+    def __init__(self, owner):
+        # Weapon stats (radius, damage, pulse_interval) come from the level table
+        super().__init__(owner)
+
+        # Visual
+        self.color = (180, 120, 255)  # Violet
+        self.ring_duration = 0.3
+
+        # Internal state
+        self.pulse_timer = 0
+        self.ring_time = 0  # time left on the expanding ring
+
+    def update(self, dt, targets, grid=None, hits=None):
+        """Pulse when the timer is up."""
+        self.pulse_timer += dt
+        self.ring_time = max(0, self.ring_time - dt)
+
+        if self.pulse_timer >= self.pulse_interval:
+            self.pulse_timer = 0
+            self.pulse(self.target_grid(targets, grid), self.damage_buffer(hits))
+
+        return []  # Auras don't create projectiles
+
+    def pulse(self, grid, hits):
+        """Damage everything inside the aura."""
+        x, y = self.owner.rect.center
+        for target in grid.query_radius(x, y, self.radius):
+            hits.deal(target, self.damage, self)
+        self.ring_time = self.ring_duration
+
+    def draw(self, canvas, glow=True):
+        """Draw the aura outline and the ring of the last pulse."""
+        center = self.owner.rect.center
+
+        # Faint outline of the aura's reach
+        if glow:
+            canvas.circle(tuple(c // 4 for c in self.color),
+                        center, int(self.radius), 1)
+
+        # Ring expanding out to the radius right after a pulse
+        if self.ring_time > 0:
+            progress = 1 - self.ring_time / self.ring_duration
+            canvas.circle(self.color, center,
+                        max(1, int(self.radius * progress)), 3)
+
+    def get_info(self):
+        """Get weapon information."""
+        return {
+            'name': 'Nova Aura',
+            'level': self.level,
+            'description': f'Pulses {self.damage:.0f} damage every {self.pulse_interval:.1f}s',
+            'radius': self.radius,
+            'damage': self.damage,
+            'pulse_interval': self.pulse_interval
+        }
@@ -4,50 +4,53 @@ Orbiting Disc - Rotating blade that orbits around the player
 import pygame
 import math
 from weapons.weapon_base import Weapon
+from systems.collision import swept_hits
+from systems.jobs import get_scheduler, PRIORITY_NORMAL
 from config import *
 
 
 class OrbitingDisc(Weapon):
     """A disc that rotates around the player and damages enemies on contact."""
     
+    snapshot_fields = ('angle', 'clock')
+    
     def __init__(self, owner):
+        # Weapon stats (disc_count, radius, rotation_speed, damage, size)
+        # come from the level table
         super().__init__(owner)
         
-        # Weapon stats
-        self.disc_count = 1  # Number of discs
-        self.radius = DISC_RADIUS  # Distance from player
-        self.rotation_speed = DISC_ROTATION_SPEED  # Degrees per second
-        self.damage = DISC_DAMAGE  # Damage per hit
-        self.size = 12  # Disc visual size
-        
         # Visual
         self.color = (100, 200, 255)  # Cyan color
         
         # Internal state
         self.angle = 0  # Current rotation angle in degrees
-        self.hit_cooldown = {}  # Track when we last hit each enemy
+        self.hit_cooldown = {}  # (enemy id, generation) -> clock time it can be hit again
         self.hit_delay = 0.5  # Seconds between hits on same enemy
+        self.clock = 0.0
     
-    def update(self, dt, targets):
+    def update(self, dt, targets, grid=None, hits=None):
         """Update disc rotation and check for collisions."""
         # Rotate the disc
         self.angle += self.rotation_speed * dt
         self.angle %= 360  # Keep angle between 0-360
         
-        # Check collisions with targets
-        self.check_collisions(targets, dt)
+        # Check collisions with targets along the arc each disc swept
+        self.check_collisions(self.target_grid(targets, grid), dt,
+                              self.damage_buffer(hits))
         
         return []  # Discs don't create projectiles
     
-    def get_disc_positions(self):
-        """Calculate the position of each disc."""
+    def get_disc_positions(self, angle=None):
+        """Calculate the position of each disc (at the current angle by default)."""
         positions = []
+        if angle is None:
+            angle = self.angle
         
         angle_offset = 360 / self.disc_count  # Evenly space discs around player
         
         for i in range(self.disc_count):
             # Calculate angle for this disc
-            disc_angle = self.angle + (i * angle_offset)
+            disc_angle = angle + (i * angle_offset)
             disc_angle_rad = math.radians(disc_angle)
             
             # Calculate position
@@ -58,73 +61,73 @@ class OrbitingDisc(Weapon):
         
         return positions
     
-    def check_collisions(self, targets, dt):
-        """Check if any disc hit any target."""
-        disc_positions = self.get_disc_positions()
+    def check_collisions(self, grid, dt, hits):
+        """Check if any disc hit any target during this frame's rotation."""
+        # Cooldowns are expiry times, so nothing needs ticking down; the
+        # expired ones are swept out later by a deferred job
+        self.clock += dt
+        clock = self.clock
+        if len(self.hit_cooldown) > 64:
+            get_scheduler().schedule(self.prune_cooldowns, PRIORITY_NORMAL,
+                                     name=('prune', id(self)))
         
-        for target in targets:
-            if not target.alive:
-                continue
+        # Sweep each disc along its arc as a few chords, so a long frame
+        # can't carry a disc past a zombie
+        swept = abs(self.rotation_speed * dt)
+        steps = max(1, math.ceil(swept / 20))
+        previous = self.get_disc_positions(self.angle - self.rotation_speed * dt)
+        for step in range(1, steps + 1):
+            current = self.get_disc_positions(
+                self.angle - self.rotation_speed * dt * (1 - step / steps))
             
-            # Check cooldown for this target
-            target_id = id(target)
-            if target_id in self.hit_cooldown:
-                self.hit_cooldown[target_id] -= dt
-                if self.hit_cooldown[target_id] > 0:
-                    continue  # Still on cooldown
-            
-            # Check collision with each disc
-            for disc_x, disc_y in disc_positions:
-                # Simple circle-rect collision
-                closest_x = max(target.rect.left, min(disc_x, target.rect.right))
-                closest_y = max(target.rect.top, min(disc_y, target.rect.bottom))
-                
-                distance = math.hypot(disc_x - closest_x, disc_y - closest_y)
-                
-                if distance < self.size:
+            for (x0, y0), (x1, y1) in zip(previous, current):
+                for _, target in swept_hits(grid, x0, y0, x1, y1, self.size):
+                    # Check cooldown for this target
+                    target_id = (id(target), target.generation)
+                    if self.hit_cooldown.get(target_id, 0) > clock:
+                        continue  # Still on cooldown
+                    
                     # Hit!
-                    target.take_damage(self.damage)
-                    self.hit_cooldown[target_id] = self.hit_delay
-                    break  # Only hit once per frame
-        
-        # Clean up old cooldowns for dead enemies
-        self.hit_cooldown = {k: v for k, v in self.hit_cooldown.items() if v > 0}
+                    hits.deal(target, self.damage, self)
+                    self.hit_cooldown[target_id] = clock + self.hit_delay
+            previous = current
     
-    def draw(self, surface):
+    def prune_cooldowns(self):
+        """Forget cooldowns that have run out."""
+        clock = self.clock
+        self.hit_cooldown = {k: v for k, v in self.hit_cooldown.items() if v > clock}
+    
+    def pack_state(self, zombie_index):
+        """Each live cooldown as the zombie's index and the clock time it runs out."""
+        by_id = {(id(zombie), zombie.generation): i for zombie, i in zombie_index.items()}
+        clock = self.clock
+        return [value for target_id, until in self.hit_cooldown.items()
+                if until > clock and target_id in by_id
+                for value in (by_id[target_id], until)]
+    
+    def restore_state(self, values, zombies):
+        self.hit_cooldown = {(id(zombies[int(i)]), zombies[int(i)].generation): until
+                             for i, until in zip(values[0::2], values[1::2])}
+    
+    def draw(self, canvas, glow=True):
         """Draw the rotating discs."""
         disc_positions = self.get_disc_positions()
         
         for disc_x, disc_y in disc_positions:
             # Draw outer glow
-            glow_color = tuple(min(255, c + 50) for c in self.color)
-            pygame.draw.circle(surface, glow_color, 
-                             (int(disc_x), int(disc_y)), self.size + 3)
+            if glow:
+                glow_color = tuple(min(255, c + 50) for c in self.color)
+                canvas.circle(glow_color, 
+                            (int(disc_x), int(disc_y)), self.size + 3)
             
             # Draw main disc
-            pygame.draw.circle(surface, self.color, 
-                             (int(disc_x), int(disc_y)), self.size)
+            canvas.circle(self.color, 
+                        (int(disc_x), int(disc_y)), self.size)
             
             # Draw inner core (darker)
             core_color = tuple(c // 2 for c in self.color)
-            pygame.draw.circle(surface, core_color, 
-                             (int(disc_x), int(disc_y)), self.size // 2)
-    
-    def apply_upgrade(self):
-        """Apply upgrades based on level."""
-        if self.level == 2:
-            self.disc_count = 2  # Add second disc
-        elif self.level == 3:
-            self.rotation_speed = DISC_ROTATION_SPEED * 1.3  # Faster rotation
-        elif self.level == 4:
-            self.disc_count = 3  # Add third disc
-        elif self.level == 5:
-            self.radius = DISC_RADIUS * 1.2  # Larger orbit
-        elif self.level == 6:
-            self.disc_count = 4  # Add fourth disc
-        elif self.level == 7:
-            self.damage = DISC_DAMAGE * 1.5  # More damage
-        elif self.level >= 8:
-            self.size = 16  # Bigger discs
+            canvas.circle(core_color, 
+                        (int(disc_x), int(disc_y)), self.size // 2)
     
     def get_info(self):
         """Get weapon information."""
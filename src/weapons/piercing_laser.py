@@ -0,0 +1,89 @@
+"""
+Piercing Laser - Instant beam that burns through a line of enemies
+"""
+import math
+import pygame
+from weapons.weapon_base import Weapon
+from config import *
+
+
+class PiercingLaser(Weapon):
+    """Fires a beam at the nearest enemy that damages everything along it."""
+
+    snapshot_fields = ('fire_timer',)
+
+    def __init__(self, owner):
+        # Weapon stats (cooldown, damage, length, width, max_pierce, falloff)
+        # come from the level table
+        super().__init__(owner)
+
+        # Visual
+        self.color = (255, 60, 200)  # Magenta
+        self.beam_duration = 0.12
+
+        # Internal state
+        self.fire_timer = 0
+        self.beam = None  # (start, end, time left) of the last shot
+
+    def update(self, dt, targets, grid=None, hits=None):
+        """Fire when the cooldown is up."""
+        self.fire_timer += dt
+        if self.fire_timer >= self.cooldown:
+            if self.fire(self.target_grid(targets, grid), self.damage_buffer(hits)):
+                self.fire_timer = 0
+
+        if self.beam:
+            start, end, time_left = self.beam
+            time_left -= dt
+            self.beam = (start, end, time_left) if time_left > 0 else None
+
+        return []  # The beam hits instantly
+
+    def fire(self, grid, hits):
+        """Burn through everything on the line toward the nearest enemy."""
+        x, y = self.owner.rect.center
+        target = grid.nearest(x, y, self.length)
+        if target is None:
+            return False
+
+        dx = target.rect.centerx - x
+        dy = target.rect.centery - y
+        distance = math.hypot(dx, dy) or 1
+        dir_x, dir_y = dx / distance, dy / distance
+
+        # Each enemy the beam passes through weakens it
+        reach = self.length
+        damage = self.damage
+        in_beam = grid.query_ray(x, y, dir_x, dir_y, self.length, self.width)
+        for pierced, (along, zombie) in enumerate(in_beam):
+            if pierced >= self.max_pierce:
+                reach = along  # Out of pierce: the beam ends at this enemy
+                break
+            hits.deal(zombie, damage, self)
+            damage *= self.falloff
+
+        end = (x + dir_x * reach, y + dir_y * reach)
+        self.beam = ((x, y), end, self.beam_duration)
+        return True
+
+    def draw(self, canvas, glow=True):
+        """Draw the beam of the last shot."""
+        if not self.beam:
+            return
+        start, end, time_left = self.beam
+        width = max(1, int(self.width * time_left / self.beam_duration))
+        if glow:
+            canvas.line((120, 30, 100), start, end, width + 6)
+        canvas.line(self.color, start, end, width)
+
+    def get_info(self):
+        """Get weapon information."""
+        return {
+            'name': 'Piercing Laser',
+            'level': self.level,
+            'description': f'Beam pierces up to {self.max_pierce} enemies every {self.cooldown:.1f}s',
+            'cooldown': self.cooldown,
+            'damage': self.damage,
+            'width': self.width,
+            'max_pierce': self.max_pierce
+        }
@@ -0,0 +1,134 @@
+"""
+Shell Launcher - Lobs explosive shells that damage everything in a splash radius
+"""
+import math
+import pygame
+from weapons.weapon_base import Weapon
+from config import *
+
+
+class Shell:
+    """An explosive shell in flight."""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'remaining')
+
+    def __init__(self, x, y, vx, vy, remaining):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.remaining = remaining  # distance left before it bursts on its own
+
+
+class ShellLauncher(Weapon):
+    """Fires shells at the nearest enemies that burst on impact."""
+
+    snapshot_fields = ('shoot_timer',)
+
+    def __init__(self, owner):
+        # Weapon stats (fire_rate, damage, splash_radius, shell_speed, range,
+        # shell_count) come from the level table
+        super().__init__(owner)
+
+        # Visual
+        self.color = (255, 140, 40)  # Orange
+        self.shell_radius = 6
+        self.blast_duration = 0.25
+
+        # Internal state
+        self.shoot_timer = 0
+        self.shells = []
+        self.blasts = []  # [x, y, time left] of recent explosions
+
+    def update(self, dt, targets, grid=None, hits=None):
+        """Fire new shells and move the ones in flight."""
+        grid = self.target_grid(targets, grid)
+        hits = self.damage_buffer(hits)
+
+        self.shoot_timer += dt
+        if self.shoot_timer >= 1.0 / self.fire_rate:
+            if self.fire(grid):
+                self.shoot_timer = 0
+
+        for shell in self.shells:
+            step = self.shell_speed * dt
+            shell.x += shell.vx * step
+            shell.y += shell.vy * step
+            shell.remaining -= step
+
+            # Burst on contact or once it reaches where the target was
+            if shell.remaining <= 0 or grid.query_radius(shell.x, shell.y, self.shell_radius):
+                self.explode(shell, grid, hits)
+        self.shells = [shell for shell in self.shells if shell.remaining > 0]
+
+        for blast in self.blasts:
+            blast[2] -= dt
+        self.blasts = [blast for blast in self.blasts if blast[2] > 0]
+
+        return []  # Shells are tracked by the launcher itself
+
+    def fire(self, grid):
+        """Aim a shell at each of the nearest enemies in range."""
+        x, y = self.owner.rect.center
+        aimed = set()
+
+        for _ in range(self.shell_count):
+            target = grid.nearest(x, y, self.range, exclude=aimed)
+            if target is None:
+                break
+            aimed.add(target)
+
+            dx = target.rect.centerx - x
+            dy = target.rect.centery - y
+            distance = math.hypot(dx, dy)
+            if distance == 0:
+                dx, distance = 1, 1
+            self.shells.append(Shell(x, y, dx / distance, dy / distance, distance))
+
+        return bool(aimed)
+
+    def explode(self, shell, grid, hits):
+        """Damage everything in the splash radius."""
+        for target in grid.query_radius(shell.x, shell.y, self.splash_radius):
+            hits.deal(target, self.damage, self)
+        shell.remaining = 0
+        self.blasts.append([shell.x, shell.y, self.blast_duration])
+
+    def pack_state(self, zombie_index):
+        """The shell count, each shell's x, y, vx, vy, remaining, then each blast."""
+        return [len(self.shells),
+                *[value for s in self.shells for value in (s.x, s.y, s.vx, s.vy, s.remaining)],
+                *[value for blast in self.blasts for value in blast]]
+
+    def restore_state(self, values, zombies):
+        if not values:
+            return
+        end = 1 + int(values[0]) * 5
+        shells = values[1:end]
+        blasts = values[end:]
+        self.shells = [Shell(*shells[i:i + 5]) for i in range(0, len(shells), 5)]
+        self.blasts = [list(blasts[i:i + 3]) for i in range(0, len(blasts), 3)]
+
+    def draw(self, canvas, glow=True):
+        """Draw shells in flight and fading explosions."""
+        for shell in self.shells:
+            pos = (int(shell.x), int(shell.y))
+            if glow:
+                canvas.circle((255, 200, 120), pos, self.shell_radius + 2)
+            canvas.circle(self.color, pos, self.shell_radius)
+
+        for x, y, time_left in self.blasts:
+            progress = 1 - time_left / self.blast_duration
+            canvas.circle(self.color, (int(x), int(y)),
+                        max(1, int(self.splash_radius * progress)), 2)
+
+    def get_info(self):
+        """Get weapon information."""
+        return {
+            'name': 'Shell Launcher',
+            'level': self.level,
+            'description': f'Fires {self.shell_count} shell(s) with a {self.splash_radius:.0f}px blast',
+            'fire_rate': self.fire_rate,
+            'shell_count': self.shell_count,
+            'damage': self.damage,
+            'splash_radius': self.splash_radius
+        }
@@ -1,9 +1,15 @@
 # Base weapons class
 import pygame
+from content import get_content
+from systems.spatial_grid import SpatialGrid
+from systems.damage import DamageBuffer
 
 
 class Weapon:
     
+    # Float attributes saved in snapshots besides the level
+    snapshot_fields = ()
+    
     def __init__(self, owner):
         """
         initialize weapon.
@@ -12,20 +18,55 @@ class Weapon:
         self.level = 1
         self.enabled = True
         
-    def update(self, dt, targets):
+        # Stats for every level, compiled from assets/data/weapons.json
+        self.kind = self.__class__.__name__
+        self.level_table = get_content().weapons.get(self.kind, ())
+        self.apply_level_stats()
+        
+    def update(self, dt, targets, grid=None, hits=None):
         """
         Update weapon logic.
         
         Args:
             dt: Delta time in seconds
             targets: List of potential targets (enemies)
+            grid: SpatialGrid over the targets for range queries
+            hits: DamageBuffer that direct hits are recorded in
         
         Returns:
             List of projectiles/effects created this frame
         """
         raise NotImplementedError("Subclasses must implement update()")
     
-    def draw(self, surface):
+    @staticmethod
+    def target_grid(targets, grid):
+        """Use the caller's grid, or build one over the targets."""
+        if grid is None:
+            grid = SpatialGrid()
+            grid.update(targets)
+        return grid
+    
+    @staticmethod
+    def damage_buffer(hits):
+        """Use the caller's damage buffer, or one that applies hits right away."""
+        if hits is None:
+            hits = DamageBuffer(immediate=True)
+        return hits
+    
+    def pack_state(self, zombie_index):
+        """
+        Flat float values for anything in flight, for a snapshot.
+        
+        Args:
+            zombie_index: dict of zombie -> its index in the game's zombie list
+        """
+        return []
+    
+    def restore_state(self, values, zombies):
+        """Load values written by pack_state(), with zombies already restored."""
+        pass
+    
+    def draw(self, canvas, glow=True):
         """Draw the weapon (if it has a visual component)."""
         pass
     
@@ -34,9 +75,16 @@ class Weapon:
         self.level += 1
         self.apply_upgrade()
     
+    def apply_level_stats(self):
+        """Copy this level's stats from the level table onto the weapon."""
+        if self.level_table:
+            stats = self.level_table[min(self.level, len(self.level_table)) - 1]
+            for name, value in stats.items():
+                setattr(self, name, value)
+    
     def apply_upgrade(self):
         """Apply level-specific upgrades. Override in subclasses."""
-        pass
+        self.apply_level_stats()
     
     def get_info(self):
         """Get weapon information for UI display."""